@@ -4,12 +4,57 @@ import network
 import requests
 import uasyncio
 import aiohttp
+import os
 
 from machine import UART
-from utime import sleep, localtime, time, mktime
+from struct import pack, pack_into, unpack_from
+from utime import sleep, localtime, time, mktime, ticks_ms, ticks_add, ticks_diff
+from tz import UTC, days_since_2000
+from ublox import CFG_RAM_ACKAIDING
+from gnssstream import find_ubx_header
 
 from credentials import *
 
+# Bytes of the AssistNow response read at a time
+DOWNLOAD_CHUNK = 512
+
+# Validated AssistNow messages kept on flash, and the index of them
+ASSIST_CACHE = 'mga'
+ASSIST_INDEX = 'mga.idx'
+
+# How long cached aiding data stays useful in seconds, by (MGA message id << 8) | payload type (the first
+# payload byte). Ephemerides last hours, almanacs weeks. Anything not listed, the MGA-INI time and position
+# messages in particular, isn't cached: replayed later it would be out of date
+MGA_VALIDITY = {
+    0x0001: 4 * 3600,     # MGA-GPS-EPH
+    0x0002: 14 * 86400,   # MGA-GPS-ALM
+    0x0004: 86400,        # MGA-GPS-HEALTH
+    0x0005: 7 * 86400,    # MGA-GPS-UTC
+    0x0006: 86400,        # MGA-GPS-IONO
+    0x0201: 4 * 3600,     # MGA-GAL-EPH
+    0x0202: 14 * 86400,   # MGA-GAL-ALM
+    0x0203: 7 * 86400,    # MGA-GAL-TIMEOFFSET
+    0x0205: 7 * 86400,    # MGA-GAL-UTC
+    0x0301: 4 * 3600,     # MGA-BDS-EPH
+    0x0302: 14 * 86400,   # MGA-BDS-ALM
+    0x0304: 86400,        # MGA-BDS-HEALTH
+    0x0305: 7 * 86400,    # MGA-BDS-UTC
+    0x0306: 86400,        # MGA-BDS-IONO
+    0x0501: 4 * 3600,     # MGA-QZSS-EPH
+    0x0502: 14 * 86400,   # MGA-QZSS-ALM
+    0x0504: 86400,        # MGA-QZSS-HEALTH
+    0x0601: 3600,         # MGA-GLO-EPH, valid for a much shorter span
+    0x0602: 14 * 86400,   # MGA-GLO-ALM
+    0x0603: 7 * 86400,    # MGA-GLO-TIMEOFFSET
+}
+_MGA_INI = 0x40
+
+# AssistNow Offline: MGA-ANO records for the weeks ahead, kept on flash and indexed by day and GNSS
+ANO_URL = f'https://AssistNow.services.u-blox.com/GetAssistNowOfflineData.ashx?chipcode={CHIPCODE}&gnss=gps,gal&period=5&resolution=1'
+ANO_STORE = 'ano'
+ANO_INDEX = 'ano.idx'
+ANO_REFRESH_DAYS = 7  # download again when the store runs out within this many days
+
 def ubx_chksum(arr): # ubx checksum from a byte array
     ck_a, ck_b = 0, 0
     
@@ -39,6 +84,11 @@ def ubx_mga_ini_utc(rtc): # get ubx time init msg
     
     return msg
 
+def _read_e7(text): # cached coordinate as 1e-7 deg, older caches hold float degrees
+    if '.' in text:
+        return int(float(text) * 1e7)
+    return int(text)
+
 def ubx_mga_ini_pos(): # get initial position estimate message
     lines = []
     
@@ -46,10 +96,10 @@ def ubx_mga_ini_pos(): # get initial position estimate message
         for line in f:
             lines += [line.strip()]
             
-    lat = int(float(lines[0]) * 1e7).to_bytes(4, 'little', True)
-    lon = int(float(lines[1]) * 1e7).to_bytes(4, 'little', True)
-    alt = int(float(lines[2]) * 1e2).to_bytes(4, 'little', True)
-    err = int(1000 * 1e2).to_bytes(4, 'little', False)
+    lat = pack('<i', _read_e7(lines[0]))
+    lon = pack('<i', _read_e7(lines[1]))
+    alt = pack('<i', int(float(lines[2]) * 1e2))
+    err = pack('<I', int(1000 * 1e2))
     
     preamble = [0xb5, 0x62, 0x13, 0x40, 0x14, 0x00]
     payload = [0x01, 0x00, 0x00, 0x00,
@@ -72,6 +122,26 @@ def ubx_mga_ini_pos(): # get initial position estimate message
     
     return msg
 
+
+def _ubx_frame(buf, pos, end): # length of the UBX frame at buf[pos:end], 0 if there isn't one, -1 if cut short
+    avail = end - pos
+    if buf[pos] != 0xB5 or (avail > 1 and buf[pos + 1] != 0x62):
+        return 0
+    if avail < 8:
+        return -1
+    length = buf[pos + 4] | (buf[pos + 5] << 8)
+    if avail < length + 8:
+        return -1
+    
+    ck_a, ck_b = 0, 0
+    for i in range(pos + 2, pos + length + 6):
+        ck_a = (ck_a + buf[i]) & 0xFF
+        ck_b = (ck_b + ck_a) & 0xFF
+    
+    if ck_a != buf[pos + length + 6] or ck_b != buf[pos + length + 7]:
+        return 0
+    return length + 8
+
 def validate_ubx_message(msg):
     """
     Validate a UBX message at the start of msg.
@@ -80,42 +150,643 @@ def validate_ubx_message(msg):
         * 0 if there is no valid UBX message at the start of msg
         * -1 if there is not enough data to validate
     """
-    try:
-        if msg is None or len(msg) < 8:
-            raise RuntimeError("Message is None or too short")
-        if msg[0:2] != b'\xB5\x62':
-            raise RuntimeError("Message does not start with UBX header")
-        payload_len = int.from_bytes(msg[4:6], "little")
-        if len(msg) < payload_len + 8:
-            print("Warning: Message is truncated, waiting for more data")
-            return -1 # Message is truncated, return -1 to indicate this
-        msg = msg[:payload_len + 8]  # Trim to the expected length
-        chk = [0, 0]
-        for i in msg[2:-2]:
-            chk[0] = (chk[0] + i) & 0xFF
-            chk[1] = (chk[1] + chk[0]) & 0xFF
-        if bytes(chk) != msg[-2:]:
-            raise RuntimeError("Checksum mismatch")
-        return payload_len + 8
-    except RuntimeError as e:
-        print(f"Error: Failed to validate UBX message: {e}")
+    if not msg:
         return 0
+    return _ubx_frame(msg, 0, len(msg))
+
+class UbxSplitter:
+    """
+    Split AssistNow data into UBX messages without copying it, either a whole download at once (split) or
+    as it arrives in chunks (feed). Bad data (a broken checksum, a corrupt length, bytes between messages)
+    is skipped up to the next B5 62 and counted instead of ending the split.
+    """
+    def __init__(self, size=512):
+        # Messages split across chunks are put back together in this buffer, which bounds the largest
+        # message feed() can return (MGA messages are well under 200 bytes)
+        self.size = size
+        self._buf = bytearray(size)
+        self._mv = memoryview(self._buf)
+        self._len = 0
+        self._pos = 0  # where _frames() stopped
+        
+        # statistics
+        self.messages = 0
+        self.bytes = 0      # bytes of valid messages
+        self.crc_fails = 0  # B5 62 with a bad checksum or length
+        self.resyncs = 0
+        self.dropped = 0    # bytes skipped while looking for B5 62
+        self.truncated = 0  # bytes of an incomplete message at the end
+    
+    def split(self, data):
+        """
+        Generator of the messages in data (bytes or bytearray) as memoryviews into it.
+        The views stay valid as long as data isn't changed.
+        """
+        return self._frames(data, memoryview(data), len(data), True)
+    
+    def feed(self, data):
+        """
+        Generator of the messages completed by data, the next chunk of the download.
+        The messages are memoryviews into the splitter's buffer, only valid until the next one.
+        """
+        data = memoryview(data)
+        while len(data):
+            n = min(len(data), self.size - self._len)
+            self._mv[self._len:self._len + n] = data[:n]
+            self._len += n
+            data = data[n:]
+            
+            yield from self._frames(self._buf, self._mv, self._len, False)
+            
+            # Keep the start of a message that isn't complete yet at the front of the buffer
+            remaining = self._len - self._pos
+            if remaining and self._pos:
+                self._mv[:remaining] = self._mv[self._pos:self._len]
+            self._len = remaining
+    
+    def finish(self):
+        """End of the download: whatever is left in the buffer is an incomplete message"""
+        self.truncated += self._len
+        self._len = 0
+    
+    def _frames(self, data, mv, end, final):
+        # Messages in data[:end]. Unless final, stop at a message that could still be completed by
+        # more data, leaving its position in _pos
+        pos = 0
+        while pos < end:
+            res = _ubx_frame(data, pos, end)
+            if res > 0:
+                self.messages += 1
+                self.bytes += res
+                yield mv[pos:pos + res]
+                pos += res
+                continue
+            
+            if res < 0:
+                if final:
+                    if find_ubx_header(data, pos + 2, end) < 0:  # the last message, cut short
+                        self.truncated += end - pos
+                        pos = end
+                        break
+                elif end - pos < 6 or (data[pos + 4] | (data[pos + 5] << 8)) + 8 <= self.size:
+                    break  # wait for the rest
+            
+            # Not a message, or one with a bad checksum or a corrupt length: skip to the next header
+            if pos + 1 < end and data[pos + 1] == 0x62:
+                self.crc_fails += 1
+            self.resyncs += 1
+            nxt = find_ubx_header(data, pos + 1, end)
+            if nxt < 0:
+                # a B5 at the very end may be the start of the next header
+                nxt = end - 1 if not final and data[end - 1] == 0xB5 else end
+            self.dropped += nxt - pos
+            pos = nxt
+        
+        self._pos = pos
+
+def split_ubx_messages(msgs, splitter=None):
+    """
+    Generator method to split a byte sequence into valid UBX messages, as memoryviews into msgs.
+    Anything else in msgs is skipped, and counted by splitter when one is passed.
+    """
+    return (splitter or UbxSplitter()).split(msgs)
+
+# MGA-ACK-DATA0 infoCodes worth sending the message again for: no time known yet, couldn't be stored, not ready
+_MGA_RETRY_CODES = (1, 4, 5)
 
-def split_ubx_messages(msgs):
+class MgaUploader:
     """
-    Generator method to split a byte sequence into valid UBX messages.
-    Assumes msgs is a bytes or bytearray object containing only valid
-    UBX messages.
+    Send MGA messages to the receiver no faster than it takes them in. With CFG-NAVSPG-ACKAIDING on, the
+    receiver answers each one with UBX-MGA-ACK-DATA0 (matched by message id and the first 4 payload bytes,
+    oldest write first, as MGA-DBD messages all start with the same reserved bytes).
+    Up to window messages are left unacknowledged at a time; one refused for a passing reason, or not
+    acknowledged within timeout_ms, is sent again up to retries times. send() copies the message, so it
+    can be given the splitter's views. If the receiver never acknowledges anything, the rest is sent blind.
     """
-    while msgs:
-        msg_len = validate_ubx_message(msgs)
-        if msg_len <= 0:
-            raise RuntimeError("Failed to split UBX messages")
-        yield msgs[:msg_len]  # Yield the valid message
-        msgs = msgs[msg_len:] # Remove the valid message from the buffer
-
-async def assist_now(uart, rtc):
-    # enable station interface and connect to WiFi access point
+    def __init__(self, uart, demux, window=8, timeout_ms=1000, retries=3, retry_ms=100, slot_size=256):
+        self.uart = uart
+        self.demux = demux
+        self.window = window
+        self.timeout_ms = timeout_ms
+        self.retries = retries
+        self.retry_ms = retry_ms
+        self.slot_size = slot_size
+        
+        # One slot per message in flight
+        self._slots = [bytearray(slot_size) for _ in range(window)]
+        self._lens = [0] * window      # 0 when the slot is free
+        self._deadline = [0] * window  # ticks_ms when the message is sent again
+        self._tries = [0] * window
+        self._order = [0] * window     # when the message was last written, counted in writes, 0 once answered
+        self._event = uasyncio.Event()  # set when an acknowledgement frees or reschedules a slot
+        self._blind = False
+        self._start = 0
+        
+        # statistics
+        self.messages = 0   # messages given to send()
+        self.bytes = 0
+        self.writes = 0     # including retries
+        self.accepted = 0
+        self.rejected = 0   # refused for good
+        self.retried = 0
+        self.lost = 0       # never acknowledged
+        self.unmatched = 0  # acknowledgements for nothing in flight
+        self.nak_codes = [0] * 8  # rejections by infoCode
+        self.elapsed_ms = 0
+    
+    def start(self):
+        """Turn on MGA-ACK and start listening for them"""
+        self.demux.add_ubx_handler(0x13, 0x60, self._ack)
+        self.uart.write(CFG_RAM_ACKAIDING)
+        self._start = ticks_ms()
+    
+    async def send(self, msg):
+        """Send an MGA message, waiting for room in the window"""
+        self.messages += 1
+        self.bytes += len(msg)
+        if self._blind or len(msg) > self.slot_size:
+            self.uart.write(msg)
+            self.writes += 1
+            return
+        
+        i = await self._free_slot()
+        if self._blind:  # gave up on acknowledgements while waiting
+            self.uart.write(msg)
+            self.writes += 1
+            return
+        n = len(msg)
+        self._slots[i][:n] = msg
+        self._lens[i] = n
+        self._tries[i] = 0
+        self._write(i)
+    
+    async def finish(self):
+        """Wait until every message is acknowledged or given up on, then stop listening"""
+        while not self._blind and any(self._lens):
+            await self._wait()
+        self.demux.remove_ubx_handler(0x13, 0x60)
+        self.elapsed_ms = ticks_diff(ticks_ms(), self._start)
+    
+    def summary(self):
+        secs = self.elapsed_ms / 1000 or 0.001
+        acked = self.accepted + self.rejected
+        return (f'{self.messages} messages ({self.bytes} bytes) in {secs:.1f} s, {self.bytes / secs:.0f} B/s: '
+                f'{self.accepted} accepted ({100 * self.accepted / (acked or 1):.0f}% of acknowledged), '
+                f'{self.rejected} rejected, {self.retried} retries, {self.lost} lost'
+                + (', receiver not acknowledging' if self._blind else ''))
+    
+    def _write(self, i):
+        self.uart.write(memoryview(self._slots[i])[:self._lens[i]])
+        self.writes += 1
+        self._order[i] = self.writes
+        self._tries[i] += 1
+        self._deadline[i] = ticks_add(ticks_ms(), self.timeout_ms)
+    
+    async def _free_slot(self):
+        while True:
+            for i in range(self.window):
+                if not self._lens[i]:
+                    return i
+            await self._wait()
+            if self._blind:
+                return 0
+    
+    async def _wait(self):
+        # Until an acknowledgement or the next deadline, then resend whatever is due
+        now = ticks_ms()
+        wait = self.timeout_ms
+        for i in range(self.window):
+            if self._lens[i]:
+                wait = min(wait, ticks_diff(self._deadline[i], now))
+        if wait > 0:
+            try:
+                await uasyncio.wait_for_ms(self._event.wait(), wait)
+            except uasyncio.TimeoutError:
+                pass
+        self._event.clear()
+        
+        now = ticks_ms()
+        for i in range(self.window):
+            if self._lens[i] and ticks_diff(now, self._deadline[i]) >= 0:
+                if self._tries[i] <= self.retries:
+                    self.retried += 1
+                    self._write(i)
+                else:
+                    self.lost += 1
+                    self._lens[i] = 0
+                    if not (self.accepted or self.rejected):  # nothing has ever been acknowledged
+                        self._blind = True
+        
+        if self._blind:
+            for i in range(self.window):
+                self._lens[i] = 0
+    
+    def _ack(self, frame):
+        # UBX-MGA-ACK-DATA0: type, version, infoCode, msgId, msgPayloadStart[4]
+        accepted = frame[6] == 1
+        code = frame[8]
+        msg_id = frame[9]
+        
+        # The receiver answers in the order it was sent, so take the oldest message in flight that matches
+        i = -1
+        for j in range(self.window):
+            slot = self._slots[j]
+            if (self._order[j] and self._lens[j] and slot[3] == msg_id and slot[6] == frame[10] and slot[7] == frame[11]
+                    and slot[8] == frame[12] and slot[9] == frame[13]
+                    and (i < 0 or self._order[j] < self._order[i])):
+                i = j
+        if i < 0:
+            self.unmatched += 1
+            return
+        
+        if accepted:
+            self.accepted += 1
+            self._lens[i] = 0
+        elif code in _MGA_RETRY_CODES and self._tries[i] <= self.retries:
+            self._deadline[i] = ticks_add(ticks_ms(), self.retry_ms)
+            self._order[i] = 0  # answered, nothing more to match until it is sent again
+        else:
+            self.rejected += 1
+            self.nak_codes[min(code, 7)] += 1
+            self._lens[i] = 0
+        self._event.set()
+
+def mga_validity(msg_id, kind):
+    """Seconds an MGA message of the given id and payload type stays useful, 0 if it isn't worth caching"""
+    if msg_id == _MGA_INI:
+        return 0
+    return MGA_VALIDITY.get((msg_id << 8) | kind, 0)
+
+_INDEX_MAGIC = b'MGA1'
+_INDEX_HEADER = 16  # <4sIII magic, fetch time, time the first message expires, message count
+_INDEX_ENTRY = 8    # <IHBB offset into the cache, length, message id, payload type
+
+class AssistCache:
+    """
+    AssistNow data on flash: the validated messages back to back in ASSIST_CACHE, and in ASSIST_INDEX the
+    fetch time (RTC UNIX time) and the offset, length, id and type of each message, so the ones still
+    valid can be replayed without reading the rest. A new download is written next to the old cache and
+    only replaces it once complete.
+    """
+    def __init__(self, path=ASSIST_CACHE, index=ASSIST_INDEX, size=256):
+        self.path = path
+        self.index = index
+        self.fetched = 0  # RTC time of the cached download, 0 without one
+        self.expires = 0  # when the shortest lived of its messages stops being useful
+        self.count = 0
+        self._buf = bytearray(size)
+        self._mv = memoryview(self._buf)
+        self._entry = bytearray(_INDEX_ENTRY)
+        self._data = None  # files of a download being written
+        self._idx = None
+        self._offset = 0
+        self._written = 0
+        self._fetching = 0
+        self._expires = 0
+    
+    def load(self):
+        """Read the cache header, True if there is a cache"""
+        self.fetched = 0
+        self.expires = 0
+        self.count = 0
+        try:
+            with open(self.index, 'rb') as f:
+                header = f.read(_INDEX_HEADER)
+        except OSError:
+            return False
+        if len(header) != _INDEX_HEADER or header[:4] != _INDEX_MAGIC:
+            return False
+        self.fetched, self.expires, self.count = unpack_from('<III', header, 4)
+        return True
+    
+    def age(self, now):
+        return now - self.fetched
+    
+    def expired(self, now):
+        """True when some of the cached data is out of date (or there is none), time to download again"""
+        return not self.count or now < self.fetched or now >= self.expires  # or the clock went back
+
+    def messages(self, now=None, ids=None):
+        """
+        Generator of the cached messages still valid at now (all of them if now is None), optionally only
+        those with a message id in ids. The messages are memoryviews into a buffer reused for the next one.
+        """
+        if not self.count:
+            return
+        with open(self.index, 'rb') as idx, open(self.path, 'rb') as data:
+            idx.seek(_INDEX_HEADER)
+            entry = self._entry
+            for _ in range(self.count):
+                if idx.readinto(entry) != _INDEX_ENTRY:
+                    return
+                offset, length, msg_id, kind = unpack_from('<IHBB', entry)
+                if ids is not None and msg_id not in ids:
+                    continue
+                if now is not None and self.age(now) >= mga_validity(msg_id, kind):
+                    continue
+                if length > len(self._buf):
+                    continue
+                data.seek(offset)
+                if data.readinto(self._mv[:length]) != length:
+                    return
+                yield self._mv[:length]
+    
+    def begin(self, now):
+        """Start writing a new download fetched at now"""
+        self.abort()
+        self._data = open(self.path + '.new', 'wb')
+        self._idx = open(self.index + '.new', 'wb')
+        self._idx.write(bytes(_INDEX_HEADER))  # filled in by commit()
+        self._offset = 0
+        self._written = 0
+        self._fetching = now
+        self._expires = now + max(MGA_VALIDITY.values())
+    
+    def add(self, msg):
+        """Append a validated message to the download being written, unless it has no known lifetime
+        (MGA-INI and anything not in MGA_VALIDITY)"""
+        if self._data is None or msg[2] != 0x13:
+            return
+        n = len(msg)
+        kind = msg[6] if n > 8 else 0
+        validity = mga_validity(msg[3], kind)
+        if not validity:
+            return
+        self._data.write(msg)
+        pack_into('<IHBB', self._entry, 0, self._offset, n, msg[3], kind)
+        self._idx.write(self._entry)
+        self._offset += n
+        self._written += 1
+        self._expires = min(self._expires, self._fetching + validity)
+    
+    def commit(self):
+        """Replace the cache with the download just written, unless it was empty"""
+        if self._data is None:
+            return
+        if not self._written:
+            self.abort()
+            return
+        self._idx.seek(0)
+        self._idx.write(pack('<4sIII', _INDEX_MAGIC, self._fetching, self._expires, self._written))
+        self._data.close()
+        self._idx.close()
+        self._data = self._idx = None
+        
+        # Without an index the old data is never read, so a power cut part way leaves no cache rather than a mixed one
+        try:
+            os.remove(self.index)
+        except OSError:
+            pass
+        replace_file(self.path + '.new', self.path)
+        os.rename(self.index + '.new', self.index)
+        self.load()
+    
+    def abort(self):
+        """Drop a download being written, keeping the old cache"""
+        if self._data is None:
+            return
+        self._data.close()
+        self._idx.close()
+        self._data = self._idx = None
+        for path in (self.path + '.new', self.index + '.new'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def replace_file(src, dst): # rename src over dst
+    try:
+        os.rename(src, dst)
+    except OSError:  # some filesystems won't rename over an existing file
+        os.remove(dst)
+        os.rename(src, dst)
+
+_ANO_MAGIC = b'ANO1'
+_ANO_HEADER = 12  # <4sII magic, fetch time, number of runs
+_ANO_RUN = 10     # <HBBIH day (days since 2000), gnssId, 0, offset of the first record, records
+_ANO_LENGTH = 84  # an MGA-ANO frame, 76 bytes of payload
+
+class AnoStore:
+    """
+    AssistNow Offline data on flash: the MGA-ANO records of a download back to back in ANO_STORE, and in
+    ANO_INDEX a run (day, GNSS, offset, count) for each stretch of records for the same day and GNSS, so
+    the records for one day are found without reading the others. Written like AssistCache.
+    """
+    def __init__(self, path=ANO_STORE, index=ANO_INDEX):
+        self.path = path
+        self.index = index
+        self.fetched = 0
+        self.runs = 0
+        self.first_day = -1  # days since 2000 covered, -1 without data
+        self.last_day = -1
+        self._buf = bytearray(_ANO_LENGTH)
+        self._run = bytearray(_ANO_RUN)
+        self._data = None
+        self._idx = None
+        self._offset = 0
+        self._fetching = 0
+        self._runs = 0
+        self._day = -1  # run being written
+        self._gnss = -1
+        self._start = 0
+        self._count = 0
+    
+    def load(self):
+        """Read the index header and the days covered, True if there is data"""
+        self.fetched = 0
+        self.runs = 0
+        self.first_day = self.last_day = -1
+        try:
+            f = open(self.index, 'rb')
+        except OSError:
+            return False
+        with f:
+            header = f.read(_ANO_HEADER)
+            if len(header) != _ANO_HEADER or header[:4] != _ANO_MAGIC:
+                return False
+            self.fetched, self.runs = unpack_from('<II', header, 4)
+            for _ in range(self.runs):
+                if f.readinto(self._run) != _ANO_RUN:
+                    break
+                day = self._run[0] | (self._run[1] << 8)
+                if self.first_day < 0 or day < self.first_day:
+                    self.first_day = day
+                self.last_day = max(self.last_day, day)
+        return self.runs > 0
+    
+    def messages(self, day, gnss=None):
+        """
+        Generator of the MGA-ANO records for day (days since 2000), optionally only for one gnssId.
+        The records are memoryviews into a buffer reused for the next one.
+        """
+        if not self.runs:
+            return
+        mv = memoryview(self._buf)
+        with open(self.index, 'rb') as idx, open(self.path, 'rb') as data:
+            idx.seek(_ANO_HEADER)
+            for _ in range(self.runs):
+                if idx.readinto(self._run) != _ANO_RUN:
+                    return
+                run_day, run_gnss, _, offset, count = unpack_from('<HBBIH', self._run)
+                if run_day != day or (gnss is not None and run_gnss != gnss):
+                    continue
+                data.seek(offset)
+                for _ in range(count):
+                    if data.readinto(self._buf) != _ANO_LENGTH:
+                        return
+                    yield mv
+    
+    def begin(self, now):
+        self.abort()
+        self._data = open(self.path + '.new', 'wb')
+        self._idx = open(self.index + '.new', 'wb')
+        self._idx.write(bytes(_ANO_HEADER))  # filled in by commit()
+        self._offset = 0
+        self._fetching = now
+        self._runs = 0
+        self._day = self._gnss = -1
+        self._count = 0
+    
+    def add(self, msg):
+        """Store an MGA-ANO record from the download, anything else is ignored. True if stored"""
+        if self._data is None or len(msg) != _ANO_LENGTH or msg[2] != 0x13 or msg[3] != 0x20:
+            return False
+        # payload: type, version, svId, gnssId, year (since 2000), month, day, ...
+        day = days_since_2000(2000 + msg[10], msg[11], msg[12])
+        gnss = msg[9]
+        if day != self._day or gnss != self._gnss:
+            self._end_run()
+            self._day, self._gnss, self._start = day, gnss, self._offset
+        self._data.write(msg)
+        self._offset += _ANO_LENGTH
+        self._count += 1
+        return True
+    
+    def commit(self):
+        if self._data is None:
+            return
+        self._end_run()
+        if not self._runs:
+            self.abort()
+            return
+        self._idx.seek(0)
+        self._idx.write(pack('<4sII', _ANO_MAGIC, self._fetching, self._runs))
+        self._data.close()
+        self._idx.close()
+        self._data = self._idx = None
+        
+        try:
+            os.remove(self.index)
+        except OSError:
+            pass
+        replace_file(self.path + '.new', self.path)
+        os.rename(self.index + '.new', self.index)
+        self.load()
+    
+    def abort(self):
+        if self._data is None:
+            return
+        self._data.close()
+        self._idx.close()
+        self._data = self._idx = None
+        for path in (self.path + '.new', self.index + '.new'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def _end_run(self):
+        if self._count:
+            pack_into('<HBBIH', self._run, 0, self._day, self._gnss, 0, self._start, self._count)
+            self._idx.write(self._run)
+            self._runs += 1
+            self._count = 0
+
+def rtc_day(rtc):
+    """Today (UTC) from the RV3028, in days since 2000"""
+    t = localtime(rtc.getUnixTime())
+    return days_since_2000(t[0], t[1], t[2])
+
+async def _send(uart, uploader, msg):
+    if uploader is None:
+        uart.write(msg)
+    else:
+        await uploader.send(msg)
+
+async def assist_now(uart, rtc, demux=None, mode='online'):
+    # With the stream demux, the upload is paced by the receiver's MGA-ACKs (see MgaUploader).
+    # mode 'online' uses AssistNow Online (cached while valid), 'offline' the day's records from AssistNow Offline
+    uploader = None
+    if demux is not None:
+        uploader = MgaUploader(uart, demux)
+        uploader.start()
+    
+    if mode == 'offline':
+        await assist_now_offline(uart, rtc, uploader)
+    else:
+        await assist_now_online(uart, rtc, uploader)
+    
+    if uploader is not None:
+        await uploader.finish()
+        print(f'Upload: {uploader.summary()}')
+
+async def assist_now_online(uart, rtc, uploader):
+    # Cached data that is still valid goes to the receiver, no network needed; it is only replayed when
+    # nothing is downloaded, so the same messages never cross the UART twice
+    cache = AssistCache()
+    now = rtc.getUnixTime()
+    cache.load()
+    if not cache.expired(now):
+        await _replay(uart, uploader, cache, now)
+        print(f'Cached AssistNow data good for another {(cache.expires - now) // 60} min, not downloading')
+        return
+    
+    nic = await connect_wifi(rtc)
+    if nic is None:
+        await _replay(uart, uploader, cache, now)
+        return
+    await download_assist_now(uart, rtc, uploader, cache)
+    nic.disconnect()
+
+async def _replay(uart, uploader, cache, now):
+    if not cache.count:
+        return
+    replayed = 0
+    for msg in cache.messages(now):
+        await _send(uart, uploader, msg)
+        replayed += 1
+    print(f'Replayed {replayed} of {cache.count} cached AssistNow messages, {cache.age(now) // 60} min old')
+
+async def assist_now_offline(uart, rtc, uploader):
+    # Today's MGA-ANO records from flash; the network is only needed when the store is running out
+    store = AnoStore()
+    store.load()
+    today = rtc_day(rtc)
+    replayed = await _replay_ano(uart, uploader, store, today)
+    
+    if store.last_day - today >= ANO_REFRESH_DAYS:
+        return
+    
+    nic = await connect_wifi(rtc)
+    if nic is None:
+        return
+    await download_ano(rtc, store)
+    nic.disconnect()
+    
+    if not replayed:  # nothing for today before the download
+        await _replay_ano(uart, uploader, store, rtc_day(rtc))
+
+async def _replay_ano(uart, uploader, store, day):
+    replayed = 0
+    for msg in store.messages(day):
+        await _send(uart, uploader, msg)
+        replayed += 1
+    if store.runs:
+        print(f'Replayed {replayed} AssistNow Offline records for today, data for {store.last_day - day} days more')
+    return replayed
+
+async def connect_wifi(rtc):
+    # enable station interface and connect to WiFi access point, None if that fails
     nic = network.WLAN(network.WLAN.IF_STA)
     nic.active(True)
     
@@ -123,7 +794,7 @@ async def assist_now(uart, rtc):
         nic.connect(SSID, PASSWORD)
     except OSError:
         print(f'Failed to connect to access point {SSID}')
-        return
+        return None
     
     tries = 0
     max_tries = 100
@@ -133,7 +804,7 @@ async def assist_now(uart, rtc):
         
         if tries > max_tries:
             print('Couldn\'t connect, giving up')
-            return
+            return None
         
         await uasyncio.sleep_ms(100)
         
@@ -144,45 +815,80 @@ async def assist_now(uart, rtc):
         pass
         
     print(f'Connected on {nic.ifconfig()[0]}')
+    return nic
+
+async def download_assist_now(uart, rtc, uploader, cache):
     print(f'Requesting assistnow data...')
     
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f'https://AssistNow.services.u-blox.com/GetAssistNowData.ashx?chipcode={CHIPCODE}&gnss=gps,gal&data=ulorb_l1,ukion,usvht,ualm') as response:     
-            data = await response.read()
-            messages = list(split_ubx_messages(data))
-            
-            print(f'Got {len(messages)} rows of data, updating receiver...')
-
-            for msg in messages:
-                uart.write(msg)
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'https://AssistNow.services.u-blox.com/GetAssistNowData.ashx?chipcode={CHIPCODE}&gnss=gps,gal&data=ulorb_l1,ukion,usvht,ualm') as response:     
+                print(f'Updating receiver...')
+                
+                # Send each message on (and to the cache) as soon as it's complete, so only one chunk is held at a time
+                splitter = UbxSplitter()
+                cache.begin(rtc.getUnixTime())
+                while True:
+                    chunk = await response.read(DOWNLOAD_CHUNK)
+                    if not chunk:
+                        break
+                    for msg in splitter.feed(chunk):
+                        cache.add(msg)
+                        await _send(uart, uploader, msg)
+                splitter.finish()
+                cache.commit()
 
-            print(f'Successfully updated receiver. Disconnecting...')
+                if splitter.resyncs or splitter.truncated:
+                    print(f'Skipped {splitter.dropped + splitter.truncated} bad bytes ({splitter.crc_fails} checksum fails)')
+                print(f'Successfully sent {splitter.messages} messages to the receiver. Disconnecting...')
+    except OSError as e:
+        print(f'AssistNow download failed: {e}')
+    finally:
+        cache.abort()  # nothing to do after commit(), keeps the old cache after a failure
 
-    nic.disconnect()
+async def download_ano(rtc, store):
+    print(f'Requesting AssistNow Offline data...')
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(ANO_URL) as response:
+                splitter = UbxSplitter()
+                stored = 0
+                store.begin(rtc.getUnixTime())
+                while True:
+                    chunk = await response.read(DOWNLOAD_CHUNK)
+                    if not chunk:
+                        break
+                    for msg in splitter.feed(chunk):
+                        stored += store.add(msg)
+                splitter.finish()
+                store.commit()
+                
+                print(f'Stored {stored} of {splitter.messages} AssistNow Offline messages, {store.runs} day/GNSS runs')
+    except OSError as e:
+        print(f'AssistNow Offline download failed: {e}')
+    finally:
+        store.abort()  # nothing to do after commit(), keeps the old data after a failure
     
 async def caching(gps, rtc):
     cached_gps_time = False
-    signs = {'N': 1, 'E': 1, 'S': -1, 'W': -1}
     while True:
-        if not gps.valid:
+        nav = gps.snapshot  # position and altitude from the same epoch
+        if not nav.valid:
             await uasyncio.sleep(10)
             continue
         
         with open('lkc', 'w') as lkc:
-            lat = gps._latitude
-            lat = signs[lat[2]] * (lat[0] + lat[1] / 60.0)
-            
-            lon = gps._longitude
-            lon = signs[lon[2]] * (lon[0] + lon[1] / 60.0)
-            
-            alt = gps.altitude
+            lat = nav.lat_e7 # 1e-7 deg, as UBX-MGA-INI-POS_LLH wants them
+            lon = nav.lon_e7
+            alt = nav.altitude
             
             print(lat, file=lkc)
             print(lon, file=lkc)
             print(alt, file=lkc)
             
         if not cached_gps_time:
-            rtc.setUnixTime(mktime(gps.get_local_time(utc_offset=0)))
+            rtc.setUnixTime(mktime(nav.get_local_time(UTC)))
             cached_gps_time = True
             
         await uasyncio.sleep(10)
\ No newline at end of file
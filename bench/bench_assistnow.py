@@ -0,0 +1,151 @@
+# AssistNow splitting benchmark: builds a synthetic multi-GNSS AssistNow Online
+# blob (ephemerides, almanacs, ionosphere and UTC messages, about the size of a
+# real download) and splits it with assistnow.split_ubx_messages, and in
+# DOWNLOAD_CHUNK pieces as assist_now streams it, reporting throughput, bytes
+# allocated and, for a copy with corrupted bytes, how much was recovered. The
+# copying splitter assistnow.py used before is timed alongside for comparison.
+# Run from the repository root:
+#
+#   python bench/bench_assistnow.py [kbytes] [repeat] [--corrupt N]
+
+import sys
+
+sys.path.append(".")
+sys.path.append("sim")
+
+import run as sim  # noqa: E402,F401  (puts the stand-ins on sys.path)
+from assistnow import DOWNLOAD_CHUNK, UbxSplitter, split_ubx_messages, ubx_chksum  # noqa: E402
+from utime import ticks_us, ticks_diff  # noqa: E402
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+# (class, id, payload length) of the messages in an AssistNow Online response
+MGA_TYPES = (
+    (0x13, 0x00, 68),  # MGA-GPS-EPH
+    (0x13, 0x02, 76),  # MGA-GAL-EPH
+    (0x13, 0x00, 36),  # MGA-GPS-ALM
+    (0x13, 0x02, 32),  # MGA-GAL-ALM
+    (0x13, 0x00, 16),  # MGA-GPS-IONO
+    (0x13, 0x00, 20),  # MGA-GPS-UTC
+)
+
+
+def ubx(cls, msg_id, payload):
+    body = bytes((cls, msg_id, len(payload) & 0xFF, len(payload) >> 8)) + payload
+    return b"\xb5\x62" + body + bytes(ubx_chksum(body))
+
+
+def blob(size):
+    """About size bytes of well formed MGA messages"""
+    out = bytearray()
+    seed = 1
+    n = 0
+    while len(out) < size:
+        cls, msg_id, length = MGA_TYPES[n % len(MGA_TYPES)]
+        payload = bytearray(length)
+        for i in range(length):
+            seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+            payload[i] = seed >> 16 & 0xFF
+        out += ubx(cls, msg_id, payload)
+        n += 1
+    return bytes(out)
+
+
+def corrupt(data, count):
+    """Copy of data with count bytes flipped, spread evenly"""
+    out = bytearray(data)
+    for i in range(count):
+        out[(i * 7919 + 13) % len(out)] ^= 0x5A
+    return bytes(out)
+
+
+def legacy_split(msgs):
+    # split_ubx_messages before the splitter: each message sliced off a copy of the rest
+    while msgs:
+        payload_len = int.from_bytes(msgs[4:6], "little")
+        msg = msgs[: payload_len + 8]
+        chk = [0, 0]
+        for i in msg[2:-2]:
+            chk[0] = (chk[0] + i) & 0xFF
+            chk[1] = (chk[1] + chk[0]) & 0xFF
+        if bytes(chk) != msg[-2:]:
+            raise RuntimeError("Failed to split UBX messages")
+        yield msg
+        msgs = msgs[payload_len + 8 :]
+
+
+def streamed(data):
+    """The messages of data fed to a splitter a download chunk at a time"""
+    splitter = UbxSplitter()
+    mv = memoryview(data)
+    for pos in range(0, len(data), DOWNLOAD_CHUNK):
+        for msg in splitter.feed(mv[pos : pos + DOWNLOAD_CHUNK]):
+            yield msg
+    splitter.finish()
+
+
+def measure(split, data, repeat):
+    """Best time in us, messages and peak bytes allocated for split(data)"""
+    best = None
+    count = 0
+    for _ in range(repeat):
+        start = ticks_us()
+        count = 0
+        for _msg in split(data):
+            count += 1
+        us = ticks_diff(ticks_us(), start)
+        best = us if best is None else min(best, us)
+
+    peak = -1
+    if tracemalloc is not None:
+        tracemalloc.start()
+        for _msg in split(data):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, count, peak
+
+
+def report(name, data, us, count, peak):
+    secs = us / 1e6 if us else 1e-6
+    print(
+        "%-10s %6d messages %8.0f kB/s %8.1f ms %9d bytes allocated (peak)"
+        % (name, count, len(data) / secs / 1000, us / 1000, peak)
+    )
+
+
+def main(argv):
+    args = []
+    flipped = 50
+    rest = iter(argv[1:])
+    for arg in rest:
+        if arg == "--corrupt":
+            flipped = int(next(rest))
+        else:
+            args.append(arg)
+    size = int(args[0]) * 1000 if args else 60000
+    repeat = int(args[1]) if len(args) > 1 else 3
+
+    data = blob(size)
+    print("%d bytes of AssistNow data, best of %d" % (len(data), repeat))
+
+    print("\n-- clean")
+    report("legacy", data, *measure(legacy_split, data, repeat))
+    report("splitter", data, *measure(split_ubx_messages, data, repeat))
+    report("streamed", data, *measure(streamed, data, repeat))
+
+    bad = corrupt(data, flipped)
+    splitter = UbxSplitter()
+    good = sum(1 for _msg in split_ubx_messages(bad, splitter))
+    print("\n-- %d corrupted bytes" % flipped)
+    report("splitter", bad, *measure(split_ubx_messages, bad, repeat))
+    print(
+        "recovered %d messages, %d checksum fails, %d resyncs, %d bytes dropped, %d truncated"
+        % (good, splitter.crc_fails, splitter.resyncs, splitter.dropped, splitter.truncated)
+    )
+
+
+main(sys.argv)
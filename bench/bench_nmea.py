@@ -0,0 +1,171 @@
+# NMEA parsing benchmark: replays a receiver log through MicropyGPS and reports
+# throughput of the per-character update(), the line based update_sentence()
+# and the full StreamDemux pipeline, parse cost per sentence type and bytes
+# allocated per sentence. Run from the repository root:
+#
+#   python bench/bench_nmea.py [log] [repeat]
+#
+# Without a log a synthetic drive from sim/synth.py is used (`python
+# sim/synth.py drive.ubx` saves one). Allocation is the tracemalloc peak per
+# sentence, which is a lower bound. The gc.mem_alloc path (exact, GC disabled)
+# is for MicroPython, where the bench has not been verified; a log must be
+# given there, as synth.py needs CPython's random.Random.
+
+import gc
+import sys
+
+sys.path.append(".")
+sys.path.append("sim")
+
+from micropyGPS import MicropyGPS  # noqa: E402
+from gnssstream import StreamDemux  # noqa: E402
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter_ns
+
+    def ticks_us():
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+BAUD_BYTES = 115200 // 10  # bytes per second the UART can deliver
+
+
+def load(argv):
+    if len(argv) > 1:
+        import capture
+
+        return capture.load(argv[1])  # raw stream or capture.py recording
+    if sys.implementation.name == "micropython":
+        raise SystemExit("usage: bench_nmea.py log [repeat] (no synthetic drive on MicroPython)")
+    import synth
+
+    return synth.generate(120, pvt=False)
+
+
+def split_sentences(stream):
+    """NMEA sentences in the stream, as bytes, using the same framing as the firmware"""
+    sentences = []
+    demux = StreamDemux(lambda buf, start, end: sentences.append(bytes(buf[start:end])))
+    demux.feed(stream)
+    return sentences
+
+
+def sentence_type(sentence):
+    return sentence[1:6].decode()
+
+
+def run_update(sentences):
+    gps = MicropyGPS()
+    chars = [s.decode() for s in sentences]
+    start = ticks_us()
+    for line in chars:
+        for ch in line:
+            gps.update(ch)
+    return ticks_diff(ticks_us(), start), gps
+
+
+def run_update_sentence(sentences):
+    gps = MicropyGPS()
+    start = ticks_us()
+    for line in sentences:
+        gps.update_sentence(line)
+    return ticks_diff(ticks_us(), start), gps
+
+
+def run_demux(stream):
+    gps = MicropyGPS()
+    demux = StreamDemux(gps.update_sentence)
+    demux.add_ubx_handler(0x01, 0x07, gps.parse_ubx)
+    mv = memoryview(stream)
+    start = ticks_us()
+    for pos in range(0, len(stream), 256):  # chunks as gps_updater sees them
+        demux.feed(mv[pos : pos + 256])
+    return ticks_diff(ticks_us(), start), gps
+
+
+def alloc_per_sentence(sentences, per_char):
+    """Average bytes allocated parsing one sentence"""
+    gps = MicropyGPS()
+    inputs = [s.decode() for s in sentences] if per_char else sentences
+    total = 0
+
+    if hasattr(gc, "mem_alloc"):  # MicroPython
+        for batch in range(0, len(inputs), 50):
+            gc.collect()
+            gc.disable()
+            before = gc.mem_alloc()
+            for line in inputs[batch : batch + 50]:
+                if per_char:
+                    for ch in line:
+                        gps.update(ch)
+                else:
+                    gps.update_sentence(line)
+            total += gc.mem_alloc() - before
+            gc.enable()
+    elif tracemalloc is not None:
+        tracemalloc.start()
+        for line in inputs:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            if per_char:
+                for ch in line:
+                    gps.update(ch)
+            else:
+                gps.update_sentence(line)
+            total += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+    else:
+        return -1
+
+    return total / len(inputs)
+
+
+def report(name, us, sentences, nbytes):
+    secs = us / 1e6 if us else 1e-6
+    print(
+        "%-16s %9.0f sentences/s %10.0f chars/s %6.1f%% of 115200 baud budget"
+        % (name, len(sentences) / secs, nbytes / secs, 100 * BAUD_BYTES / (nbytes / secs))
+    )
+
+
+def main(argv):
+    stream = load(argv)
+    repeat = int(argv[2]) if len(argv) > 2 else 3
+    sentences = split_sentences(stream)
+    nbytes = sum(len(s) for s in sentences)
+    print("%d sentences, %d NMEA bytes, %d stream bytes, best of %d" % (len(sentences), nbytes, len(stream), repeat))
+
+    print("\n-- throughput")
+    best = min(run_update(sentences)[0] for _ in range(repeat))
+    report("update()", best, sentences, nbytes)
+    best = min(run_update_sentence(sentences)[0] for _ in range(repeat))
+    report("update_sentence()", best, sentences, nbytes)
+    best = min(run_demux(stream)[0] for _ in range(repeat))
+    report("demux pipeline", best, sentences, len(stream))
+
+    print("\n-- per sentence type (us/sentence, bytes allocated/sentence)")
+    print("%-8s %6s %10s %10s %10s %10s" % ("type", "count", "update", "sentence", "alloc chr", "alloc line"))
+    types = {}
+    for s in sentences:
+        types.setdefault(sentence_type(s), []).append(s)
+    for name in sorted(types):
+        group = types[name]
+        per_char = min(run_update(group)[0] for _ in range(repeat)) / len(group)
+        per_line = min(run_update_sentence(group)[0] for _ in range(repeat)) / len(group)
+        print(
+            "%-8s %6d %10.1f %10.1f %10.0f %10.0f"
+            % (name, len(group), per_char, per_line, alloc_per_sentence(group, True), alloc_per_sentence(group, False))
+        )
+
+
+main(sys.argv)
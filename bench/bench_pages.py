@@ -0,0 +1,176 @@
+# Frame time benchmark for the display pages. Each page in pages.py is loaded
+# and then refreshed once per epoch of a replayed (or synthetic) drive, on the
+# host stand-in display from sim/. Time is split into phases by wrapping the
+# functions that do the work, each phase counting only its own time:
+#
+#   format  GPSData date/time/position/speed string helpers
+#   label   Label.value/show bookkeeping and clearing
+#   blit    Writer._printchar (glyph lookup and blit)
+#   dial    Dial.show (compass rose and pointer)
+#   flush   ssd.show() diff and transfer
+#   page    everything else in Page.refresh (f-strings, maths, widgets)
+#
+# plus bytes allocated per frame and, with --i2c, bytes that would cross the
+# I2C bus and what that costs at 100 and 400 kHz. Run from the repository root:
+#
+#   python bench/bench_pages.py [log] [--frames N] [--i2c]
+#
+# The stand-in framebuf is pure Python, so blit and flush times are far higher
+# than on the board; compare runs against each other, not against the budget.
+
+import sys
+
+sys.path.append(".")
+sys.path.append("sim")
+
+import run as sim  # noqa: E402  (puts the stand-ins on sys.path)
+import synth  # noqa: E402
+from utime import ticks_us, ticks_diff  # noqa: E402
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+PHASES = ("format", "label", "blit", "dial", "flush", "page")
+
+
+class Profiler:
+    """Self time per phase, for functions wrapped with wrap()"""
+
+    def __init__(self):
+        self.totals = dict((phase, 0) for phase in PHASES)
+        self.stack = []
+        self.mark = 0
+
+    def _charge(self):
+        now = ticks_us()
+        if self.stack:
+            self.totals[self.stack[-1]] += ticks_diff(now, self.mark)
+        self.mark = now
+
+    def enter(self, phase):
+        self._charge()
+        self.stack.append(phase)
+
+    def exit(self):
+        self._charge()
+        self.stack.pop()
+
+    def wrap(self, owner, attr, phase):
+        fn = getattr(owner, attr)
+        prof = self
+
+        def wrapper(*args, **kwargs):
+            prof.enter(phase)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                prof.exit()
+
+        setattr(owner, attr, wrapper)
+
+    def reset(self):
+        for phase in PHASES:
+            self.totals[phase] = 0
+
+
+def epochs(stream):
+    """Replay the stream, yielding the snapshot of every epoch as it completes"""
+    from micropyGPS import MicropyGPS
+    from gnssstream import StreamDemux
+
+    gps = MicropyGPS()
+    done = []
+    gps.epoch_callback = lambda: done.append(True)
+    demux = StreamDemux(gps.update_sentence)
+    demux.add_ubx_handler(0x01, 0x07, gps.parse_ubx)
+    mv = memoryview(stream)
+    for pos in range(0, len(stream), 256):
+        demux.feed(mv[pos : pos + 256])
+        while done:
+            done.pop()
+            yield gps.snapshot
+
+
+def main(argv):
+    frames = 60
+    i2c_mode = "--i2c" in argv
+    args = []
+    rest = iter(argv[1:])
+    for arg in rest:
+        if arg == "--frames":
+            frames = int(next(rest))
+        elif not arg.startswith("--"):
+            args.append(arg)
+    if args:
+        import capture
+
+        stream = capture.load(args[0])  # raw stream or capture.py recording
+    else:
+        stream = synth.generate(frames + 5)
+
+    sim.fallback_fonts()
+    import color_setup
+    import pages
+    from micropyGPS import GPSData
+    from gui.core.writer import Writer
+    from gui.widgets.label import Label
+    from gui.widgets.dial import Dial
+
+    prof = Profiler()
+    for name in ("date_string", "time_string", "latitude_string", "longitude_string", "speed_string"):
+        prof.wrap(GPSData, name, "format")
+    prof.wrap(Label, "value", "label")
+    prof.wrap(Writer, "_printchar", "blit")
+    prof.wrap(Dial, "show", "dial")
+
+    ssd = color_setup.ssd
+    i2c = color_setup.i2c
+
+    for page_class in (pages.Default, pages.Quality, pages.Speedometer):
+        page = page_class()
+        prof.wrap(page, "refresh", "page")
+        alloc = 0
+        bus = 0
+        count = 0
+
+        for nav in epochs(stream):
+            if count == 0:
+                page.load(nav)
+                ssd.show()
+                prof.reset()
+
+            bus_before = i2c.bytes_written
+            if tracemalloc is not None:
+                tracemalloc.start()
+            page.refresh(nav)
+            prof.enter("flush")
+            ssd.show()
+            prof.exit()
+            if tracemalloc is not None:
+                alloc += tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            bus += i2c.bytes_written - bus_before
+
+            count += 1
+            if count > frames:
+                break
+
+        count -= 1
+        total = sum(prof.totals.values())
+        print("\n-- %s: %d frames, %.2f ms/frame" % (page_class.__name__, count, total / count / 1000))
+        for phase in PHASES:
+            us = prof.totals[phase] / count
+            print("  %-7s %8.2f ms %5.1f%%" % (phase, us / 1000, 100 * prof.totals[phase] / total if total else 0))
+        if tracemalloc is not None:
+            print("  alloc   %8.0f bytes/frame (peak)" % (alloc / count))
+        if i2c_mode:
+            per_frame = bus / count
+            print(
+                "  i2c     %8.0f bytes/frame, %.1f ms at 100 kHz, %.1f ms at 400 kHz"
+                % (per_frame, per_frame * 9 / 100, per_frame * 9 / 400)
+            )
+
+
+main(sys.argv)
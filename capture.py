@@ -0,0 +1,164 @@
+# Record the raw byte stream from the receiver to flash, and play it back.
+#
+# A capture file is MAGIC followed by records of
+#   <HH  milliseconds since the previous record (saturating), data length
+#   data
+# one per read from the UART, so the timing of the original stream is kept to
+# the resolution of uart_reader's reads. Recorder batches records in a fixed
+# buffer and writes them out in one go; Replay hands them back to uart_reader
+# as a StreamReader would, in real time, faster, or as fast as possible. Both
+# run on the board and on the host (sim/run.py also replays capture files).
+
+from struct import pack_into, unpack_from
+
+import uasyncio
+from utime import ticks_ms, ticks_diff
+
+MAGIC = b"UCAP\x01"
+_RECORD_HEADER = 4
+
+
+class Recorder:
+    def __init__(self, path, size=4096, flush_ms=5000):
+        """
+        Append the stream to path (a new capture starts with MAGIC). Records are collected in a
+        size byte buffer and written when it fills up, or on the first record after flush_ms.
+        """
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._buf = bytearray(size)
+        self._mv = memoryview(self._buf)
+        self._len = 0
+        self.flush_ms = flush_ms
+        self._last = ticks_ms()  # time of the previous record
+        self._flushed = self._last
+
+        # statistics
+        self.records = 0
+        self.bytes = 0
+        self.writes = 0
+
+    def record(self, data):
+        """Add bytes just read from the UART, stamped with the time since the previous record"""
+        now = ticks_ms()
+        delta = min(ticks_diff(now, self._last), 0xFFFF)
+        self._last = now
+
+        n = len(data)
+        self.bytes += n
+        while n:
+            chunk = min(n, 0xFFFF, len(self._buf) - _RECORD_HEADER)
+            if self._len + _RECORD_HEADER + chunk > len(self._buf):
+                self.flush()
+            pack_into("<HH", self._buf, self._len, delta, chunk)
+            self._len += _RECORD_HEADER
+            self._mv[self._len : self._len + chunk] = data[:chunk]
+            self._len += chunk
+            data = data[chunk:]
+            n -= chunk
+            delta = 0
+            self.records += 1
+
+        if ticks_diff(now, self._flushed) >= self.flush_ms:
+            self.flush()
+
+    def flush(self):
+        if self._len:
+            self._file.write(self._mv[: self._len])
+            self._file.flush()
+            self._len = 0
+            self.writes += 1
+        self._flushed = ticks_ms()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+def records(f, buf):
+    """Yield (delta_ms, data) for each record of the capture open as f, after MAGIC.
+    data is a memoryview into buf, which must hold the largest record, and is only valid until the next one"""
+    mv = memoryview(buf)
+    header = bytearray(_RECORD_HEADER)
+    while True:
+        if f.readinto(header) != _RECORD_HEADER:
+            return
+        delta, length = unpack_from("<HH", header)
+        if length > len(buf):
+            raise ValueError("capture record larger than buffer")
+        if f.readinto(mv[:length]) != length:
+            return  # truncated at the end, e.g. power lost mid write
+        yield delta, mv[:length]
+
+
+def open_capture(path):
+    """Open a capture file and check its header"""
+    f = open(path, "rb")
+    if f.read(len(MAGIC)) != MAGIC:
+        f.close()
+        raise ValueError("not a capture file")
+    return f
+
+
+def timeline(path):
+    """The whole capture as (stream bytes, [(ms since start, stream length by then), ...]), for the host tools"""
+    stream = bytearray()
+    marks = []
+    elapsed = 0
+    f = open_capture(path)
+    try:
+        for delta, data in records(f, bytearray(0xFFFF)):
+            elapsed += delta
+            stream += data
+            marks.append((elapsed, len(stream)))
+    finally:
+        f.close()
+    return bytes(stream), marks
+
+
+def load(path):
+    """Stream bytes of a capture file, or of a plain recording of the raw stream"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            f.seek(0)
+            return f.read()
+    return timeline(path)[0]
+
+
+class Replay:
+    """
+    A capture played back through the interface uart_reader uses, readinto(buf) awaited until data
+    arrives. speed 1 keeps the recorded timing, 10 plays ten times faster, 0 as fast as possible.
+    write() is accepted and dropped, so it can stand in for the UART.
+    """
+
+    def __init__(self, path, speed=1.0, size=4096):
+        self._file = open_capture(path)
+        self.speed = speed
+        self._buf = bytearray(size)
+        self._records = records(self._file, self._buf)
+        self._data = None  # what is left of the current record
+        self.done = False
+
+    async def readinto(self, buf):
+        while self._data is None:
+            try:
+                delta, self._data = next(self._records)
+            except StopIteration:
+                self.done = True
+                self._file.close()
+                while True:  # nothing more will arrive, like a quiet UART
+                    await uasyncio.sleep(1)
+            if self.speed:
+                await uasyncio.sleep_ms(int(delta / self.speed))
+            else:
+                await uasyncio.sleep_ms(0)
+
+        n = min(len(buf), len(self._data))
+        buf[:n] = self._data[:n]
+        self._data = self._data[n:] if n < len(self._data) else None
+        return n
+
+    def write(self, data):
+        return len(data)
@@ -2,6 +2,7 @@
 
 from micropython import const
 import framebuf
+import uasyncio as asyncio
 from drivers.boolpalette import BoolPalette
 
 # register definitions
@@ -36,6 +37,10 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        # Copy of what the display RAM holds, so show() only sends what changed
+        self.shadow = bytearray(self.pages * self.width)
+        self.stale = True  # Display RAM unknown, next show() sends everything
+        self.snapshot = None  # Frame being sent by show_async(), allocated on first use
         mode = framebuf.MONO_VLSB
         self.palette = BoolPalette(mode)  # Ensure color compatibility
         super().__init__(self.buffer, self.width, self.height, mode)
@@ -83,6 +88,7 @@ class SSD1306(framebuf.FrameBuffer):
 
     def poweron(self):
         self.write_cmd(SET_DISP | 0x01)
+        self.invalidate()
 
     def contrast(self, contrast):
         self.write_cmd(SET_CONTRAST)
@@ -91,9 +97,7 @@ class SSD1306(framebuf.FrameBuffer):
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
+    def set_window(self, x0, x1, p0, p1):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
@@ -102,9 +106,89 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(x0)
         self.write_cmd(x1)
         self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        self.write_cmd(p0)
+        self.write_cmd(p1)
+
+    # Column range of a page of buf (default the frame buffer) that differs from
+    # the display, (-1, -1) if unchanged
+    def dirty_columns(self, page, buf=None):
+        if buf is None:
+            buf = self.buffer
+        shadow = self.shadow
+        start = page * self.width
+        end = start + self.width
+        x0 = start
+        while x0 < end and buf[x0] == shadow[x0]:
+            x0 += 1
+        if x0 == end:
+            return -1, -1
+        x1 = end - 1
+        while buf[x1] == shadow[x1]:
+            x1 -= 1
+        return x0 - start, x1 - start
+
+    # Send columns x0..x1 of pages p0..p1 of buf (default the frame buffer) and
+    # record them as displayed
+    def flush(self, x0, x1, p0, p1, buf=None):
+        self.set_window(x0, x1, p0, p1)
+        mv = memoryview(self.buffer if buf is None else buf)
+        if x0 == 0 and x1 == self.width - 1:
+            start = p0 * self.width
+            end = (p1 + 1) * self.width
+            self.write_data(mv[start:end])
+            self.shadow[start:end] = mv[start:end]
+            return
+        for page in range(p0, p1 + 1):
+            start = page * self.width + x0
+            end = page * self.width + x1 + 1
+            self.write_data(mv[start:end])
+            self.shadow[start:end] = mv[start:end]
+
+    def invalidate(self):  # Force a full update, e.g. after the display lost power
+        self.stale = True
+
+    def show(self, full=False):
+        if full or self.stale:
+            self.stale = False
+            self.flush(0, self.width - 1, 0, self.pages - 1)
+            return
+        # Send runs of consecutive changed pages as one window spanning their changed columns
+        page = 0
+        while page < self.pages:
+            x0, x1 = self.dirty_columns(page)
+            if x0 < 0:
+                page += 1
+                continue
+            last = page
+            while last + 1 < self.pages:
+                n0, n1 = self.dirty_columns(last + 1)
+                if n0 < 0:
+                    break
+                x0 = min(x0, n0)
+                x1 = max(x1, n1)
+                last += 1
+            self.flush(x0, x1, page, last)
+            page = last + 2  # last + 1 is unchanged
+
+    # As show() but sends one page at a time, yielding to the scheduler in between
+    # so other tasks only wait for one chunk. The frame is snapshotted first, so
+    # what arrives on the display is consistent even if drawing carries on.
+    async def show_async(self, full=False):
+        if self.snapshot is None:
+            self.snapshot = bytearray(len(self.buffer))
+        snap = self.snapshot
+        snap[:] = self.buffer
+        if full or self.stale:
+            self.stale = False
+            for page in range(self.pages):
+                self.flush(0, self.width - 1, page, page, snap)
+                await asyncio.sleep_ms(0)
+            return
+        for page in range(self.pages):
+            x0, x1 = self.dirty_columns(page, snap)
+            if x0 >= 0:
+                self.flush(x0, x1, page, page, snap)
+                await asyncio.sleep_ms(0)
 
 
 class SSD1306_I2C(SSD1306):
@@ -113,6 +197,7 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        self.window = bytearray((0x00, SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
@@ -124,6 +209,18 @@ class SSD1306_I2C(SSD1306):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
 
+    def set_window(self, x0, x1, p0, p1):
+        # Send the whole addressing sequence as one command stream (Co=0, D/C#=0)
+        if self.width == 64:
+            x0 += 32
+            x1 += 32
+        w = self.window
+        w[2] = x0
+        w[3] = x1
+        w[5] = p0
+        w[6] = p1
+        self.i2c.writeto(self.addr, w)
+
 
 class SSD1306_SPI(SSD1306):
     def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
@@ -0,0 +1,203 @@
+# Split the raw byte stream from the receiver into NMEA sentences and UBX frames.
+# NMEA sentences ($...\r\n) go to one handler, UBX frames (B5 62 ...) to handlers
+# keyed by message class/id. Everything happens in one fixed size buffer, and the
+# scanner resyncs on the next start marker after corrupt or truncated data, so it
+# can be fed captured streams on the host as well as live UART data.
+
+try:
+    import micropython
+except ImportError:  # CPython: the code emitter decorators do nothing
+
+    class micropython:
+        @staticmethod
+        def native(f):
+            return f
+
+
+NMEA_LIMIT = 96  # Longest NMEA sentence we wait for, including CR/LF
+
+_NMEA_START = 0x24  # '$'
+_UBX_SYNC1 = 0xB5
+_UBX_SYNC2 = 0x62
+_LF = 0x0A
+
+
+# MicroPython's bytearray has no find(), so the scans for start markers are index loops (native code on the board)
+
+
+@micropython.native
+def find_byte(buf, byte, start, end):
+    """Position of the first byte value in buf[start:end], -1 if there is none"""
+    for pos in range(start, end):
+        if buf[pos] == byte:
+            return pos
+    return -1
+
+
+@micropython.native
+def find_ubx_header(buf, start, end):
+    """Position of the first B5 62 in buf[start:end], -1 if there is none"""
+    for pos in range(start, end - 1):
+        if buf[pos] == _UBX_SYNC1 and buf[pos + 1] == _UBX_SYNC2:
+            return pos
+    return -1
+
+
+@micropython.native
+def _find_start(buf, start, end):
+    # Position of the first '$' or B5 in buf[start:end], -1 if there is none
+    for pos in range(start, end):
+        char = buf[pos]
+        if char == _NMEA_START or char == _UBX_SYNC1:
+            return pos
+    return -1
+
+
+class StreamDemux:
+    def __init__(self, nmea_handler=None, size=512):
+        """
+        nmea_handler(buf, start, end) is called for every complete line starting with '$'.
+        buf is the demux's own buffer and is reused, so handlers must not keep it.
+        size bounds the buffer and therefore the largest UBX frame that can be routed.
+        """
+        self.nmea_handler = nmea_handler
+        self.ubx_handlers = {}  # (class << 8) | id -> handler(frame)
+        self.size = size
+        self._buf = bytearray(size)
+        self._mv = memoryview(self._buf)
+        self._len = 0
+
+        # statistics
+        self.nmea_count = 0
+        self.ubx_count = 0
+        self.unhandled_ubx = 0
+        self.crc_fails = 0
+        self.resyncs = 0
+        self.dropped = 0  # bytes discarded while searching for a start marker
+
+    def add_ubx_handler(self, cls, msg_id, handler):
+        """
+        Route checksummed UBX frames of class/id to handler(frame).
+        frame is a memoryview of the whole frame, only valid during the call.
+        """
+        self.ubx_handlers[(cls << 8) | msg_id] = handler
+
+    def remove_ubx_handler(self, cls, msg_id):
+        self.ubx_handlers.pop((cls << 8) | msg_id, None)
+
+    def feed(self, data):
+        """Add received bytes (bytes, bytearray or memoryview) and dispatch every complete message"""
+        data = memoryview(data)
+        while len(data):
+            n = min(len(data), self.size - self._len)
+            self._mv[self._len : self._len + n] = data[:n]
+            self._len += n
+            data = data[n:]
+            self._scan()
+
+    def reset(self):
+        self._len = 0
+
+    def _resync(self, pos):
+        # Corrupt or oversized message at pos, look for the next start marker after it
+        self.resyncs += 1
+        return pos + 1
+
+    def _next_start(self, pos):
+        # Position of the next possible '$' or B5 62 at or after pos, -1 if none buffered
+        return _find_start(self._buf, pos, self._len)
+
+    def _scan(self):
+        buf = self._buf
+        pos = 0
+
+        while pos < self._len:
+            start = self._next_start(pos)
+            if start < 0:  # nothing but garbage
+                self.dropped += self._len - pos
+                pos = self._len
+                break
+
+            self.dropped += start - pos
+            pos = start
+
+            if buf[start] == _NMEA_START:
+                res = self._nmea(start)
+            else:
+                res = self._ubx(start)
+
+            if res == 0:  # incomplete, wait for more data
+                break
+            pos = res
+
+        # Keep the unprocessed tail at the front of the buffer
+        if pos:
+            remaining = self._len - pos
+            if remaining:
+                self._mv[:remaining] = self._mv[pos : self._len]
+            self._len = remaining
+
+    def _nmea(self, start):
+        # Returns the position after the sentence, 0 if incomplete
+        buf = self._buf
+        limit = min(self._len, start + NMEA_LIMIT)
+        end = find_byte(buf, _LF, start, limit)
+
+        if end < 0:
+            if limit - start >= NMEA_LIMIT:  # no end in sight, not a sentence
+                return self._resync(start)
+            return 0
+
+        end += 1
+
+        # A new start marker inside the line means this sentence was cut short
+        other = find_byte(buf, _NMEA_START, start + 1, end)
+        if other < 0:
+            other = find_ubx_header(buf, start + 1, end)
+        if other >= 0:
+            self.resyncs += 1
+            return other
+
+        self.nmea_count += 1
+        if self.nmea_handler is not None:
+            self.nmea_handler(buf, start, end)
+
+        return end
+
+    def _ubx(self, start):
+        # Returns the position after the frame, 0 if incomplete
+        buf = self._buf
+        available = self._len - start
+
+        if available < 2:
+            return 0
+        if buf[start + 1] != _UBX_SYNC2:  # lone B5
+            return self._resync(start)
+        if available < 6:
+            return 0
+
+        length = buf[start + 4] | (buf[start + 5] << 8)
+        if length + 8 > self.size:  # can't hold it, most likely a corrupt length
+            return self._resync(start)
+        if available < length + 8:
+            return 0
+
+        ck_a = 0
+        ck_b = 0
+        for pos in range(start + 2, start + length + 6):
+            ck_a = (ck_a + buf[pos]) & 0xFF
+            ck_b = (ck_b + ck_a) & 0xFF
+
+        end = start + length + 8
+        if ck_a != buf[end - 2] or ck_b != buf[end - 1]:
+            self.crc_fails += 1
+            return self._resync(start)
+
+        self.ubx_count += 1
+        handler = self.ubx_handlers.get((buf[start + 2] << 8) | buf[start + 3])
+        if handler is None:
+            self.unhandled_ubx += 1
+        else:
+            handler(self._mv[start:end])
+
+        return end
@@ -34,7 +34,8 @@ def fillcircle(dev, x0, y0, r, color): # Draw filled circle
 # None causes pending widgets to be drawn and the result to be copied to hardware.
 # The pend mechanism enables a displayable object to postpone its renedering
 # until it is complete: efficient for e.g. Dial which may have multiple Pointers
-def refresh(device, clear=False):
+# show=False leaves copying to hardware to the caller (e.g. await device.show_async())
+def refresh(device, clear=False, show=True):
     if not isinstance(device, framebuf.FrameBuffer):
         raise ValueError('Device must be derived from FrameBuffer.')
     if device not in DObject.devices:
@@ -48,7 +49,8 @@ def refresh(device, clear=False):
             for obj in DObject.devices[device]:
                 obj.show()
             DObject.devices[device].clear()
-    device.show()
+    if show:
+        device.show()
 
 # Displayable object: effectively an ABC for all GUI objects.
 class DObject():
@@ -1,6 +1,7 @@
 # writer.py Implements the Writer class.
 # Handles colour, word wrap and tab stops
 
+# V0.5.3 Oct 2026 Writer caches ready to blit glyph FrameBuffers (LRU).
 # V0.5.2 May 2025 Fix bug whereby glyph clipping might be attempted.
 # V0.5.1 Dec 2022 Support 4-bit color display drivers.
 # V0.5.0 Sep 2021 Color now requires firmware >= 1.17.
@@ -25,7 +26,7 @@
 import framebuf
 from uctypes import bytearray_at, addressof
 
-__version__ = (0, 5, 2)
+__version__ = (0, 5, 3)
 
 
 class DisplayState:
@@ -61,7 +62,7 @@ class Writer:
             s.text_col = col
         return s.text_row, s.text_col
 
-    def __init__(self, device, font, verbose=True):
+    def __init__(self, device, font, verbose=True, cache_size=32):
         self.devid = _get_id(device)
         self.device = device
         if self.devid not in Writer.state:
@@ -96,6 +97,13 @@ class Writer:
         self.char_height = 0
         self.char_width = 0
 
+        # Glyph cache: (ord(char) << 1 | invert) -> [FrameBuffer, last use]
+        self.cache_size = cache_size  # 0 disables caching
+        self.cache = {}
+        self.cache_tick = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def _getstate(self):
         return Writer.state[self.devid]
 
@@ -227,6 +235,39 @@ class Writer:
         self.char_height = char_height
         self.char_width = char_width
 
+    def _make_fb(self, invert):
+        buf = bytearray(self.glyph)
+        if invert:
+            for i, v in enumerate(buf):
+                buf[i] = 0xFF & ~v
+        return framebuf.FrameBuffer(buf, self.char_width, self.char_height, self.map)
+
+    # Return a FrameBuffer for the current glyph, built once and then reused.
+    # Least recently used entries are evicted when the cache is full.
+    def _cached_fb(self, char, invert):
+        self.cache_tick += 1
+        key = ord(char) << 1 | (1 if invert else 0)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache_hits += 1
+            entry[1] = self.cache_tick
+            return entry[0]
+        self.cache_misses += 1
+        fbc = self._make_fb(invert)
+        if len(self.cache) >= self.cache_size:
+            oldest = None
+            for k, e in self.cache.items():
+                if oldest is None or e[1] < self.cache[oldest][1]:
+                    oldest = k
+            del self.cache[oldest]
+        self.cache[key] = [fbc, self.cache_tick]
+        return fbc
+
+    def clear_cache(self):
+        self.cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     # Method using blitting. Efficient rendering for monochrome displays.
     # Tested on SSD1306. Invert is for black-on-white rendering.
     def _printchar(self, char, invert=False, recurse=False):
@@ -234,11 +275,10 @@ class Writer:
         self._get_char(char, recurse)
         if self.glyph is None:
             return  # All done
-        buf = bytearray(self.glyph)
-        if invert:
-            for i, v in enumerate(buf):
-                buf[i] = 0xFF & ~v
-        fbc = framebuf.FrameBuffer(buf, self.char_width, self.char_height, self.map)
+        if self.cache_size:
+            fbc = self._cached_fb(char, invert)
+        else:
+            fbc = self._make_fb(invert)
         self.device.blit(fbc, s.text_col, s.text_row)
         s.text_col += self.char_width
         self.cpos += 1
@@ -2,38 +2,63 @@
 from machine import UART, Pin, SoftI2C
 import uasyncio
 from micropyGPS import MicropyGPS
+from gnssstream import StreamDemux
 from micropython import RingIO
 from math import sqrt
 from pages import *
+from color_setup import ssd
 from assistnow import *
+from navdb import save_navdb, restore_navdb
 from RV3028 import RV3028
+from capture import Recorder, Replay
 import utime
 
+# Time zone for the clock on the display, see tz.ZONES
+TIMEZONE = "Australia/Melbourne"
+
+# AssistNow service: "online" (fresh ephemerides, cached while valid) or "offline" (weeks of MGA-ANO on flash)
+ASSIST_MODE = "online"
+
 # display mode flag
 mode = 0
 change_page = False
 
-async def uart_reader(uart, q):
-    # Wrap raw UART in StreamReader
-    reader = uasyncio.StreamReader(uart)
+# NMEA sentence types needed regardless of page (last known coordinates caching)
+CACHING_SENTENCES = ("RMC", "GGA")
+
+# Redraw at least this often without a new epoch, so the clock keeps ticking
+CLOCK_TICK_MS = 1000
+
+# Raw receiver stream capture (see capture.py): a file name to record to, and/or one to
+# replay instead of the live UART at REPLAY_SPEED (1 real time, 0 as fast as possible)
+CAPTURE_FILE = None
+REPLAY_FILE = None
+REPLAY_SPEED = 1
+
+async def uart_reader(uart, q, recorder=None):
+    # Wrap raw UART in StreamReader (a Replay already reads like one)
+    reader = uart if isinstance(uart, Replay) else uasyncio.StreamReader(uart)
+    buf = bytearray(256)
+    mv = memoryview(buf)
     while True:
-        # Non-blocking read until newline
-        line = await reader.readline()
-        if line:
-            # print(f"Received: {line.decode().strip()}")
-            q.write(line)
+        # Non-blocking read of whatever has arrived, NMEA and UBX alike
+        n = await reader.readinto(buf)
+        if n:
+            q.write(mv[:n])
+            if recorder is not None:
+                recorder.record(mv[:n])
 
         # await uasyncio.sleep_ms(2)
 
 
-async def gps_updater(gps, q):
-    # Continuously update the gps object
+async def gps_updater(demux, q):
+    # Continuously split the byte stream into NMEA sentences and UBX frames
+    buf = bytearray(256)
+    mv = memoryview(buf)
     while True:
         while q.any():
-            try:
-                gps.update(q.read(1).decode("utf-8"))
-            except UnicodeError:
-                pass
+            n = q.readinto(buf)
+            demux.feed(mv[:n])
 
         await uasyncio.sleep_ms(2)
 
@@ -47,7 +72,7 @@ async def printer(gps):
         await uasyncio.sleep_ms(1000)
 
 
-async def refresh_display(gps):  # update the oled display
+async def refresh_display(gps, epoch):  # update the oled display once per epoch
     global mode, change_page
 
     deflt = Default()
@@ -56,20 +81,32 @@ async def refresh_display(gps):  # update the oled display
 
     page_list = [deflt, qual, spdo]
 
+    # Only parse what the current page (and caching) consumes
+    gps.set_sentences(*(page_list[mode].SENTENCES + CACHING_SENTENCES))
+
     while True:
+        try:
+            await uasyncio.wait_for_ms(epoch.wait(), CLOCK_TICK_MS)
+        except uasyncio.TimeoutError:
+            pass  # no fix data, refresh for the clock only
+        epoch.clear()
+
         page = page_list[mode]
+        nav = gps.snapshot  # last complete epoch, consistent for the whole frame
 
         if change_page:
             change_page = False
-            page.load(gps)
-            page.refresh(gps)
+            gps.set_sentences(*(page.SENTENCES + CACHING_SENTENCES))
+            page.load(nav)
+            page.refresh(nav)
         else:
-            page.refresh(gps)
+            page.refresh(nav)
 
-        await uasyncio.sleep_ms(100)
+        # Send the frame in page sized chunks so the UART tasks keep running
+        await ssd.show_async()
 
 
-async def poll_button(pin):
+async def poll_button(pin, epoch):
     # Poll the button around ~50Hz for free debouncing
     global mode, change_page
     last = 1
@@ -80,16 +117,12 @@ async def poll_button(pin):
         if last == 1 and cur == 0:  # falling edge
             change_page = True
             mode = (mode + 1) % 3
+            epoch.set()  # don't wait for the next epoch to switch pages
 
         last = cur
 
         await uasyncio.sleep_ms(20)
         
-async def save_content(uart): # save on shutdown msg, not used
-    while True:
-        uart.write(b'\xb5b\t\x14\x00\x00\x1d')
-        await uasyncio.sleep(60)
-        
 async def print_time(rtc):
     while True:
         print(ubx_mga_ini_utc(rtc))
@@ -98,36 +131,47 @@ async def print_time(rtc):
 
 async def main():
     # Create GPS object and circular buffer
-    gps = MicropyGPS()
+    gps = MicropyGPS(timezone=TIMEZONE)
     q = RingIO(10000)
+    demux = StreamDemux(gps.update_sentence)
+    demux.add_ubx_handler(0x01, 0x07, gps.parse_ubx)  # UBX-NAV-PVT
+    epoch = uasyncio.Event()  # set by the parser whenever a navigation epoch is complete
+    gps.epoch_callback = epoch.set
     # lcd = LCD(I2C(scl=Pin(8), sda=Pin(9), freq=100000))
     pin = Pin(5, Pin.IN, Pin.PULL_UP)
     # Initialize UART
     uart = UART(2, baudrate=115200, tx=6, rx=7, rxbuf=10000)  # Use a non-default UART
     rtc = RV3028(i2c=SoftI2C(sda = Pin(11), scl = Pin(10))) # rtc initialisation
     
-    # Set gps time + position est
+    # Start the UART reader task, optionally recording the stream or replaying an old one
+    recorder = Recorder(CAPTURE_FILE) if CAPTURE_FILE else None
+    source = Replay(REPLAY_FILE, REPLAY_SPEED) if REPLAY_FILE else uart
+    uasyncio.create_task(uart_reader(source, q, recorder))
+
+    # Start the GPS updater
+    uasyncio.create_task(gps_updater(demux, q))
+
+    # Start the display updater
+    uasyncio.create_task(refresh_display(gps, epoch))
+
+    # Start the button poller
+    uasyncio.create_task(poll_button(pin, epoch))
+
+    # Give the receiver back its saved navigation database (acknowledged through the demux),
+    # then set gps time + position est
+    await restore_navdb(uart, demux)
     uart.write(ubx_mga_ini_utc(rtc))
     uart.write(ubx_mga_ini_pos())
 
-    # Start the AssistNow task
-    uasyncio.create_task(assist_now(uart, rtc))
+    # Start the AssistNow task, acknowledgements come back through the demux
+    uasyncio.create_task(assist_now(uart, rtc, demux, ASSIST_MODE))
 
-    # Start the UART reader task
-    uasyncio.create_task(uart_reader(uart, q))
-
-    # Start the GPS updater
-    uasyncio.create_task(gps_updater(gps, q))
+    # Start the navigation database saving task
+    uasyncio.create_task(save_navdb(uart, demux, gps))
 
     # Start the logger
     # uasyncio.create_task(print_time(rtc))
 
-    # Start the display updater
-    uasyncio.create_task(refresh_display(gps))
-
-    # Start the button poller
-    uasyncio.create_task(poll_button(pin))
-    
     # Start the last known coordinates caching task
     uasyncio.create_task(caching(gps, rtc))
 
@@ -137,8 +181,9 @@ async def main():
         await uasyncio.sleep(1)
 
 
-# Run the event loop
-try:
-    uasyncio.run(main())
-except KeyboardInterrupt:
-    print("Stopped")
+# Run the event loop (main.py runs as __main__ on the board; sim/run.py imports it)
+if __name__ == "__main__":
+    try:
+        uasyncio.run(main())
+    except KeyboardInterrupt:
+        print("Stopped")
@@ -8,9 +8,13 @@
 # Time Since First Fix
 # Distance/Time to Target
 # More Helper Functions
-# Dynamically limit sentences types to parse
 
-from math import floor, modf
+from array import array
+from math import floor, sqrt
+from struct import unpack_from
+
+from tz import TimeZone, seconds_since_2000, time_tuple
+from gnssstream import find_byte
 
 # Import utime or time for fix time handling
 try:
@@ -21,17 +25,185 @@ except ImportError:
     # Should still support millisecond resolution.
     import time
 
+# Tick counters for the optional per sentence statistics
+try:
+    from utime import ticks_ms, ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter_ns
+
+    # Wrap like the board's, so the values fit the statistics arrays
+    def ticks_ms():
+        return (perf_counter_ns() // 1000000) & 0x3FFFFFFF
+
+    def ticks_us():
+        return (perf_counter_ns() // 1000) & 0x3FFFFFFF
+
+    def ticks_diff(ticks1, ticks2):
+        return ((ticks1 - ticks2 + 0x20000000) & 0x3FFFFFFF) - 0x20000000
+
+# Per sentence type statistics record, see MicropyGPS.enable_stats()
+_STAT_RECEIVED = 0  # Complete sentences seen, including filtered and corrupt ones
+_STAT_PARSED = 1
+_STAT_REJECTED = 2  # Passed the CRC check but unsupported or failed to parse
+_STAT_CRC_FAILS = 3
+_STAT_FILTERED = 4
+_STAT_PARSE_US = 5  # Cumulative time spent in the sentence function
+_STAT_LAST_MS = 6  # ticks_ms() of the last arrival
+_STAT_GAP_MS = 7  # Cumulative time between arrivals
+_STAT_GAP_MAX_MS = 8
+_STAT_SIZE = 9
+
+
+def _hex_value(char):
+    """Value of a single ASCII hex digit, -1 if it isn't one"""
+    if 48 <= char <= 57:  # 0-9
+        return char - 48
+    if 65 <= char <= 70:  # A-F
+        return char - 55
+    if 97 <= char <= 102:  # a-f
+        return char - 87
+    return -1
+
+
+class SatelliteTable(object):
+    """Satellites in view across all constellations, in preallocated arrays with one slot per (gnssId, svid).
+    gnssId and svid follow UBX numbering, so NMEA satellite numbers are translated by the GSV parser. Slots are
+    stamped with the epoch they were last reported in and age out once they haven't been seen for max_age epochs"""
+
+    # UBX gnssId
+    GPS = 0
+    SBAS = 1
+    GALILEO = 2
+    BEIDOU = 3
+    QZSS = 5
+    GLONASS = 6
+
+    NO_DATA = -1  # Elevation, azimuth or SNR not reported (satellite not tracked)
+
+    # First svid and number of slots for each gnssId
+    _FIRST_SVID = (1, 120, 1, 1, 0, 1, 1)
+    _SIZE = (32, 39, 36, 63, 0, 10, 32)
+    _BASE = (0, 32, 71, 107, 170, 170, 180)
+    SLOTS = 212
+
+    # gnssId and svid of each slot
+    slot_gnss = array("B", [0] * SLOTS)
+    slot_svid = array("B", [0] * SLOTS)
+    for _gnss in range(len(_SIZE)):
+        for _i in range(_SIZE[_gnss]):
+            slot_gnss[_BASE[_gnss] + _i] = _gnss
+            slot_svid[_BASE[_gnss] + _i] = _FIRST_SVID[_gnss] + _i
+    del _gnss, _i
+
+    def __init__(self, max_age=5):
+        self.max_age = max_age
+        self.epoch = 0  # Number of the last complete epoch
+        self.elevation = array("b", [-1] * self.SLOTS)  # degrees
+        self.azimuth = array("h", [-1] * self.SLOTS)  # degrees
+        self.snr = array("b", [-1] * self.SLOTS)  # dB-Hz, strongest signal this epoch
+        self.signal = array("B", [0] * self.SLOTS)  # NMEA 4.1 signal ID of that signal, 0 if not reported
+        self.seen = array("I", [0] * self.SLOTS)  # Epoch the satellite was last reported in, 0 never
+        self.in_view = array("B", [0] * len(self._SIZE))  # Satellites in view per gnssId, as reported by GSV
+        self.in_view_seen = array("I", [0] * len(self._SIZE))  # Epoch each in_view count was last reported in
+
+    @classmethod
+    def slot(cls, gnss, svid):
+        """Slot of satellite svid of constellation gnss, -1 if it has none"""
+        if not 0 <= gnss < len(cls._SIZE):
+            return -1
+        index = svid - cls._FIRST_SVID[gnss]
+        if not 0 <= index < cls._SIZE[gnss]:
+            return -1
+        return cls._BASE[gnss] + index
+
+    def update(self, slot, elevation, azimuth, snr, signal):
+        """Record a satellite reported in the epoch after self.epoch. A satellite reported on several signals keeps
+        the strongest one"""
+        epoch = self.epoch + 1
+        if self.seen[slot] == epoch and snr <= self.snr[slot]:
+            return
+        self.elevation[slot] = elevation
+        self.azimuth[slot] = azimuth
+        self.snr[slot] = snr
+        self.signal[slot] = signal
+        self.seen[slot] = epoch
+
+    def set_in_view(self, gnss, count):
+        """Record the in view count GSV reports for gnss in the epoch after self.epoch, keeping the largest if
+        several signals report one"""
+        epoch = self.epoch + 1
+        if self.in_view_seen[gnss] != epoch or count > self.in_view[gnss]:
+            self.in_view[gnss] = min(count, 255)
+            self.in_view_seen[gnss] = epoch
+
+    def expire(self):
+        """Zero the in view counts of constellations not reported for max_age epochs, as their slots age out"""
+        for gnss in range(len(self.in_view)):
+            if self.in_view[gnss] and self.epoch - self.in_view_seen[gnss] >= self.max_age:
+                self.in_view[gnss] = 0
+
+    def visible(self, slot):
+        seen = self.seen[slot]
+        return seen != 0 and self.epoch - seen < self.max_age
+
+    def slots(self):
+        """Slots of the satellites currently in view"""
+        for slot in range(self.SLOTS):
+            if self.visible(slot):
+                yield slot
+
+    def count(self):
+        return sum(self.in_view)
+
+    def copy_from(self, other):
+        """Make this table a copy of other, without allocating"""
+        self.max_age = other.max_age
+        self.epoch = other.epoch
+        self.elevation[:] = other.elevation
+        self.azimuth[:] = other.azimuth
+        self.snr[:] = other.snr
+        self.signal[:] = other.signal
+        self.seen[:] = other.seen
+        self.in_view[:] = other.in_view
+        self.in_view_seen[:] = other.in_view_seen
+
+
+class _LocalClock(object):
+    """UTC to local time for GPSData's date/time helpers. The last conversion and the strings made from it are kept,
+    keyed on the UTC date and time"""
+
+    def __init__(self, zone):
+        self.zone = zone
+
+        # Last conversion, and the strings made from it (None until asked for)
+        self._date_key = -1
+        self._time_key = -1
+        self.local = None
+        self.date_str = None
+        self.time_str = None
+        self.hm_str = None
+
+    def local_time(self, date, timestamp):
+        """Local time tuple for UTC date (day, month, yy) and timestamp [hours, minutes, seconds]"""
+        date_key = date[0] | (date[1] << 5) | (date[2] << 9)
+        time_key = timestamp[0] * 3600 + timestamp[1] * 60 + timestamp[2]
+        if date_key == self._date_key and time_key == self._time_key:
+            return self.local
+
+        utc = seconds_since_2000(2000 + date[2], date[1], date[0], timestamp[0], timestamp[1], timestamp[2])
+        self.local = time_tuple(self.zone.to_local(utc))
+        self._date_key = date_key
+        self._time_key = time_key
+        self.date_str = None
+        self.time_str = None
+        self.hm_str = None
+        return self.local
+
+
+class GPSData(object):
+    """Navigation data decoded from the receiver and the helpers that present it. MicropyGPS keeps it up to date
+    sentence by sentence, NavSnapshot holds a copy taken at the end of an epoch"""
 
-class MicropyGPS(object):
-    """GPS NMEA Sentence Parser. Creates object that stores all relevant GPS data and statistics.
-    Parses sentences one character at a time using update()."""
-
-    # Max Number of Characters a valid sentence can be (based on GGA sentence)
-    SENTENCE_LIMIT = 90
-    __HEMISPHERES = ("N", "S", "E", "W")
-    __NO_FIX = 1
-    __FIX_2D = 2
-    __FIX_3D = 3
     __DIRECTIONS = (
         "N",
         "NNE",
@@ -66,47 +238,50 @@ class MicropyGPS(object):
     )
     __DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
-    def __init__(self, local_offset=0, location_formatting="dms"):
-        """
-        Setup GPS Object Status Flags, Internal Data Registers, etc
-            local_offset (int): Timzone Difference to UTC
-            location_formatting (str): Style For Presenting Longitude/Latitude:
-                                       Decimal Degree Minute (ddm) - 40° 26.767′ N
-                                       Degrees Minutes Seconds (dms) - 40° 26′ 46″ N
-                                       Decimal Degrees (dd) - 40.446° N
-        """
-
-        #####################
-        # Object Status Flags
-        self.sentence_active = False
-        self.active_segment = 0
-        self.process_crc = False
-        self.gps_segments = []
-        self.crc_xor = 0
-        self.char_count = 0
-        self.fix_time = 0
-
-        #####################
-        # Sentence Statistics
-        self.crc_fails = 0
-        self.clean_sentences = 0
-        self.parsed_sentences = 0
-
-        #####################
-        # Logging Related
-        self.log_handle = None
-        self.log_en = False
+    # Everything a snapshot copies at the end of an epoch besides the satellite table. Parsers replace these values
+    # rather than change them in place, so copying the references is enough
+    NAV_FIELDS = (
+        "timestamp",
+        "date",
+        "local_offset",
+        "_clock",
+        "lat_e7",
+        "lon_e7",
+        "coord_format",
+        "speed",
+        "course",
+        "altitude",
+        "geoid_height",
+        "std_lat",
+        "std_lon",
+        "std_alt",
+        "satellites_in_view",
+        "satellites_in_use",
+        "satellites_used",
+        "hdop",
+        "pdop",
+        "vdop",
+        "valid",
+        "fix_stat",
+        "fix_type",
+    )
 
+    def __init__(self, local_offset=0, location_formatting="dms", timezone=None):
         #####################
         # Data From Sentences
-        # Time
+        # Time, in UTC
         self.timestamp = [0, 0, 0]
         self.date = [0, 0, 0]
         self.local_offset = local_offset
+        if timezone is None:
+            timezone = local_offset
+        if not isinstance(timezone, TimeZone):
+            timezone = TimeZone(timezone)
+        self._clock = _LocalClock(timezone)  # Memoized local time, shared with snapshots
 
         # Position/Motion
-        self._latitude = [0, 0.0, "N"]
-        self._longitude = [0, 0.0, "W"]
+        self.lat_e7 = 0  # Signed 1e-7 degrees, as UBX has them
+        self.lon_e7 = 0
         self.coord_format = location_formatting
         self.speed = [0.0, 0.0, 0.0]
         self.course = 0.0
@@ -122,7 +297,7 @@ class MicropyGPS(object):
         self.satellites_used = []
         self.last_sv_sentence = 0
         self.total_sv_sentences = 0
-        self.satellite_data = dict()
+        self.satellites = SatelliteTable()
         self.hdop = 0.0
         self.pdop = 0.0
         self.vdop = 0.0
@@ -132,62 +307,350 @@ class MicropyGPS(object):
 
     ########################################
     # Coordinates Translation Functions
+    # Positions are kept as signed integer 1e-7 degrees (lat_e7, lon_e7), everything else is derived from them
     ########################################
+    @staticmethod
+    def _coordinate(value, coord_format, positive, negative):
+        """Split signed 1e-7 degrees into the list for coord_format, working in integers as long as possible"""
+        hemi = negative if value < 0 else positive
+        value = abs(value)
+        degrees = value // 10000000
+        minutes_e7 = (value % 10000000) * 60  # fraction of a degree in 1e-7 minutes
+        if coord_format == "dd":
+            return [value / 10000000, hemi]
+        elif coord_format == "dms":
+            seconds = ((minutes_e7 % 10000000) * 60 + 5000000) // 10000000
+            return [degrees, minutes_e7 // 10000000, seconds, hemi]
+        else:  # Decimal minutes to the 5 places NMEA gives, which is as fine as 1e-7 degrees resolves
+            return [degrees, ((minutes_e7 + 50) // 100) / 100000, hemi]
+
     @property
     def latitude(self):
         """Format Latitude Data Correctly"""
-        if self.coord_format == "dd":
-            decimal_degrees = self._latitude[0] + (self._latitude[1] / 60)
-            return [decimal_degrees, self._latitude[2]]
-        elif self.coord_format == "dms":
-            minute_parts = modf(self._latitude[1])
-            seconds = round(minute_parts[0] * 60)
-            return [self._latitude[0], int(minute_parts[1]), seconds, self._latitude[2]]
-        else:
-            return self._latitude
+        return self._coordinate(self.lat_e7, self.coord_format, "N", "S")
 
     @property
     def longitude(self):
         """Format Longitude Data Correctly"""
+        return self._coordinate(self.lon_e7, self.coord_format, "E", "W")
+
+    @property
+    def _latitude(self):
+        """Latitude as [degrees, float minutes, hemisphere], as it used to be stored"""
+        return self._coordinate(self.lat_e7, "ddm", "N", "S")
+
+    @property
+    def _longitude(self):
+        """Longitude as [degrees, float minutes, hemisphere], as it used to be stored"""
+        return self._coordinate(self.lon_e7, "ddm", "E", "W")
+
+    #########################################
+    # User Helper Functions
+    # These functions make working with the GPS object data easier
+    #########################################
+
+    @property
+    def satellite_data(self):
+        """Satellites in view as a dict of (gnssId, svid): (elevation, azimuth, snr), None where not reported.
+        Allocates, so the display reads self.satellites directly"""
+        sats = self.satellites
+        data = dict()
+        for slot in sats.slots():
+            values = (sats.elevation[slot], sats.azimuth[slot], sats.snr[slot])
+            data[(sats.slot_gnss[slot], sats.slot_svid[slot])] = tuple(None if v == sats.NO_DATA else v for v in values)
+        return data
+
+    def satellites_visible(self):
+        """
+        Returns a list of the (gnssId, svid) of the satellites currently visible to the receiver
+        :return: list
+        """
+        sats = self.satellites
+        return [(sats.slot_gnss[slot], sats.slot_svid[slot]) for slot in sats.slots()]
+
+    def compass_direction(self):
+        """
+        Determine a cardinal or inter-cardinal direction based on current course.
+        :return: string
+        """
+        # Calculate the offset for a rotated compass
+        if self.course >= 348.75:
+            offset_course = 360 - self.course
+        else:
+            offset_course = self.course + 11.25
+
+        # Each compass point is separated by 22.5 degrees, divide to find lookup value
+        dir_index = floor(offset_course / 22.5)
+
+        final_dir = self.__DIRECTIONS[dir_index]
+
+        return final_dir
+
+    def latitude_string(self):
+        """
+        Create a readable string of the current latitude data
+        :return: string
+        """
+        if self.coord_format == "dd":
+            formatted_latitude = self.latitude
+            lat_string = str(formatted_latitude[0]) + "° " + formatted_latitude[1]
+        elif self.coord_format == "dms":
+            formatted_latitude = self.latitude
+            lat_string = (
+                str(formatted_latitude[0])
+                + "° "
+                + str(formatted_latitude[1])
+                + "' "
+                + str(formatted_latitude[2])
+                + '" '
+                + str(formatted_latitude[3])
+            )
+        else:
+            formatted_latitude = self.latitude
+            lat_string = (
+                str(formatted_latitude[0])
+                + "° "
+                + str(formatted_latitude[1])
+                + "' "
+                + formatted_latitude[2]
+            )
+        return lat_string
+
+    def longitude_string(self):
+        """
+        Create a readable string of the current longitude data
+        :return: string
+        """
         if self.coord_format == "dd":
-            decimal_degrees = self._longitude[0] + (self._longitude[1] / 60)
-            return [decimal_degrees, self._longitude[2]]
+            formatted_longitude = self.longitude
+            lon_string = str(formatted_longitude[0]) + "° " + formatted_longitude[1]
         elif self.coord_format == "dms":
-            minute_parts = modf(self._longitude[1])
-            seconds = round(minute_parts[0] * 60)
-            return [
-                self._longitude[0],
-                int(minute_parts[1]),
-                seconds,
-                self._longitude[2],
-            ]
+            formatted_longitude = self.longitude
+            lon_string = (
+                str(formatted_longitude[0])
+                + "° "
+                + str(formatted_longitude[1])
+                + "' "
+                + str(formatted_longitude[2])
+                + '" '
+                + str(formatted_longitude[3])
+            )
+        else:
+            formatted_longitude = self.longitude
+            lon_string = (
+                str(formatted_longitude[0])
+                + "° "
+                + str(formatted_longitude[1])
+                + "' "
+                + formatted_longitude[2]
+            )
+        return lon_string
+
+    def speed_string(self, unit="kph"):
+        """
+        Creates a readable string of the current speed data in one of three units
+        :param unit: string of 'kph','mph, or 'knot'
+        :return:
+        """
+        if unit == "mph":
+            speed_string = str(self.speed[1]) + " mph"
+
+        elif unit == "knot":
+            if self.speed[0] == 1:
+                unit_str = " knot"
+            else:
+                unit_str = " knots"
+            speed_string = str(self.speed[0]) + unit_str
+
         else:
-            return self._longitude
+            speed_string = f"{self.speed[2]:.2f} km/h"
+
+        return speed_string
+
+    def get_local_time(self, timezone=None):
+        """
+        Get local time tuple (year, month, mday, hour, minute, second, weekday, yearday) in the time zone selected at
+        construction, memoized so the conversion only happens once per new timestamp. timezone (a tz.TimeZone, zone
+        name or hours east of UTC) converts to some other zone instead.
+        """
+        if timezone is None:
+            return self._clock.local_time(self.date, self.timestamp)
+
+        if not isinstance(timezone, TimeZone):
+            timezone = TimeZone(timezone)
+        utc = seconds_since_2000(
+            2000 + self.date[2], self.date[1], self.date[0], self.timestamp[0], self.timestamp[1], self.timestamp[2]
+        )
+        return time_tuple(timezone.to_local(utc))
+
+    def date_string(self, formatting="s_dmy", century="20"):
+        """
+        Creates a readable string of the current date at local timezone.
+        """
+        clock = self._clock
+        tt = self.get_local_time()
+        if clock.date_str is None:
+            clock.date_str = f"{self.__DAYS[tt[6]]} {tt[2]} {self.__MONTHS[tt[1] - 1]} {tt[0]}"
+        return clock.date_str
+
+    def time_string(self, seconds=True):
+        """Return a formatted time string in the selected time zone"""
+        clock = self._clock
+        time_tuple = self.get_local_time()
+        if clock.time_str is None:
+            am_pm = "AM" if time_tuple[3] < 12 else "PM"
+            hour = 12 if time_tuple[3] in (0, 12) else time_tuple[3] % 12
+            clock.hm_str = f"{hour}:{time_tuple[4]:02d} {am_pm}"
+            clock.time_str = f"{hour}:{time_tuple[4]:02d}:{time_tuple[5]:02d} {am_pm}"
+
+        return clock.time_str if seconds else clock.hm_str
+
+
+class NavSnapshot(GPSData):
+    """The navigation data of one complete epoch. MicropyGPS fills one in and swaps it in as MicropyGPS.snapshot
+    when the epoch ends, so a consumer reading it never sees fields from two different epochs. Treat it as read
+    only, and don't hold on to it for longer than an epoch: there are only two, and they are reused in turn"""
+
+    def __init__(self, local_offset=0, location_formatting="dms", timezone=None):
+        super().__init__(local_offset, location_formatting, timezone)
+        self.epoch = 0  # MicropyGPS.epoch_count when the snapshot was taken
+        self.utc_stamp = -1  # UTC time the epoch was grouped by, hhmmssmmm
+
+    def _copy(self, gps, epoch, utc_stamp):
+        for name in self.NAV_FIELDS:
+            setattr(self, name, getattr(gps, name))
+        self.satellites.copy_from(gps.satellites)
+        self.epoch = epoch
+        self.utc_stamp = utc_stamp
+
+
+class MicropyGPS(GPSData):
+    """GPS NMEA Sentence Parser. Creates object that stores all relevant GPS data and statistics.
+    Parses sentences one character at a time using update(), or a whole line at a time using update_sentence()."""
+
+    # Max Number of Characters a valid sentence can be (based on GGA sentence)
+    SENTENCE_LIMIT = 90
+    # Max Number of Fields a sentence can be split into (GSV with 4 satellites, signal ID and CRC is 22)
+    FIELD_LIMIT = 24
+    # Bytes collected before the log file is written to
+    LOG_BUFFER = 512
+    __HEMISPHERES = ("N", "S", "E", "W")
+    __HEMISPHERE_CHARS = {78: "N", 83: "S", 69: "E", 87: "W"}
+    __NO_FIX = 1
+    __FIX_2D = 2
+    __FIX_3D = 3
+    # GSV talker ID (packed as in gpgsv()) to gnssId
+    __GSV_TALKERS = {
+        0x4750: SatelliteTable.GPS,  # GP
+        0x474C: SatelliteTable.GLONASS,  # GL
+        0x4741: SatelliteTable.GALILEO,  # GA
+        0x4742: SatelliteTable.BEIDOU,  # GB
+        0x4244: SatelliteTable.BEIDOU,  # BD
+        0x4751: SatelliteTable.QZSS,  # GQ
+    }
+
+    def __init__(self, local_offset=0, location_formatting="dms", timezone=None):
+        """
+        Setup GPS Object Status Flags, Internal Data Registers, etc
+            local_offset (int): Timzone Difference to UTC in hours, used when no timezone is given
+            location_formatting (str): Style For Presenting Longitude/Latitude:
+                                       Decimal Degree Minute (ddm) - 40° 26.767′ N
+                                       Degrees Minutes Seconds (dms) - 40° 26′ 46″ N
+                                       Decimal Degrees (dd) - 40.446° N
+            timezone (str or tz.TimeZone): Zone from tz.ZONES for local date and time, with its daylight saving rules.
+                                           timestamp and date stay in UTC either way
+        """
+        super().__init__(local_offset, location_formatting, timezone)
+
+        #####################
+        # Object Status Flags
+        self.sentence_active = False
+        self.active_segment = 0
+        self.process_crc = False
+        self.crc_xor = 0
+        self.char_count = 0
+        self.fix_time = 0
+
+        #####################
+        # Tokenizer State
+        # Reused line buffer for update(), and preallocated field start/end offsets into
+        # whichever buffer holds the current sentence (see update_sentence())
+        self._line = bytearray(self.SENTENCE_LIMIT)
+        self._line_len = 0
+        self._buf = self._line
+        self._field_start = array("H", [0] * self.FIELD_LIMIT)
+        self._field_end = array("H", [0] * self.FIELD_LIMIT)
+        self._field_count = 0
+
+        #####################
+        # Sentence Statistics
+        self.crc_fails = 0
+        self.clean_sentences = 0
+        self.parsed_sentences = 0
+        self.filtered_sentences = 0
+
+        # Per sentence type counters, None while disabled (see enable_stats())
+        self._stats = None
+        self._stat = None  # Record of the sentence being processed
+
+        #####################
+        # Sentence Filter
+        # Set of enabled sentence type keys (see _type_key()), None to parse everything
+        self.sentence_filter = None
+
+        #####################
+        # Epoch Tracking
+        # epoch_callback() is called once all the sentences of a navigation epoch have been parsed and snapshot updated
+        self.epoch_callback = None
+        self.epoch_count = 0
+        self._utc_stamp = -1  # UTC time of the last timestamped sentence, hhmmssmmm
+        self._epoch_stamp = -1
+        self._epoch_done = False
+        self._epoch_last = None  # Type of the last sentence parsed
+        self._epoch_end = None  # Learned type of the sentence that closes an epoch
+        self._ubx_epochs = False  # NAV-PVT marks epochs itself
+
+        # Consistent copy of the navigation data as of the last complete epoch. Two snapshots are used in turn,
+        # the one not published is filled in and then swapped in, so nothing is allocated per epoch
+        zone = self._clock.zone
+        self.snapshot = NavSnapshot(local_offset, location_formatting, zone)
+        self._snapshot_back = NavSnapshot(local_offset, location_formatting, zone)
+
+        #####################
+        # Logging Related
+        self.log_handle = None
+        self.log_en = False
+        self._log_buf = None
+        self._log_len = 0
 
     ########################################
     # Logging Related Functions
     ########################################
     def start_logging(self, target_file, mode="append"):
         """
-        Create GPS data log object
+        Create GPS data log object. Everything fed to the parser is collected in a LOG_BUFFER byte buffer
+        and written out when it fills up. For the raw receiver stream with timing, see capture.Recorder
         """
         # Set Write Mode Overwrite or Append
-        mode_code = "w" if mode == "new" else "a"
+        mode_code = "wb" if mode == "new" else "ab"
 
         try:
             self.log_handle = open(target_file, mode_code)
-        except AttributeError:
+        except (AttributeError, TypeError):
             print("Invalid FileName")
             return False
 
+        self._log_buf = bytearray(self.LOG_BUFFER)
+        self._log_len = 0
         self.log_en = True
         return True
 
     def stop_logging(self):
         """
-        Closes the log file handler and disables further logging
+        Writes out what is buffered, closes the log file handler and disables further logging
         """
         try:
+            self._log_flush()
             self.log_handle.close()
         except AttributeError:
             print("Invalid Handle")
@@ -196,14 +659,191 @@ class MicropyGPS(object):
         self.log_en = False
         return True
 
+    def _log_flush(self):
+        if self._log_len:
+            self.log_handle.write(memoryview(self._log_buf)[: self._log_len])
+            self._log_len = 0
+
+    def _log_char(self, char):
+        """Buffer one character code from update() without allocating"""
+        self._log_buf[self._log_len] = char
+        self._log_len += 1
+        if self._log_len == len(self._log_buf):
+            self._log_flush()
+
     def write_log(self, log_string):
-        """Attempts to write the last valid NMEA sentence character to the active file handler"""
+        """Adds log_string (str, bytes or a buffer slice) to the log, writing to the file handler in batches"""
+        if isinstance(log_string, str):
+            log_string = log_string.encode()
         try:
-            self.log_handle.write(log_string)
-        except TypeError:
+            n = len(log_string)
+            if self._log_len + n > len(self._log_buf):
+                self._log_flush()
+            if n >= len(self._log_buf):  # Doesn't fit, write it as it is
+                self.log_handle.write(log_string)
+            else:
+                self._log_buf[self._log_len : self._log_len + n] = log_string
+                self._log_len += n
+        except (AttributeError, OSError):
             return False
         return True
 
+    ########################################
+    # Field Accessors
+    # Fields are stored as start/end offsets into the current line buffer,
+    # so nothing is allocated until a value is actually converted
+    ########################################
+    @property
+    def gps_segments(self):
+        """List of the fields of the current sentence as strings. Allocates, so parsers use the _field_* accessors"""
+        return [self._field(i) for i in range(self._field_count)]
+
+    def _field_len(self, i):
+        """Length of field i of the current sentence"""
+        if i >= self._field_count:
+            raise IndexError("NMEA field out of range")
+        return self._field_end[i] - self._field_start[i]
+
+    def _field(self, i):
+        """Field i of the current sentence as a string"""
+        if i >= self._field_count:
+            raise IndexError("NMEA field out of range")
+        return str(self._buf[self._field_start[i] : self._field_end[i]], "ascii")
+
+    def _field_char(self, i):
+        """Single character field i as a byte value, 0 if the field is empty or longer than one character"""
+        if self._field_len(i) != 1:
+            return 0
+        return self._buf[self._field_start[i]]
+
+    def _field_int(self, i, offset=0, length=255):
+        """Convert (part of) field i to an int. Raises ValueError like int() would"""
+        if i >= self._field_count:
+            raise IndexError("NMEA field out of range")
+        buf = self._buf
+        pos = self._field_start[i] + offset
+        end = min(self._field_end[i], pos + length)
+        if pos >= end:
+            raise ValueError("Empty NMEA field")
+
+        negative = buf[pos] == 45  # '-'
+        if negative:
+            pos += 1
+            if pos >= end:
+                raise ValueError("Bad NMEA integer")
+
+        value = 0
+        while pos < end:
+            digit = buf[pos] - 48
+            if not 0 <= digit <= 9:
+                raise ValueError("Bad NMEA integer")
+            value = value * 10 + digit
+            pos += 1
+
+        return -value if negative else value
+
+    def _field_float(self, i, offset=0):
+        """Convert (part of) field i to a float. Raises ValueError like float() would"""
+        if i >= self._field_count:
+            raise IndexError("NMEA field out of range")
+        buf = self._buf
+        pos = self._field_start[i] + offset
+        end = self._field_end[i]
+        if pos >= end:
+            raise ValueError("Empty NMEA field")
+
+        negative = buf[pos] == 45  # '-'
+        if negative:
+            pos += 1
+
+        value = 0
+        digits = 0
+        decimals = -1
+        while pos < end:
+            char = buf[pos]
+            if char == 46 and decimals < 0:  # '.'
+                decimals = 0
+            else:
+                digit = char - 48
+                if not 0 <= digit <= 9:
+                    raise ValueError("Bad NMEA number")
+                value = value * 10 + digit
+                digits += 1
+                if decimals >= 0:
+                    decimals += 1
+            pos += 1
+
+        if not digits:
+            raise ValueError("Bad NMEA number")
+
+        if negative:
+            value = -value
+
+        # Dividing the exact integer mantissa gives the same correctly rounded result as float()
+        return value / 10 ** decimals if decimals > 0 else float(value)
+
+    def _field_coord(self, i, degree_digits):
+        """ddmm.mmmm (latitude, degree_digits 2) or dddmm.mmmm (longitude, 3) field i as unsigned integer 1e-7
+        degrees, converted straight from the digits. Minute decimals beyond the seventh are ignored. Raises
+        ValueError like int() would"""
+        degrees = self._field_int(i, 0, degree_digits)
+        minutes = self._field_int(i, degree_digits, 2)
+
+        # Decimal minutes as 1e-7 minutes
+        buf = self._buf
+        pos = self._field_start[i] + degree_digits + 2
+        end = self._field_end[i]
+        fraction = 0
+        if pos < end:
+            if buf[pos] != 46:  # '.'
+                raise ValueError("Bad NMEA coordinate")
+            pos += 1
+            scale = 10000000
+            while pos < end and scale > 1:
+                digit = buf[pos] - 48
+                if not 0 <= digit <= 9:
+                    raise ValueError("Bad NMEA coordinate")
+                scale //= 10
+                fraction += digit * scale
+                pos += 1
+
+        return degrees * 10000000 + (minutes * 10000000 + fraction + 30) // 60
+
+    def _field_hex(self, i):
+        """Two digit hex field i (the checksum) as an int, -1 if it is malformed"""
+        if self._field_len(i) != 2:
+            return -1
+        pos = self._field_start[i]
+        high = _hex_value(self._buf[pos])
+        low = _hex_value(self._buf[pos + 1])
+        if high < 0 or low < 0:
+            return -1
+        return (high << 4) | low
+
+    def _field_hemisphere(self, i):
+        """Hemisphere field i as one of the shared 'N', 'S', 'E', 'W' strings, None if invalid"""
+        return self.__HEMISPHERE_CHARS.get(self._field_char(i))
+
+    def _field_utc(self, i):
+        """hhmmss[.ss] field i as UTC [hours, minutes, seconds], [0, 0, 0] if empty.
+        Also keeps the full UTC time including fractional seconds as an int (hhmmssmmm) to tell epochs apart"""
+        stamp = self._field_stamp(i)
+        self._utc_stamp = stamp
+        if stamp < 0:  # No Time stamp yet
+            return [0, 0, 0]
+        return [self._field_int(i, 0, 2), self._field_int(i, 2, 2), self._field_int(i, 4, 2)]
+
+    def _field_stamp(self, i):
+        """hhmmss[.ss] field i as an int (hhmmssmmm), -1 if empty. Raises ValueError if it is malformed"""
+        length = self._field_len(i)
+        if not length:
+            return -1
+        millis = 0
+        if length > 7:
+            digits = min(length - 7, 3)
+            millis = self._field_int(i, 7, digits) * 10 ** (3 - digits)
+        return self._field_int(i, 0, 6) * 1000 + millis
+
     ########################################
     # Sentence Parsers
     ########################################
@@ -214,29 +854,18 @@ class MicropyGPS(object):
 
         # UTC Timestamp
         try:
-            utc_string = self.gps_segments[1]
-
-            if utc_string:  # Possible timestamp found
-                hours = (int(utc_string[0:2]) + self.local_offset) % 24
-                minutes = int(utc_string[2:4])
-                seconds = int(utc_string[4:6])
-                self.timestamp = [hours, minutes, seconds]
-            else:  # No Time stamp yet
-                self.timestamp = [0, 0, 0]
-
+            self.timestamp = self._field_utc(1)
         except ValueError:  # Bad Timestamp value present
             return False
 
         # Date stamp
         try:
-            date_string = self.gps_segments[9]
-
             # Date string printer function assumes to be year >=2000,
             # date_string() must be supplied with the correct century argument to display correctly
-            if date_string:  # Possible date stamp found
-                day = int(date_string[0:2])
-                month = int(date_string[2:4])
-                year = int(date_string[4:6])
+            if self._field_len(9):  # Possible date stamp found
+                day = self._field_int(9, 0, 2)
+                month = self._field_int(9, 2, 2)
+                year = self._field_int(9, 4, 2)
                 self.date = (day, month, year)
             else:  # No Date stamp yet
                 self.date = (0, 0, 0)
@@ -245,39 +874,35 @@ class MicropyGPS(object):
             return False
 
         # Check Receiver Data Valid Flag
-        if self.gps_segments[2] == "A":  # Data from Receiver is Valid/Has Fix
+        if self._field_char(2) == 65:  # 'A' Data from Receiver is Valid/Has Fix
             # Longitude / Latitude
             try:
-                # Latitude
-                l_string = self.gps_segments[3]
-                lat_degs = int(l_string[0:2])
-                lat_mins = float(l_string[2:])
-                lat_hemi = self.gps_segments[4]
-
-                # Longitude
-                l_string = self.gps_segments[5]
-                lon_degs = int(l_string[0:3])
-                lon_mins = float(l_string[3:])
-                lon_hemi = self.gps_segments[6]
+                # Latitude, 1e-7 deg
+                lat = self._field_coord(3, 2)
+                lat_hemi = self._field_hemisphere(4)
+
+                # Longitude, 1e-7 deg
+                lon = self._field_coord(5, 3)
+                lon_hemi = self._field_hemisphere(6)
             except ValueError:
                 return False
 
-            if lat_hemi not in self.__HEMISPHERES:
+            if lat_hemi is None:
                 return False
 
-            if lon_hemi not in self.__HEMISPHERES:
+            if lon_hemi is None:
                 return False
 
             # Speed
             try:
-                spd_knt = float(self.gps_segments[7])
+                spd_knt = self._field_float(7)
             except ValueError:
                 return False
 
             # Course
             try:
-                if self.gps_segments[8]:
-                    course = float(self.gps_segments[8])
+                if self._field_len(8):
+                    course = self._field_float(8)
                 else:
                     course = 0.0
             except ValueError:
@@ -286,8 +911,8 @@ class MicropyGPS(object):
             # TODO - Add Magnetic Variation
 
             # Update Object Data
-            self._latitude = [lat_degs, lat_mins, lat_hemi]
-            self._longitude = [lon_degs, lon_mins, lon_hemi]
+            self.lat_e7 = -lat if lat_hemi == "S" else lat
+            self.lon_e7 = -lon if lon_hemi == "W" else lon
             # Include mph and hm/h
             self.speed = [spd_knt, spd_knt * 1.151, spd_knt * 1.852]
             self.course = course
@@ -297,8 +922,8 @@ class MicropyGPS(object):
             self.new_fix_time()
 
         else:  # Clear Position Data if Sentence is 'Invalid'
-            self._latitude = [0, 0.0, "N"]
-            self._longitude = [0, 0.0, "W"]
+            self.lat_e7 = 0
+            self.lon_e7 = 0
             self.speed = [0.0, 0.0, 0.0]
             self.course = 0.0
             self.valid = False
@@ -311,54 +936,41 @@ class MicropyGPS(object):
 
         # UTC Timestamp
         try:
-            utc_string = self.gps_segments[5]
-
-            if utc_string:  # Possible timestamp found
-                hours = (int(utc_string[0:2]) + self.local_offset) % 24
-                minutes = int(utc_string[2:4])
-                seconds = int(utc_string[4:6])
-                self.timestamp = [hours, minutes, seconds]
-            else:  # No Time stamp yet
-                self.timestamp = [0, 0, 0]
-
+            self.timestamp = self._field_utc(5)
         except ValueError:  # Bad Timestamp value present
             return False
 
         # Check Receiver Data Valid Flag
-        if self.gps_segments[6] == "A":  # Data from Receiver is Valid/Has Fix
+        if self._field_char(6) == 65:  # 'A' Data from Receiver is Valid/Has Fix
             # Longitude / Latitude
             try:
-                # Latitude
-                l_string = self.gps_segments[1]
-                lat_degs = int(l_string[0:2])
-                lat_mins = float(l_string[2:])
-                lat_hemi = self.gps_segments[2]
-
-                # Longitude
-                l_string = self.gps_segments[3]
-                lon_degs = int(l_string[0:3])
-                lon_mins = float(l_string[3:])
-                lon_hemi = self.gps_segments[4]
+                # Latitude, 1e-7 deg
+                lat = self._field_coord(1, 2)
+                lat_hemi = self._field_hemisphere(2)
+
+                # Longitude, 1e-7 deg
+                lon = self._field_coord(3, 3)
+                lon_hemi = self._field_hemisphere(4)
             except ValueError:
                 return False
 
-            if lat_hemi not in self.__HEMISPHERES:
+            if lat_hemi is None:
                 return False
 
-            if lon_hemi not in self.__HEMISPHERES:
+            if lon_hemi is None:
                 return False
 
             # Update Object Data
-            self._latitude = [lat_degs, lat_mins, lat_hemi]
-            self._longitude = [lon_degs, lon_mins, lon_hemi]
+            self.lat_e7 = -lat if lat_hemi == "S" else lat
+            self.lon_e7 = -lon if lon_hemi == "W" else lon
             self.valid = True
 
             # Update Last Fix Time
             self.new_fix_time()
 
         else:  # Clear Position Data if Sentence is 'Invalid'
-            self._latitude = [0, 0.0, "N"]
-            self._longitude = [0, 0.0, "W"]
+            self.lat_e7 = 0
+            self.lon_e7 = 0
             self.valid = False
 
         return True
@@ -366,8 +978,8 @@ class MicropyGPS(object):
     def gpvtg(self):
         """Parse Track Made Good and Ground Speed (VTG) Sentence. Updates speed and course"""
         try:
-            course = float(self.gps_segments[1]) if self.gps_segments[1] else 0.0
-            spd_knt = float(self.gps_segments[5]) if self.gps_segments[5] else 0.0
+            course = self._field_float(1) if self._field_len(1) else 0.0
+            spd_knt = self._field_float(5) if self._field_len(5) else 0.0
         except ValueError:
             return False
 
@@ -381,31 +993,21 @@ class MicropyGPS(object):
         fix status, satellites in use, Horizontal Dilution of Precision (HDOP), altitude, geoid height and fix status"""
 
         try:
-            # UTC Timestamp
-            utc_string = self.gps_segments[1]
-
-            # Skip timestamp if receiver doesn't have on yet
-            if utc_string:
-                hours = (int(utc_string[0:2]) + self.local_offset) % 24
-                minutes = int(utc_string[2:4])
-                seconds = int(utc_string[4:6])
-            else:
-                hours = 0
-                minutes = 0
-                seconds = 0
+            # UTC Timestamp, skipped if receiver doesn't have on yet
+            timestamp = self._field_utc(1)
 
             # Number of Satellites in Use
-            satellites_in_use = int(self.gps_segments[7])
+            satellites_in_use = self._field_int(7)
 
             # Get Fix Status
-            fix_stat = int(self.gps_segments[6])
+            fix_stat = self._field_int(6)
 
         except (ValueError, IndexError):
             return False
 
         try:
             # Horizontal Dilution of Precision
-            hdop = float(self.gps_segments[8])
+            hdop = self._field_float(8)
         except (ValueError, IndexError):
             hdop = 0.0
 
@@ -413,42 +1015,38 @@ class MicropyGPS(object):
         if fix_stat:
             # Longitude / Latitude
             try:
-                # Latitude
-                l_string = self.gps_segments[2]
-                lat_degs = int(l_string[0:2])
-                lat_mins = float(l_string[2:])
-                lat_hemi = self.gps_segments[3]
-
-                # Longitude
-                l_string = self.gps_segments[4]
-                lon_degs = int(l_string[0:3])
-                lon_mins = float(l_string[3:])
-                lon_hemi = self.gps_segments[5]
+                # Latitude, 1e-7 deg
+                lat = self._field_coord(2, 2)
+                lat_hemi = self._field_hemisphere(3)
+
+                # Longitude, 1e-7 deg
+                lon = self._field_coord(4, 3)
+                lon_hemi = self._field_hemisphere(5)
             except ValueError:
                 return False
 
-            if lat_hemi not in self.__HEMISPHERES:
+            if lat_hemi is None:
                 return False
 
-            if lon_hemi not in self.__HEMISPHERES:
+            if lon_hemi is None:
                 return False
 
             # Altitude / Height Above Geoid
             try:
-                altitude = float(self.gps_segments[9])
-                geoid_height = float(self.gps_segments[11])
+                altitude = self._field_float(9)
+                geoid_height = self._field_float(11)
             except ValueError:
                 altitude = 0
                 geoid_height = 0
 
             # Update Object Data
-            self._latitude = [lat_degs, lat_mins, lat_hemi]
-            self._longitude = [lon_degs, lon_mins, lon_hemi]
+            self.lat_e7 = -lat if lat_hemi == "S" else lat
+            self.lon_e7 = -lon if lon_hemi == "W" else lon
             self.altitude = altitude
             self.geoid_height = geoid_height
 
         # Update Object Data
-        self.timestamp = [hours, minutes, seconds]
+        self.timestamp = timestamp
         self.satellites_in_use = satellites_in_use
         self.hdop = hdop
         self.fix_stat = fix_stat
@@ -466,17 +1064,16 @@ class MicropyGPS(object):
 
         # Fix Type (None,2D or 3D)
         try:
-            fix_type = int(self.gps_segments[2])
+            fix_type = self._field_int(2)
         except ValueError:
             return False
 
         # Read All (up to 12) Available PRN Satellite Numbers
         sats_used = []
         for sats in range(12):
-            sat_number_str = self.gps_segments[3 + sats]
-            if sat_number_str:
+            if self._field_len(3 + sats):
                 try:
-                    sat_number = int(sat_number_str)
+                    sat_number = self._field_int(3 + sats)
                     sats_used.append(sat_number)
                 except ValueError:
                     return False
@@ -485,9 +1082,9 @@ class MicropyGPS(object):
 
         # PDOP,HDOP,VDOP
         try:
-            pdop = float(self.gps_segments[15])
-            hdop = float(self.gps_segments[16])
-            vdop = float(self.gps_segments[17])
+            pdop = self._field_float(15)
+            hdop = self._field_float(16)
+            vdop = self._field_float(17)
         except ValueError:
             return False
 
@@ -506,67 +1103,79 @@ class MicropyGPS(object):
         return True
 
     def gpgsv(self):
-        """Parse Satellites in View (GSV) sentence. Updates number of SV Sentences,the number of the last SV sentence
-        parsed, and data on each satellite present in the sentence"""
+        """Parse Satellites in View (GSV) sentence. Updates number of SV Sentences, the number of the last SV sentence
+        parsed, and the satellite table for the constellation the talker ID names. Handles NMEA 4.1 signal IDs, and
+        allocates nothing"""
         try:
-            num_sv_sentences = int(self.gps_segments[1])
-            current_sv_sentence = int(self.gps_segments[2])
-            sats_in_view = int(self.gps_segments[3])
+            num_sv_sentences = self._field_int(1)
+            current_sv_sentence = self._field_int(2)
+            sats_in_view = self._field_int(3)
         except ValueError:
             return False
+        if sats_in_view < 0:
+            return False
 
-        # Create a blank dict to store all the satellite data from this sentence in:
-        # satellite PRN is key, tuple containing telemetry is value
-        satellite_dict = dict()
-
-        # Calculate  Number of Satelites to pull data for and thus how many segment positions to read
-        if num_sv_sentences == current_sv_sentence:
-            # Last sentence may have 1-4 satellites; 5 - 20 positions
-            sat_segment_limit = (sats_in_view - ((num_sv_sentences - 1) * 4)) * 5
-        else:
-            sat_segment_limit = 20  # Non-last sentences have 4 satellites and thus read up to position 20
+        buf = self._buf
+        talker = self._field_start[0]
+        gnss = self.__GSV_TALKERS.get((buf[talker] << 8) | buf[talker + 1], -1)
+        if gnss < 0:
+            return False
 
-        # Try to recover data for up to 4 satellites in sentence
-        for sats in range(4, sat_segment_limit, 4):
-            # If a PRN is present, grab satellite data
-            if self.gps_segments[sats]:
-                try:
-                    sat_id = int(self.gps_segments[sats])
-                except (ValueError, IndexError):
-                    return False
+        # 4 fields per satellite after the header, then the signal ID (NMEA 4.1) and the checksum
+        data_fields = self._field_count - 5
+        signal = 0
+        if data_fields % 4 == 1 and self._field_len(data_fields + 3) == 1:
+            signal = _hex_value(buf[self._field_start[data_fields + 3]])
+            if signal < 0:
+                return False
 
-                try:  # elevation can be null (no value) when not tracking
-                    elevation = int(self.gps_segments[sats + 1])
-                except (ValueError, IndexError):
-                    elevation = None
-
-                try:  # azimuth can be null (no value) when not tracking
-                    azimuth = int(self.gps_segments[sats + 2])
-                except (ValueError, IndexError):
-                    azimuth = None
-
-                try:  # SNR can be null (no value) when not tracking
-                    snr = int(self.gps_segments[sats + 3])
-                except (ValueError, IndexError):
-                    snr = None
-            # If no PRN is found, then the sentence has no more satellites to read
-            else:
+        sats = self.satellites
+        no_data = sats.NO_DATA
+        for field in range(4, 4 + (data_fields // 4) * 4, 4):
+            if not self._field_len(field):  # No more satellites in this sentence
                 break
+            try:
+                svid = self._field_int(field)
+                # elevation, azimuth and SNR are null (no value) when not tracking
+                elevation = self._field_int(field + 1) if self._field_len(field + 1) else no_data
+                azimuth = self._field_int(field + 2) if self._field_len(field + 2) else no_data
+                snr = self._field_int(field + 3) if self._field_len(field + 3) else no_data
+            except ValueError:
+                return False
 
-            # Add Satellite Data to Sentence Dict
-            satellite_dict[sat_id] = (elevation, azimuth, snr)
+            # Out of range values would overflow the table's arrays, keep them as not reported
+            if not -90 <= elevation <= 90:
+                elevation = no_data
+            if not 0 <= azimuth <= 359:
+                azimuth = no_data
+            if not 0 <= snr <= 99:
+                snr = no_data
+
+            # NMEA numbering to UBX gnssId/svid
+            sat_gnss = gnss
+            if gnss == SatelliteTable.GPS:
+                if 33 <= svid <= 64:
+                    sat_gnss = SatelliteTable.SBAS
+                    svid += 87
+                elif svid >= 193:
+                    sat_gnss = SatelliteTable.QZSS
+                    svid -= 192
+            elif gnss == SatelliteTable.GLONASS:
+                svid -= 64
+            elif gnss == SatelliteTable.BEIDOU and svid > 200:
+                svid -= 200
+
+            slot = sats.slot(sat_gnss, svid)
+            if slot >= 0:
+                sats.update(slot, elevation, azimuth, snr, signal)
+
+        # Count per constellation, taking the largest if several signals are reported
+        sats.set_in_view(gnss, sats_in_view)
 
         # Update Object Data
         self.total_sv_sentences = num_sv_sentences
         self.last_sv_sentence = current_sv_sentence
-        self.satellites_in_view = sats_in_view
-
-        # For a new set of sentences, we either clear out the existing sat data or
-        # update it as additional SV sentences are parsed
-        if current_sv_sentence == 1:
-            self.satellite_data = satellite_dict
-        else:
-            self.satellite_data.update(satellite_dict)
+        self.satellites_in_view = sats.count()
 
         return True
 
@@ -575,48 +1184,101 @@ class MicropyGPS(object):
 
         # UTC Timestamp
         try:
-            utc_string = self.gps_segments[1]
-
-            if utc_string:  # Possible timestamp found
-                hours = (int(utc_string[0:2]) + self.local_offset) % 24
-                minutes = int(utc_string[2:4])
-                seconds = int(utc_string[4:6])
-                self.timestamp = [hours, minutes, seconds]
-            else:  # No Time stamp yet
-                self.timestamp = [0, 0, 0]
-
+            self.timestamp = self._field_utc(1)
         except (ValueError, IndexError):
             return False
 
-        # Latitude standard deviation
+        # Latitude, longitude and altitude standard deviations, each only updated if we got some info
         try:
-            std_lat = self.gps_segments[6]
+            if self._field_len(6):
+                self.std_lat = self._field_float(6)
 
-            if std_lat:  # we got some info
-                self.std_lat = float(std_lat)
+            if self._field_len(7):
+                self.std_lon = self._field_float(7)
+
+            if self._field_len(8):
+                self.std_alt = self._field_float(8)
 
         except (ValueError, IndexError):
             return False
 
-        # Longitude standard deviation
-        try:
-            std_lon = self.gps_segments[7]
+        return True
 
-            if std_lat:  # we got some info
-                self.std_lon = float(std_lon)
+    ########################################
+    # UBX Message Parsers
+    # Take the payload of a checksummed UBX frame
+    ########################################
+    def nav_pvt(self, payload):
+        """Parse Navigation Position Velocity Time Solution (UBX-NAV-PVT). One message per epoch updates UTC
+        timestamp, date, latitude, longitude, altitude, geoid height, speed, course, accuracy estimates,
+        satellites in use, PDOP and fix status"""
 
-        except (ValueError, IndexError):
+        if len(payload) != 92:
             return False
 
-        # Altitude standard deviation
-        try:
-            std_alt = self.gps_segments[8]
+        (
+            year, month, day, hour, minute, second, valid_flags, _, nano,
+            fix_type, flags, _, num_sv,
+            lon, lat, height, h_msl, h_acc, v_acc,
+            _, _, _, g_speed, head_mot,
+        ) = unpack_from("<HBBBBBBIiBBBBiiiiIIiiiii", payload, 4)
+        p_dop = unpack_from("<H", payload, 76)[0]
+
+        # UTC Timestamp and Date stamp, only once the receiver has resolved them
+        # and the hhmmssmmm stamp the snapshot carries, as gprmc()/gpgga() keep it
+        if valid_flags & 0x02:  # validTime
+            self.timestamp = [hour, minute, second]
+            self._utc_stamp = (hour * 10000 + minute * 100 + second) * 1000 + max(nano, 0) // 1000000
+        else:
+            self._utc_stamp = -1
+        if valid_flags & 0x01:  # validDate
+            self.date = (day, month, year % 100)
+
+        # Fix Type (None, 2D or 3D) and GGA style fix status
+        if fix_type == 2:
+            self.fix_type = self.__FIX_2D
+        elif fix_type in (3, 4):  # 3D and GNSS + dead reckoning
+            self.fix_type = self.__FIX_3D
+        else:
+            self.fix_type = self.__NO_FIX
+
+        gnss_fix_ok = flags & 0x01
+        self.fix_stat = 1 if gnss_fix_ok else 0
+        self.satellites_in_use = num_sv
+        self.pdop = p_dop / 100
+
+        if gnss_fix_ok:
+            # Longitude / Latitude, 1e-7 deg as they are
+            self.lat_e7 = lat
+            self.lon_e7 = lon
+
+            # Altitude / Height Above Geoid, mm
+            self.altitude = h_msl / 1000
+            self.geoid_height = (height - h_msl) / 1000
+
+            # Speed in knots, mph and km/h from mm/s; heading of motion from 1e-5 deg
+            spd_kph = g_speed * 0.0036
+            spd_knt = spd_kph / 1.852
+            self.speed = [spd_knt, spd_knt * 1.151, spd_kph]
+            self.course = head_mot / 100000
+
+            # Accuracy estimates in m. Split hAcc evenly between lat and lon so the
+            # horizontal error reads the same as it does from GST
+            self.std_lat = self.std_lon = h_acc / (1000 * sqrt(2))
+            self.std_alt = v_acc / 1000
+            self.valid = True
 
-            if std_lat:  # we got some info
-                self.std_alt = float(std_alt)
+            # Update Last Fix Time
+            self.new_fix_time()
 
-        except (ValueError, IndexError):
-            return False
+        else:  # Clear Position Data if there is no Fix
+            self.lat_e7 = 0
+            self.lon_e7 = 0
+            self.speed = [0.0, 0.0, 0.0]
+            self.course = 0.0
+            self.valid = False
+
+        return True
 
     ##########################################
     # Data Stream Handler Functions
@@ -624,19 +1286,81 @@ class MicropyGPS(object):
 
     def new_sentence(self):
         """Adjust Object Flags in Preparation for a New Sentence"""
-        self.gps_segments = [""]
+        self._buf = self._line
+        self._line_len = 0
+        self._field_start[0] = 0
+        self._field_end[0] = 0
+        self._field_count = 1
         self.active_segment = 0
         self.crc_xor = 0
         self.sentence_active = True
         self.process_crc = True
         self.char_count = 0
+        self._stat = None
+
+    def _next_field(self, pos):
+        """Close the active field at pos and open the next one just after it. Returns False if out of field slots"""
+        self._field_end[self.active_segment] = pos
+        if self._field_count >= self.FIELD_LIMIT:
+            return False
+        self.active_segment = self._field_count
+        self._field_start[self.active_segment] = pos + 1
+        self._field_end[self.active_segment] = pos + 1
+        self._field_count += 1
+        return True
+
+    def _parse_sentence(self):
+        """Hand the tokenized sentence to its sentence function. Returns sentence type on successful parse"""
+        self.clean_sentences += 1  # Increment clean sentences received
+        self.sentence_active = False  # Clear Active Processing Flag
+
+        try:
+            sentence_type = self._field(0)
+        except UnicodeError:
+            return None
+
+        stat = self._stat
+        if stat is not None:
+            return self._parse_sentence_timed(sentence_type, stat)
+
+        parser = self.supported_sentences.get(sentence_type)
+        if parser is not None:
+            if not self._ubx_epochs:
+                self._check_epoch(parser)
+            # parse the Sentence Based on the message type, return True if parse is clean
+            if parser(self):
+                # Let host know that the GPS object was updated by returning parsed sentence type
+                self.parsed_sentences += 1
+                if not self._ubx_epochs:
+                    self._track_epoch(sentence_type)
+                return sentence_type
+
+        return None
+
+    def _parse_sentence_timed(self, sentence_type, stat):
+        """_parse_sentence() with the statistics recorded in stat"""
+        parser = self.supported_sentences.get(sentence_type)
+        if parser is not None:
+            if not self._ubx_epochs:
+                self._check_epoch(parser)
+            start = ticks_us()
+            parsed = parser(self)
+            stat[_STAT_PARSE_US] += ticks_diff(ticks_us(), start)
+            if parsed:
+                stat[_STAT_PARSED] += 1
+                self.parsed_sentences += 1
+                if not self._ubx_epochs:
+                    self._track_epoch(sentence_type)
+                return sentence_type
+
+        stat[_STAT_REJECTED] += 1
+        return None
 
     def update(self, new_char):
         """Process a new input char and updates GPS object if necessary based on special characters ('$', ',', '*')
-        Function builds a list of received string that are validate by CRC prior to parsing by the  appropriate
-        sentence function. Returns sentence type on successful parse, None otherwise"""
-
-        valid_sentence = False
+        Function stores the sentence in a reused line buffer and records where each field starts and ends. Fields are
+        validated by CRC prior to parsing by the appropriate sentence function. Returns sentence type on successful
+        parse, None otherwise"""
 
         # Validate new_char is a printable char
         ascii_char = ord(new_char)
@@ -646,7 +1370,7 @@ class MicropyGPS(object):
 
             # Write Character to log file if enabled
             if self.log_en:
-                self.write_log(new_char)
+                self._log_char(ascii_char)
 
             # Check if a new string is starting ($)
             if new_char == "$":
@@ -654,53 +1378,60 @@ class MicropyGPS(object):
                 return None
 
             elif self.sentence_active:
+                pos = self._line_len
+                if pos >= len(self._line):  # Line buffer full of garbage
+                    self.sentence_active = False
+                    return None
+
+                self._line[pos] = ascii_char
+                self._line_len += 1
+
                 # Check if sentence is ending (*)
                 if new_char == "*":
                     self.process_crc = False
-                    self.active_segment += 1
-                    self.gps_segments.append("")
+                    if not self._next_field(pos):
+                        self.sentence_active = False
                     return None
 
-                # Check if a section is ended (,), Create a new substring to feed
-                # characters to
+                # Check if a section is ended (,), open a new field
                 elif new_char == ",":
-                    self.active_segment += 1
-                    self.gps_segments.append("")
-
-                # Store All Other printable character and check CRC when ready
+                    if self.active_segment == 0 and self._stats is not None:
+                        self._stat_arrival(self._line, pos)
+
+                    # Drop filtered sentences as soon as their type is known
+                    if self.active_segment == 0 and not self._type_enabled(self._line, pos):
+                        self.sentence_active = False
+                        self.filtered_sentences += 1
+                        if self._stat is not None:
+                            self._stat[_STAT_FILTERED] += 1
+                        return None
+
+                    if not self._next_field(pos):
+                        self.sentence_active = False
+                        return None
+
+                # Extend the active field and check CRC when ready
                 else:
-                    self.gps_segments[self.active_segment] += new_char
+                    self._field_end[self.active_segment] = pos + 1
 
                     # When CRC input is disabled, sentence is nearly complete
                     if not self.process_crc:
-                        if len(self.gps_segments[self.active_segment]) == 2:
-                            try:
-                                final_crc = int(
-                                    self.gps_segments[self.active_segment], 16
-                                )
-                                if self.crc_xor == final_crc:
-                                    valid_sentence = True
-                                else:
-                                    self.crc_fails += 1
-                            except ValueError:
+                        if self._field_len(self.active_segment) == 2:
+                            final_crc = self._field_hex(self.active_segment)
+                            if final_crc < 0:
                                 pass  # CRC Value was deformed and could not have been correct
+                            elif self.crc_xor == final_crc:
+                                # If a Valid Sentence Was received and it's a supported sentence, then parse it!!
+                                return self._parse_sentence()
+                            else:
+                                self.crc_fails += 1
+                                if self._stat is not None:
+                                    self._stat[_STAT_CRC_FAILS] += 1
 
                 # Update CRC
                 if self.process_crc:
                     self.crc_xor ^= ascii_char
 
-                # If a Valid Sentence Was received and it's a supported sentence, then parse it!!
-                if valid_sentence:
-                    self.clean_sentences += 1  # Increment clean sentences received
-                    self.sentence_active = False  # Clear Active Processing Flag
-
-                    if self.gps_segments[0] in self.supported_sentences:
-                        # parse the Sentence Based on the message type, return True if parse is clean
-                        if self.supported_sentences[self.gps_segments[0]](self):
-                            # Let host know that the GPS object was updated by returning parsed sentence type
-                            self.parsed_sentences += 1
-                            return self.gps_segments[0]
-
                 # Check that the sentence buffer isn't filling up with Garage waiting for the sentence to complete
                 if self.char_count > self.SENTENCE_LIMIT:
                     self.sentence_active = False
@@ -708,6 +1439,313 @@ class MicropyGPS(object):
         # Tell Host no new sentence was parsed
         return None
 
+    def update_sentence(self, sentence, start=0, end=None):
+        """Process a complete NMEA sentence (bytes, bytearray or str, with or without the trailing CR/LF) in one
+        pass. start/end select the sentence within a larger buffer. The CRC is checked and the field offsets are
+        recorded in the same loop, directly over the caller's buffer, before the sentence is handed to the
+        appropriate sentence function. Returns sentence type on successful parse, None otherwise"""
+
+        if isinstance(sentence, str):
+            sentence = sentence.encode()
+
+        if end is None:
+            end = len(sentence)
+
+        # Locate the sentence delimiters ('$' ... '*hh')
+        dollar = find_byte(sentence, 0x24, start, end)  # '$'
+        if dollar < 0:
+            return None
+
+        star = find_byte(sentence, 0x2A, dollar, end)  # '*'
+        if star < 0 or end < star + 3:
+            return None
+
+        # Same garbage guard as the character based parser
+        if star + 3 - dollar > self.SENTENCE_LIMIT:
+            return None
+
+        self.char_count = star + 3 - dollar
+
+        self._stat = None
+        if self._stats is not None:
+            comma = find_byte(sentence, 0x2C, dollar, star)  # ','
+            self._stat_arrival(sentence, comma if comma >= 0 else star)
+
+        # Drop filtered sentences before they are CRC checked or tokenized
+        if self.sentence_filter is not None:
+            comma = find_byte(sentence, 0x2C, dollar, star)  # ','
+            if not self._type_enabled(sentence, comma if comma >= 0 else star):
+                self.filtered_sentences += 1
+                if self._stat is not None:
+                    self._stat[_STAT_FILTERED] += 1
+                return None
+
+        # Write Sentence to log file if enabled
+        if self.log_en:
+            self.write_log(memoryview(sentence)[start:end])
+
+        # Tokenize and validate CRC in one pass
+        self.sentence_active = False
+        self._buf = sentence
+        self._field_start[0] = dollar + 1
+        self._field_count = 1
+        self.active_segment = 0
+        crc_xor = 0
+        for pos in range(dollar + 1, star):
+            char = sentence[pos]
+            if char == 44:  # ','
+                if not self._next_field(pos):
+                    return None
+            crc_xor ^= char
+
+        # Keep the CRC as the final field, as update() does
+        if not self._next_field(star):
+            return None
+        self._field_end[self.active_segment] = star + 3
+
+        final_crc = self._field_hex(self.active_segment)
+        if final_crc < 0:
+            return None  # CRC Value was deformed and could not have been correct
+
+        self.crc_xor = crc_xor
+        if crc_xor != final_crc:
+            self.crc_fails += 1
+            if self._stat is not None:
+                self._stat[_STAT_CRC_FAILS] += 1
+            return None
+
+        return self._parse_sentence()
+
+    def update_ubx(self, frame):
+        """Process a complete UBX frame (B5 62 class id length payload ck_a ck_b). The checksum is validated before
+        the payload is handed to the appropriate message function. Returns the message name on successful parse,
+        None otherwise"""
+
+        if len(frame) < 8 or frame[0] != 0xB5 or frame[1] != 0x62:
+            return None
+
+        length = frame[4] | (frame[5] << 8)
+        if len(frame) < length + 8:
+            return None
+
+        # Validate Fletcher checksum over class, id, length and payload
+        ck_a = 0
+        ck_b = 0
+        for pos in range(2, length + 6):
+            ck_a = (ck_a + frame[pos]) & 0xFF
+            ck_b = (ck_b + ck_a) & 0xFF
+
+        if ck_a != frame[length + 6] or ck_b != frame[length + 7]:
+            self.crc_fails += 1
+            if self._stats is not None:
+                self._stat_ubx_arrival((frame[2] << 8) | frame[3])[_STAT_CRC_FAILS] += 1
+            return None
+
+        return self.parse_ubx(frame)
+
+    def parse_ubx(self, frame):
+        """Hand an already checksummed UBX frame to the appropriate message function.
+        Returns the message name on successful parse, None otherwise"""
+
+        self.clean_sentences += 1
+
+        length = frame[4] | (frame[5] << 8)
+        message_id = (frame[2] << 8) | frame[3]
+        stat = None
+        if self._stats is not None:
+            stat = self._stat_ubx_arrival(message_id)
+
+        if message_id in self.supported_ubx_messages:
+            name, parser = self.supported_ubx_messages[message_id]
+            if stat is not None:
+                start = ticks_us()
+                parsed = parser(self, memoryview(frame)[6 : length + 6])
+                stat[_STAT_PARSE_US] += ticks_diff(ticks_us(), start)
+            else:
+                parsed = parser(self, memoryview(frame)[6 : length + 6])
+            if parsed:
+                self.parsed_sentences += 1
+                if stat is not None:
+                    stat[_STAT_PARSED] += 1
+                if name == "NAV-PVT":  # One per epoch, after everything else
+                    self._ubx_epochs = True
+                    self._end_epoch()
+                return name
+
+        if stat is not None:
+            stat[_STAT_REJECTED] += 1
+        return None
+
+    ##########################################
+    # Epoch Tracking Functions
+    ##########################################
+
+    def _end_epoch(self):
+        self._epoch_done = True
+        self.epoch_count += 1
+        self.satellites.epoch = self.epoch_count
+        self.satellites.expire()  # constellations no longer reported drop out of the count
+        self.satellites_in_view = self.satellites.count()
+
+        # Publish the epoch as a whole
+        back = self._snapshot_back
+        back._copy(self, self.epoch_count, self._utc_stamp)
+        self._snapshot_back = self.snapshot
+        self.snapshot = back
+
+        if self.epoch_callback is not None:
+            self.epoch_callback()
+
+    def _check_epoch(self, parser):
+        """Before a timestamped sentence is parsed: if its UTC time has moved on, the previous epoch is over. Close
+        it now, while the navigation data is still all from that epoch, if its closing sentence was missed or
+        hasn't been learned yet"""
+        field = self._utc_fields.get(parser)
+        if field is None:
+            return
+        try:
+            stamp = self._field_stamp(field)
+        except ValueError:  # Left to the sentence function to reject
+            return
+
+        if stamp != self._epoch_stamp:  # First sentence of a new epoch
+            if self._epoch_stamp >= 0:
+                if not self._epoch_done:
+                    self._end_epoch()
+                self._epoch_end = self._epoch_last
+            self._epoch_stamp = stamp
+            self._epoch_done = False
+
+    def _track_epoch(self, sentence_type):
+        """Work out when all the sentences of an epoch have arrived. The receiver sends the same sequence every
+        epoch, so the type seen just before the UTC time moves on (see _check_epoch()) is learned as the one that
+        closes the epoch"""
+        self._epoch_last = sentence_type
+
+        if sentence_type == self._epoch_end and not self._epoch_done:
+            # Multi sentence GSV groups close on their last sentence
+            if sentence_type[2:] != "GSV" or self.last_sv_sentence == self.total_sv_sentences:
+                self._end_epoch()
+
+    def reset_epoch(self):
+        """Forget the learned epoch sequence, e.g. after the sentence filter has changed"""
+        self._epoch_stamp = -1
+        self._epoch_done = False
+        self._epoch_last = None
+        self._epoch_end = None
+
+    ##########################################
+    # Per Sentence Type Statistics
+    # Disabled by default; while disabled the only cost is a None check per sentence
+    ##########################################
+
+    def enable_stats(self, enable=True):
+        """Start (or stop) counting received, parsed, rejected, CRC failed and filtered sentences, parse time and
+        time between arrivals per sentence type ('RMC', 'GSV', ... from any talker) and UBX message.
+        Enabling again clears the counters"""
+        self._stats = dict() if enable else None
+        self._stat = None
+
+    def _stat_record(self, key):
+        stat = self._stats.get(key)
+        if stat is None:  # First of its type, the only allocation
+            stat = array("L", [0] * _STAT_SIZE)
+            self._stats[key] = stat
+        now = ticks_ms()
+        if stat[_STAT_RECEIVED]:
+            gap = ticks_diff(now, stat[_STAT_LAST_MS])
+            stat[_STAT_GAP_MS] += gap
+            if gap > stat[_STAT_GAP_MAX_MS]:
+                stat[_STAT_GAP_MAX_MS] = gap
+        stat[_STAT_LAST_MS] = now
+        stat[_STAT_RECEIVED] += 1
+        return stat
+
+    def _stat_arrival(self, buf, end):
+        """Count the sentence whose address field ends at end, and make it the current record"""
+        if end - 3 < 0 or buf[end - 3] == 36:  # Address too short ('$')
+            self._stat = None
+            return
+        self._stat = self._stat_record(self._type_key(buf, end))
+
+    def _stat_ubx_arrival(self, message_id):
+        # UBX keys are (class << 8) | id, below any three letter sentence key
+        return self._stat_record(message_id)
+
+    def stats(self):
+        """Snapshot of the per type counters as a dict of name: dict, empty while disabled. Times are in ms apart
+        from parse_us and mean_parse_us"""
+        snapshot = dict()
+        if self._stats is None:
+            return snapshot
+        for key, stat in self._stats.items():
+            if key > 0xFFFF:
+                name = chr(key >> 16) + chr((key >> 8) & 0xFF) + chr(key & 0xFF)
+            elif key in self.supported_ubx_messages:
+                name = self.supported_ubx_messages[key][0]
+            else:
+                name = "UBX-%02X-%02X" % (key >> 8, key & 0xFF)
+            received = stat[_STAT_RECEIVED]
+            parsed = stat[_STAT_PARSED]
+            snapshot[name] = {
+                "received": received,
+                "parsed": parsed,
+                "rejected": stat[_STAT_REJECTED],
+                "crc_fails": stat[_STAT_CRC_FAILS],
+                "filtered": stat[_STAT_FILTERED],
+                "parse_us": stat[_STAT_PARSE_US],
+                "mean_parse_us": stat[_STAT_PARSE_US] / parsed if parsed else 0,
+                "mean_interval": stat[_STAT_GAP_MS] / (received - 1) if received > 1 else 0,
+                "max_interval": stat[_STAT_GAP_MAX_MS],
+            }
+        return snapshot
+
+    ##########################################
+    # Sentence Filter Functions
+    ##########################################
+
+    @staticmethod
+    def _type_key(buf, end):
+        """Pack the three sentence type characters ending at end (e.g. RMC) into a small int"""
+        return (buf[end - 3] << 16) | (buf[end - 2] << 8) | buf[end - 1]
+
+    def _type_enabled(self, buf, end):
+        """Check the sentence whose address field ends at end against the filter"""
+        if self.sentence_filter is None:
+            return True
+        if end - 3 < 0 or buf[end - 3] == 36:  # Address too short ('$')
+            return False
+        return self._type_key(buf, end) in self.sentence_filter
+
+    def enable_sentences(self, *sentence_types):
+        """Parse the given sentence types ('RMC', 'GSV', ...) from any talker, in addition to those already
+        enabled. Full names such as 'GNRMC' are accepted and reduced to their type"""
+        self.reset_epoch()
+        if self.sentence_filter is None:
+            return
+        for sentence_type in sentence_types:
+            self.sentence_filter.add(self._type_key(sentence_type.encode(), len(sentence_type)))
+
+    def disable_sentences(self, *sentence_types):
+        """Skip the given sentence types before they are tokenized"""
+        self.reset_epoch()
+        if self.sentence_filter is None:
+            self.sentence_filter = set(
+                self._type_key(name.encode(), len(name)) for name in self.supported_sentences
+            )
+        for sentence_type in sentence_types:
+            self.sentence_filter.discard(self._type_key(sentence_type.encode(), len(sentence_type)))
+
+    def set_sentences(self, *sentence_types):
+        """Only parse the given sentence types, skipping everything else before it is tokenized.
+        Called without arguments every sentence is parsed again"""
+        self.reset_epoch()
+        if not sentence_types:
+            self.sentence_filter = None
+            return
+        self.sentence_filter = set()
+        self.enable_sentences(*sentence_types)
+
     def new_fix_time(self):
         """Updates a high resolution counter with current time when fix is updated. Currently only triggered from
         GGA, GSA and RMC sentences"""
@@ -740,13 +1778,6 @@ class MicropyGPS(object):
         """
         self.last_sv_sentence = 0
 
-    def satellites_visible(self):
-        """
-        Returns a list of of the satellite PRNs currently visible to the receiver
-        :return: list
-        """
-        return list(self.satellite_data.keys())
-
     def time_since_fix(self):
         """Returns number of millisecond since the last sentence with a valid fix was parsed. Returns 0 if
         no fix has been found"""
@@ -764,171 +1795,6 @@ class MicropyGPS(object):
 
         return current
 
-    def compass_direction(self):
-        """
-        Determine a cardinal or inter-cardinal direction based on current course.
-        :return: string
-        """
-        # Calculate the offset for a rotated compass
-        if self.course >= 348.75:
-            offset_course = 360 - self.course
-        else:
-            offset_course = self.course + 11.25
-
-        # Each compass point is separated by 22.5 degrees, divide to find lookup value
-        dir_index = floor(offset_course / 22.5)
-
-        final_dir = self.__DIRECTIONS[dir_index]
-
-        return final_dir
-
-    def latitude_string(self):
-        """
-        Create a readable string of the current latitude data
-        :return: string
-        """
-        if self.coord_format == "dd":
-            formatted_latitude = self.latitude
-            lat_string = str(formatted_latitude[0]) + "° " + str(self._latitude[2])
-        elif self.coord_format == "dms":
-            formatted_latitude = self.latitude
-            lat_string = (
-                str(formatted_latitude[0])
-                + "° "
-                + str(formatted_latitude[1])
-                + "' "
-                + str(formatted_latitude[2])
-                + '" '
-                + str(formatted_latitude[3])
-            )
-        else:
-            lat_string = (
-                str(self._latitude[0])
-                + "° "
-                + str(self._latitude[1])
-                + "' "
-                + str(self._latitude[2])
-            )
-        return lat_string
-
-    def longitude_string(self):
-        """
-        Create a readable string of the current longitude data
-        :return: string
-        """
-        if self.coord_format == "dd":
-            formatted_longitude = self.longitude
-            lon_string = str(formatted_longitude[0]) + "° " + str(self._longitude[2])
-        elif self.coord_format == "dms":
-            formatted_longitude = self.longitude
-            lon_string = (
-                str(formatted_longitude[0])
-                + "° "
-                + str(formatted_longitude[1])
-                + "' "
-                + str(formatted_longitude[2])
-                + '" '
-                + str(formatted_longitude[3])
-            )
-        else:
-            lon_string = (
-                str(self._longitude[0])
-                + "° "
-                + str(self._longitude[1])
-                + "' "
-                + str(self._longitude[2])
-            )
-        return lon_string
-
-    def speed_string(self, unit="kph"):
-        """
-        Creates a readable string of the current speed data in one of three units
-        :param unit: string of 'kph','mph, or 'knot'
-        :return:
-        """
-        if unit == "mph":
-            speed_string = str(self.speed[1]) + " mph"
-
-        elif unit == "knot":
-            if self.speed[0] == 1:
-                unit_str = " knot"
-            else:
-                unit_str = " knots"
-            speed_string = str(self.speed[0]) + unit_str
-
-        else:
-            speed_string = f"{self.speed[2]:.2f} km/h"
-
-        return speed_string
-
-    def get_local_time(self, utc_offset=10, check_daylight_savings=True):
-        """
-        Get local time tuple for a given timezone.
-        Check for AEDT as I live in Melbourne.
-        """
-
-        # we don't know the day of week yet so get that here
-        time_tuple = (
-            2000 + self.date[2],
-            self.date[1],
-            self.date[0],
-            self.timestamp[0],
-            self.timestamp[1],
-            self.timestamp[2],
-            0,
-            0,
-        )
-
-        utc = utime.mktime(time_tuple)  # UTC in seconds since 1 Jan 2000
-        aest = utc + utc_offset * 3600
-
-        if not check_daylight_savings:
-            return utime.localtime(aest)
-
-        first_apr = utime.localtime(
-            utime.mktime((2000 + self.date[2], 4, 1, utc_offset, 0, 0, 0, 0))
-        )  # AEST Apr 1st 00:00
-
-        first_sun_apr = utime.mktime(
-            (2000 + self.date[2], 4, 7 - first_apr[6], utc_offset + 2, 0, 0, 0, 0)
-        )  # First sunday in April 2:00AM AEST, AEDT ends after this date
-
-        first_oct = utime.localtime(
-            utime.mktime((2000 + self.date[2], 10, 1, utc_offset, 0, 0, 0, 0))
-        )  # AEST Oct 1st 00:00
-
-        first_sun_oct = utime.mktime(
-            (2000 + self.date[2], 10, 7 - first_oct[6], utc_offset + 2, 0, 0, 0, 0)
-        )  # First sunday in October 2:00AM, AEDT starts after this date
-
-        aedt = utc + (utc_offset + 1) * 3600
-        time = aedt if (aest <= first_sun_apr) or (aest > first_sun_oct) else aest
-
-        return utime.localtime(time)
-
-    def date_string(self, formatting="s_dmy", century="20"):
-        """
-        Creates a readable string of the current date at local timezone.
-        """
-
-        tt = self.get_local_time()
-
-        return f"{self.__DAYS[tt[6]]} {tt[2]} {self.__MONTHS[tt[1] - 1]} {tt[0]}"
-
-    def time_string(self, seconds=True):
-        """Return a formatted time string in the Australia/Melbourne timezone"""
-
-        # we don't know the day of week yet so get that here
-        time_tuple = self.get_local_time()
-
-        am_pm = "AM" if time_tuple[3] < 12 else "PM"
-        hour = 12 if time_tuple[3] in (0, 12) else time_tuple[3] % 12
-        
-        if seconds:
-            return f"{hour}:{time_tuple[4]:02d}:{time_tuple[5]:02d} {am_pm}"
-        else:
-            return f"{hour}:{time_tuple[4]:02d} {am_pm}"
-
     # All the currently supported NMEA sentences
     supported_sentences = {
         "GPRMC": gprmc,
@@ -940,7 +1806,11 @@ class MicropyGPS(object):
         "GPGSA": gpgsa,
         "GLGSA": gpgsa,
         "GPGSV": gpgsv,
-        # "GLGSV": gpgsv,
+        "GLGSV": gpgsv,
+        "GAGSV": gpgsv,
+        "GBGSV": gpgsv,
+        "BDGSV": gpgsv,
+        "GQGSV": gpgsv,
         "GPGLL": gpgll,
         "GLGLL": gpgll,
         "GNGGA": gpgga,
@@ -952,6 +1822,19 @@ class MicropyGPS(object):
         "GNGST": gpgst,
     }
 
+    # Field holding the UTC time in the sentences that have one, by sentence function
+    _utc_fields = {
+        gprmc: 1,
+        gpgga: 1,
+        gpgll: 5,
+        gpgst: 1,
+    }
+
+    # All the currently supported UBX messages, keyed by (class << 8) | id
+    supported_ubx_messages = {
+        0x0107: ("NAV-PVT", nav_pvt),
+    }
+
 
 if __name__ == "__main__":
     pass
@@ -0,0 +1,120 @@
+# Save the receiver's navigation database (ephemerides, almanacs, ionosphere and
+# clock data it has collected) to flash with UBX-MGA-DBD, and give it back at
+# boot, so the receiver can hot start even after losing its backup power.
+#
+# Polled, the receiver sends its database as a burst of MGA-DBD messages; they
+# are collected through the stream demux and written out in a fixed buffer. The
+# restore sends the saved messages back through an MgaUploader, paced by the
+# receiver's MGA-ACKs.
+
+import os
+import uasyncio
+
+from utime import ticks_ms, ticks_diff
+from assistnow import DOWNLOAD_CHUNK, MgaUploader, UbxSplitter, replace_file
+
+NAVDB_FILE = 'dbd'
+NAVDB_INTERVAL = 900  # seconds between saves while there is a fix
+NAVDB_START_MS = 2000  # time allowed for the dump to start after the poll
+NAVDB_QUIET_MS = 500   # the dump is over when no MGA-DBD arrives for this long
+
+# Poll UBX-MGA-DBD from the receiver
+CMD_POLL_MGA_DBD = b"\xb5\x62\x13\x80\x00\x00\x93\xcc"
+
+
+class DumpWriter:
+    """Collects MGA-DBD frames from the demux in a size byte buffer, written to path whenever it fills up"""
+
+    def __init__(self, path, size=1024):
+        self._file = open(path, "wb")
+        self._buf = bytearray(size)
+        self._mv = memoryview(self._buf)
+        self._len = 0
+        self.last = ticks_ms()  # arrival of the last message
+
+        # statistics
+        self.messages = 0
+        self.bytes = 0
+        self.skipped = 0  # frames larger than the buffer
+
+    def record(self, frame):
+        n = len(frame)
+        if n > len(self._buf):
+            self.skipped += 1
+            return
+        if self._len + n > len(self._buf):
+            self.flush()
+        self._mv[self._len : self._len + n] = frame
+        self._len += n
+        self.messages += 1
+        self.bytes += n
+        self.last = ticks_ms()
+
+    def flush(self):
+        if self._len:
+            self._file.write(self._mv[: self._len])
+            self._len = 0
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+async def dump_navdb(uart, demux, path=NAVDB_FILE):
+    """Poll the navigation database and replace the saved copy with it, returns the number of messages"""
+    writer = DumpWriter(path + ".new")
+    demux.add_ubx_handler(0x13, 0x80, writer.record)
+    uart.write(CMD_POLL_MGA_DBD)
+    polled = ticks_ms()
+
+    while True:
+        await uasyncio.sleep_ms(100)
+        if writer.messages:
+            if ticks_diff(ticks_ms(), writer.last) >= NAVDB_QUIET_MS:
+                break
+        elif ticks_diff(ticks_ms(), polled) >= NAVDB_START_MS:
+            break
+
+    demux.remove_ubx_handler(0x13, 0x80)
+    writer.close()
+    if writer.messages:
+        replace_file(path + ".new", path)
+        print(f"Saved navigation database: {writer.messages} messages, {writer.bytes} bytes")
+    else:
+        os.remove(path + ".new")  # keep the last good copy
+        print("Receiver sent no navigation database")
+    return writer.messages
+
+
+async def save_navdb(uart, demux, gps, interval=NAVDB_INTERVAL):
+    # Save the navigation database every interval seconds while there is a fix to show it's worth keeping
+    while True:
+        await uasyncio.sleep(interval)
+        if gps.snapshot.valid:
+            await dump_navdb(uart, demux)
+
+
+async def restore_navdb(uart, demux, path=NAVDB_FILE):
+    """Send a saved navigation database back to the receiver, returns the number of messages"""
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return 0
+
+    uploader = MgaUploader(uart, demux)
+    uploader.start()
+    splitter = UbxSplitter()
+    buf = bytearray(DOWNLOAD_CHUNK)
+    mv = memoryview(buf)
+    with f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            for msg in splitter.feed(mv[:n]):
+                await uploader.send(msg)
+    splitter.finish()
+    await uploader.finish()
+
+    print(f"Restored navigation database: {uploader.summary()}")
+    return splitter.messages
@@ -13,6 +13,8 @@ import utime
 refresh(ssd, True)  # Initialise and clear display.
 
 class Quality:
+    SENTENCES = ("GSV", "GST")  # NMEA sentence types this page reads
+
     def __init__(self):
         # Writer for gui elements
         Writer.set_textpos(ssd, 0, 0)  # In case previous tests have altered it
@@ -24,45 +26,48 @@ class Quality:
         self.pre_lbl = Label(self.wri, 26, 68, 59)
         self.alt_lbl = Label(self.wri, 50, 68, 59)
 
-        self.sat_labels = {} # Label widgets for each satellite we have seen
+        self.sat_labels = {} # Label widgets for each satellite table slot we have seen
         self.refresh_count = 0
 
     def elev_to_rad(self, elev):
         return math.cos(elev) * 28
 
-    def get_sat_xy(self, data):
-        rad = self.elev_to_rad(math.radians(data[0]))
-        x = 32 + int(rad * math.sin(math.radians(data[1])))
-        y = 32 + int(rad * math.cos(math.radians(data[1])))
+    def get_sat_xy(self, elev, azim):
+        rad = self.elev_to_rad(math.radians(elev))
+        x = 32 + int(rad * math.sin(math.radians(azim)))
+        y = 32 + int(rad * math.cos(math.radians(azim)))
 
         return x, y
 
-    def draw_sat(self, lbl, data):
-        if data[0] is None or data[1] is None:
-            lbl
+    def draw_sat(self, lbl, sats, slot):
+        elev = sats.elevation[slot]
+        azim = sats.azimuth[slot]
+        if elev == sats.NO_DATA or azim == sats.NO_DATA:
             return
 
-        x, y = self.get_sat_xy(data)
+        x, y = self.get_sat_xy(elev, azim)
         lbl.row = y - 3
         lbl.col = x - 3
-        val = '?' if data[2] is None else int(data[2] / 10.0)
+        snr = sats.snr[slot]
+        val = '?' if snr == sats.NO_DATA else int(snr / 10.0)
         lbl.value(f'{val}', invert=True)
 
     def update_sat_labels(self, gps):
-        for svid, lbl in self.sat_labels.items(): # backward pass to de-render missing sats
-            if svid not in gps.satellite_data: # de-render sat
+        sats = gps.satellites
+        for slot, lbl in self.sat_labels.items(): # backward pass to de-render missing sats
+            if not sats.visible(slot): # de-render sat
                 lbl.value('') # this should de-render the Label
 
         self.circles()
 
-        for svid, data in gps.satellite_data.items(): # forward pass to update existing and add new sats
-            if svid in self.sat_labels: # update label
-                lbl = self.sat_labels[svid]
+        for slot in sats.slots(): # forward pass to update existing and add new sats, all constellations
+            if slot in self.sat_labels: # update label
+                lbl = self.sat_labels[slot]
             else: # add label
                 lbl = Label(self.wri, 0, 0, 6)
-                self.sat_labels[svid] = lbl
+                self.sat_labels[slot] = lbl
 
-            self.draw_sat(lbl, data)
+            self.draw_sat(lbl, sats, slot)
 
 
     def circles(self):
@@ -70,7 +75,7 @@ class Quality:
         ssd.ellipse(32, 32, 28, 28, 0xffff)
 
     def load(self, gps): # to be called when changing to this page
-        refresh(ssd, True)  # Initialise and clear display.
+        refresh(ssd, True, False)  # Clear display, sent with the next frame.
         self.refresh_count = 0
         self.circles()
         self.siv_lbl.value(f'In view:{gps.satellites_in_view}')
@@ -83,10 +88,10 @@ class Quality:
         alt_str = ">999 m" if gps.std_alt > 999 else f"{gps.std_alt:.2f} m"
         self.alt_lbl.value(f' ={alt_str}')
 
-        refresh(ssd)
+        refresh(ssd, show=False)  # Caller sends the frame
 
-    def refresh(self, gps): # to be called at around 10 Hz
-        if self.refresh_count > 600: # full refresh every minute
+    def refresh(self, gps): # to be called once per epoch
+        if self.refresh_count > 60: # full refresh every minute at 1 Hz
             self.load(gps)
             return
     
@@ -98,10 +103,12 @@ class Quality:
         self.alt_lbl.value(f' ={alt_str} m')
         self.update_sat_labels(gps)
 
-        refresh(ssd)
+        refresh(ssd, show=False)  # Caller sends the frame
         self.refresh_count += 1
         
 class Default:
+    SENTENCES = ("RMC", "GGA")  # NMEA sentence types this page reads
+
     def __init__(self):
         # Writer for gui elements
         Writer.set_textpos(ssd, 0, 0)  # In case previous tests have altered it
@@ -117,24 +124,26 @@ class Default:
         self.alt_lbl = Label(self.wri, 52, 2, 120)
 
     def load(self, gps): # to be called when changing to this page
-        refresh(ssd, True)  # Initialise and clear display.
+        refresh(ssd, True, False)  # Clear display, sent with the next frame.
         self.date_lbl.value(f'{gps.date_string()}')
         self.time_lbl.value(f'{gps.time_string()}')
         self.lat_lbl.value(f'Lat. {gps.latitude_string()}')
         self.lon_lbl.value(f'Lon. {gps.longitude_string()}')
         self.alt_lbl.value(f'Alt. {gps.altitude:.1f} m')
-        refresh(ssd)
+        refresh(ssd, show=False)  # Caller sends the frame
 
-    def refresh(self, gps): # to be called at around 10 Hz
+    def refresh(self, gps): # to be called once per epoch
         self.date_lbl.value(f'{gps.date_string()}')
         self.time_lbl.value(f'{gps.time_string()}')
         self.lat_lbl.value(f'Lat. {gps.latitude_string()}')
         self.lon_lbl.value(f'Lon. {gps.longitude_string()}')
         self.alt_lbl.value(f'Alt. {gps.altitude:.1f} m')
 
-        refresh(ssd)
+        refresh(ssd, show=False)  # Caller sends the frame
 
 class Speedometer:
+    SENTENCES = ("RMC", "VTG")  # NMEA sentence types this page reads
+
     def __init__(self):
         # Writer for gui elements
         Writer.set_textpos(ssd, 0, 0)  # In case previous tests have altered it
@@ -166,7 +175,7 @@ class Speedometer:
         self.pointer.value(v)
 
     def load(self, gps): # to be called when changing to this page
-        refresh(ssd, True)  # Initialise and clear display.
+        refresh(ssd, True, False)  # Clear display, sent with the next frame.
         f, i = math.modf(gps.speed[2])
         self.speed_whl_lbl.value(f'{i:.0f}')
         self.speed_dec_lbl.value(f'.{f * 10:.0f}')
@@ -181,9 +190,9 @@ class Speedometer:
         self.time_lbl.value(f'{gps.time_string(seconds=False)}')
         self.draw_compass(gps.course)
         self._v = [0.0, 0.0, 0.0, 0.0]
-        refresh(ssd)
+        refresh(ssd, show=False)  # Caller sends the frame
 
-    def refresh(self, gps): # to be called at around 10 Hz
+    def refresh(self, gps): # to be called once per epoch
 #         if self.count >= 5: # recalculate acceleration
 #             now = utime.ticks_ms()
 #             dt = (now - self.ticks) / 1000 # needed for finite diff approximation
@@ -206,4 +215,4 @@ class Speedometer:
         if gps.speed[2] > 1.0: # freeze compass at low speed
             self.hdg_lbl.value(f'HDG: {gps.course:.0f}°')
             self.draw_compass(gps.course)
-        refresh(ssd)
+        refresh(ssd, show=False)  # Caller sends the frame
@@ -0,0 +1,16 @@
+# Host stand-in for micropython-lib aiohttp. Sessions can be created but every
+# request fails, as it would without a network.
+
+
+class ClientSession:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def get(self, url, **kwargs):
+        raise OSError("No network in the simulation")
@@ -0,0 +1,5 @@
+# Placeholder credentials for the simulation; the real file stays on the board.
+
+SSID = "simulation"
+PASSWORD = ""
+CHIPCODE = ""
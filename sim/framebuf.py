@@ -0,0 +1,146 @@
+# Host stand-in for MicroPython's framebuf module. Pure Python, slow but
+# pixel compatible for the monochrome formats the display code uses.
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+MVLSB = MONO_VLSB
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError("Only monochrome formats are simulated")
+        self._buf = buffer
+        self._width = width
+        self._height = height
+        self._format = format
+        self._stride = width if stride is None else stride
+
+    def _index(self, x, y):
+        if self._format == MONO_VLSB:
+            return (y >> 3) * self._stride + x, y & 7
+        offset = (self._stride + 7) >> 3
+        if self._format == MONO_HLSB:
+            return y * offset + (x >> 3), 7 - (x & 7)
+        return y * offset + (x >> 3), x & 7
+
+    def _set(self, x, y, c):
+        if 0 <= x < self._width and 0 <= y < self._height:
+            i, bit = self._index(x, y)
+            if c:
+                self._buf[i] |= 1 << bit
+            else:
+                self._buf[i] &= ~(1 << bit) & 0xFF
+
+    def _get(self, x, y):
+        i, bit = self._index(x, y)
+        return (self._buf[i] >> bit) & 1
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill(self, c):
+        v = 0xFF if c else 0
+        for i in range(len(self._buf)):
+            self._buf[i] = v
+
+    def fill_rect(self, x, y, w, h, c):
+        for yy in range(max(y, 0), min(y + h, self._height)):
+            for xx in range(max(x, 0), min(x + w, self._width)):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x0, y0, x1, y1, c):
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self._set(x0, y0, c)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    def _quadrants(self, cx, cy, x, y, c, f, m):
+        # Quadrant bits as in MicroPython: Q1 top right, then counter clockwise
+        for bit, qx, qy in ((1, x, -y), (2, -x, -y), (4, -x, y), (8, x, y)):
+            if m & bit:
+                if f:
+                    self.fill_rect(min(cx, cx + qx), cy + qy, abs(qx) + 1, 1, c)
+                else:
+                    self._set(cx + qx, cy + qy, c)
+
+    def ellipse(self, cx, cy, xr, yr, c, f=False, m=0xF):
+        if xr == 0 and yr == 0:
+            self._set(cx, cy, c)
+            return
+        # Midpoint ellipse
+        x, y = 0, yr
+        a2, b2 = xr * xr, yr * yr
+        d = b2 - a2 * yr + a2 // 4
+        while b2 * x <= a2 * y:
+            self._quadrants(cx, cy, x, y, c, f, m)
+            if d < 0:
+                d += b2 * (2 * x + 3)
+            else:
+                d += b2 * (2 * x + 3) + a2 * (2 - 2 * y)
+                y -= 1
+            x += 1
+        x, y = xr, 0
+        d = a2 - b2 * xr + b2 // 4
+        while a2 * y <= b2 * x:
+            self._quadrants(cx, cy, x, y, c, f, m)
+            if d < 0:
+                d += a2 * (2 * y + 3)
+            else:
+                d += a2 * (2 * y + 3) + b2 * (2 - 2 * x)
+                x -= 1
+            y += 1
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for sy in range(fbuf._height):
+            for sx in range(fbuf._width):
+                c = fbuf._get(sx, sy)
+                if palette is not None:
+                    c = palette._get(c, 0)
+                if c != key:
+                    self._set(x + sx, y + sy, c)
+
+    def scroll(self, xstep, ystep):
+        w, h = self._width, self._height
+        xs = range(w - 1, -1, -1) if xstep > 0 else range(w)
+        ys = range(h - 1, -1, -1) if ystep > 0 else range(h)
+        for yy in ys:
+            for xx in xs:
+                sx, sy = xx - xstep, yy - ystep
+                if 0 <= sx < w and 0 <= sy < h:
+                    self._set(xx, yy, self._get(sx, sy))
+
+    def text(self, s, x, y, c=1):
+        pass  # No built in 8x8 font on the host; nano-gui uses Writer fonts
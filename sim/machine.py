@@ -0,0 +1,143 @@
+# Host stand-in for MicroPython's machine module: just enough UART, I2C and Pin
+# for main.py to run against a replayed receiver stream.
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 1
+    IRQ_RISING = 2
+
+    levels = {}  # pin id -> level, set by the simulation (buttons default released)
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        if value is not None:
+            Pin.levels[id] = value
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if value is not None:
+            Pin.levels[self.id] = value
+
+    def value(self, v=None):
+        if v is None:
+            return Pin.levels.get(self.id, 1)
+        Pin.levels[self.id] = v
+
+    __call__ = value
+
+    def irq(self, handler=None, trigger=0):
+        pass
+
+
+class UART:
+    # Received bytes come from UART.source, anything with read(n) returning the
+    # bytes due by now (see sim/run.py). Written bytes are kept in .written.
+    source = None
+
+    def __init__(self, id, baudrate=9600, tx=None, rx=None, rxbuf=256, **kwargs):
+        self.id = id
+        self.baudrate = baudrate
+        self.written = bytearray()
+        self.bytes_read = 0
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def any(self):
+        return 1 if UART.source is not None and UART.source.pending() else 0
+
+    def read(self, nbytes=-1):
+        if UART.source is None:
+            return None
+        data = UART.source.read(nbytes)
+        self.bytes_read += len(data)
+        return data or None
+
+    def readinto(self, buf, nbytes=None):
+        data = self.read(len(buf) if nbytes is None else nbytes)
+        if not data:
+            return None
+        buf[: len(data)] = data
+        return len(data)
+
+    def readline(self):
+        return self.read(-1)
+
+    def write(self, buf):
+        self.written += buf
+        return len(buf)
+
+
+class I2C:
+    # Every address is a 256 byte register file, so register based devices
+    # (RV3028) read back what was written. Writes are counted for bus statistics.
+    memory = {}  # address -> bytearray(256), shared by all buses
+
+    def __init__(self, id=-1, scl=None, sda=None, freq=400000, timeout=50000):
+        self.freq = freq
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.transactions = 0
+
+    @classmethod
+    def registers(cls, addr):
+        if addr not in cls.memory:
+            cls.memory[addr] = bytearray(256)
+        return cls.memory[addr]
+
+    def scan(self):
+        return sorted(I2C.memory)
+
+    def writeto(self, addr, buf, stop=True):
+        self.transactions += 1
+        self.bytes_written += len(buf) + 1  # plus address byte
+        return 1
+
+    def writevto(self, addr, vector, stop=True):
+        self.transactions += 1
+        self.bytes_written += sum(len(b) for b in vector) + 1
+        return len(vector)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        self.transactions += 1
+        self.bytes_read += nbytes
+        return bytes(nbytes)
+
+    def readfrom_mem(self, addr, memaddr, nbytes, addrsize=8):
+        self.transactions += 1
+        self.bytes_written += 2
+        self.bytes_read += nbytes
+        mem = I2C.registers(addr)
+        return bytes(mem[memaddr : memaddr + nbytes])
+
+    def readfrom_mem_into(self, addr, memaddr, buf, addrsize=8):
+        buf[:] = self.readfrom_mem(addr, memaddr, len(buf))
+
+    def writeto_mem(self, addr, memaddr, buf, addrsize=8):
+        self.transactions += 1
+        self.bytes_written += len(buf) + 2
+        mem = I2C.registers(addr)
+        mem[memaddr : memaddr + len(buf)] = buf
+
+
+class SoftI2C(I2C):
+    pass
+
+
+def freq(hz=None):
+    return 240000000
+
+
+def reset():
+    raise SystemExit
+
+
+def idle():
+    pass
+
+
+def unique_id():
+    return b"\x00sim\x00\x00"
@@ -0,0 +1,69 @@
+# Host stand-in for MicroPython's micropython module.
+
+
+def const(expr):
+    return expr
+
+
+def native(f):
+    return f
+
+
+def viper(f):
+    return f
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+class RingIO:
+    # Byte ring buffer with the stream methods main.py uses. Like the real
+    # thing, writes that don't fit are truncated.
+    def __init__(self, size):
+        self._buf = bytearray(size + 1)
+        self._size = size + 1
+        self._get = 0
+        self._put = 0
+
+    def any(self):
+        return (self._put - self._get) % self._size
+
+    def write(self, buf):
+        n = 0
+        for b in bytes(buf):
+            nxt = (self._put + 1) % self._size
+            if nxt == self._get:
+                break
+            self._buf[self._put] = b
+            self._put = nxt
+            n += 1
+        return n
+
+    def read(self, nbytes=-1):
+        avail = self.any()
+        if nbytes < 0 or nbytes > avail:
+            nbytes = avail
+        out = bytearray(nbytes)
+        self._copy(out, nbytes)
+        return bytes(out)
+
+    def readinto(self, buf, nbytes=None):
+        n = min(len(buf) if nbytes is None else nbytes, self.any())
+        self._copy(buf, n)
+        return n
+
+    def readline(self, nbytes=-1):
+        out = bytearray()
+        while self.any() and (nbytes < 0 or len(out) < nbytes):
+            b = self._buf[self._get]
+            self._get = (self._get + 1) % self._size
+            out.append(b)
+            if b == 0x0A:
+                break
+        return bytes(out)
+
+    def _copy(self, out, n):
+        for i in range(n):
+            out[i] = self._buf[self._get]
+            self._get = (self._get + 1) % self._size
@@ -0,0 +1,30 @@
+# Host stand-in for MicroPython's network module. There is no access point in
+# the simulation, so connecting fails the same way it does out of Wi-Fi range.
+
+STA_IF = 0
+AP_IF = 1
+
+
+class WLAN:
+    IF_STA = STA_IF
+    IF_AP = AP_IF
+
+    def __init__(self, interface=STA_IF):
+        self._active = False
+
+    def active(self, state=None):
+        if state is not None:
+            self._active = state
+        return self._active
+
+    def connect(self, ssid=None, key=None):
+        raise OSError("No access point in the simulation")
+
+    def isconnected(self):
+        return False
+
+    def disconnect(self):
+        pass
+
+    def ifconfig(self):
+        return ("0.0.0.0", "0.0.0.0", "0.0.0.0", "0.0.0.0")
@@ -0,0 +1,11 @@
+# Host stand-in for MicroPython's ntptime module.
+
+host = "pool.ntp.org"
+
+
+def time():
+    raise OSError("No network in the simulation")
+
+
+def settime():
+    raise OSError("No network in the simulation")
@@ -0,0 +1,5 @@
+# Host stand-in for micropython-lib requests (imported but unused by assistnow).
+
+
+def get(url, **kwargs):
+    raise OSError("No network in the simulation")
@@ -0,0 +1,235 @@
+# Run main.py's real tasks (uart_reader, gps_updater, refresh_display, caching,
+# ...) under CPython's asyncio, with the stand-in modules in this directory in
+# place of machine, framebuf, uasyncio, micropython and friends. The UART is
+# fed from a recorded receiver stream (raw NMEA/UBX bytes) or a synthetic drive.
+#
+#   python sim/run.py capture.ubx            # replay in real time
+#   python sim/run.py --synth 30 --speed 0   # synthetic drive, as fast as possible
+#   python sim/run.py --synth 30 --page 2 --screen
+
+import argparse
+import asyncio
+import bisect
+import os
+import sys
+import tempfile
+import time
+
+SIM_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(SIM_DIR)
+
+# Stand-ins first so they shadow anything installed on the host (e.g. requests)
+sys.path[:0] = [SIM_DIR, REPO_DIR]
+
+import machine  # noqa: E402
+import synth  # noqa: E402
+
+
+class ReplaySource:
+    """Recorded bytes released to the UART as the line would deliver them.
+    speed 1 is real time at the baud rate, 10 ten times faster, 0 no pacing."""
+
+    def __init__(self, data, baudrate=115200, speed=1.0):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.rate = baudrate / 10 * speed  # bytes per second, 8N1
+        self.start = None
+
+    def _due(self):
+        if self.start is None:
+            self.start = time.monotonic()
+        if not self.rate:
+            return len(self.data)
+        return min(len(self.data), int((time.monotonic() - self.start) * self.rate))
+
+    def pending(self):
+        return self._due() - self.pos
+
+    def read(self, nbytes=-1):
+        end = self._due()
+        if nbytes >= 0:
+            end = min(end, self.pos + nbytes)
+        data = bytes(self.data[self.pos : end])
+        self.pos = end
+        return data
+
+    def done(self):
+        return self.pos >= len(self.data)
+
+
+class CaptureSource(ReplaySource):
+    """A capture.py recording, released with its recorded timing. speed as for ReplaySource"""
+
+    def __init__(self, path, speed=1.0):
+        import capture
+
+        data, marks = capture.timeline(path)
+        super().__init__(data, speed=speed)
+        self.speed = speed
+        self.times = [ms / 1000 for ms, _ in marks]
+        self.ends = [end for _, end in marks]
+
+    def _due(self):
+        if self.start is None:
+            self.start = time.monotonic()
+        if not self.speed:
+            return len(self.data)
+        i = bisect.bisect_right(self.times, (time.monotonic() - self.start) * self.speed)
+        return self.ends[i - 1] if i else 0
+
+
+def fallback_fonts():
+    # pages.py uses mono32bold, which lives on the board but isn't in the repo
+    try:
+        import gui.fonts.mono32bold  # noqa: F401
+    except ImportError:
+        import gui.fonts.mono16bold as font
+
+        print("sim: gui.fonts.mono32bold not found, using mono16bold")
+        sys.modules["gui.fonts.mono32bold"] = font
+
+
+def seed_devices(workdir):
+    # RV3028: ID register reads back as a digit, UNIX time counter from the host clock
+    rtc = machine.I2C.registers(0x52)
+    rtc[0x28] = 0x30
+    rtc[0x1B:0x1F] = int(time.time()).to_bytes(4, "little")
+
+    # Last known coordinates read by ubx_mga_ini_pos() at boot
+    lkc = os.path.join(workdir, "lkc")
+    if not os.path.exists(lkc):
+        with open(lkc, "w") as f:
+            f.write("%d\n%d\n%f\n" % (round(synth.START_LAT * 1e7), round(synth.START_LON * 1e7), 31.0))
+
+
+def screen(ssd):
+    """The display contents as text, one character per pixel"""
+    rows = []
+    for y in range(ssd.height):
+        rows.append(
+            "".join("#" if ssd.buffer[(y >> 3) * ssd.width + x] & (1 << (y & 7)) else "." for x in range(ssd.width))
+        )
+    return "\n".join(rows)
+
+
+def load_app(stats=False):
+    """Import main.py with its GPS and demux classes wrapped so the run can report on them"""
+    fallback_fonts()
+    import main as app
+
+    created = {"stats": stats}
+
+    class GPS(app.MicropyGPS):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created["gps"] = self
+            if created.get("stats"):
+                self.enable_stats()
+
+    class Demux(app.StreamDemux):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created["demux"] = self
+
+    app.MicropyGPS = GPS
+    app.StreamDemux = Demux
+    return app, created
+
+
+async def simulate(app, source, linger):
+    frames = [0]
+    show_async = app.ssd.show_async
+
+    async def counted_show(*args, **kwargs):
+        frames[0] += 1
+        await show_async(*args, **kwargs)
+
+    app.ssd.show_async = counted_show
+
+    asyncio.create_task(app.main())
+    while not source.done():
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(linger)  # let the parser and display catch up
+    return frames[0]
+
+
+def report(app, created, source, frames, elapsed):
+    import color_setup
+
+    gps = created.get("gps")
+    demux = created.get("demux")
+    i2c = color_setup.i2c
+    print("--- simulation ---")
+    print("replayed %d bytes in %.2f s" % (source.pos, elapsed))
+    if demux is not None:
+        print(
+            "demux: %d NMEA, %d UBX (%d unhandled), %d CRC fails, %d resyncs, %d bytes dropped"
+            % (demux.nmea_count, demux.ubx_count, demux.unhandled_ubx, demux.crc_fails, demux.resyncs, demux.dropped)
+        )
+    if gps is not None:
+        print(
+            "gps: %d clean, %d parsed, %d filtered, %d CRC fails, %d epochs"
+            % (gps.clean_sentences, gps.parsed_sentences, gps.filtered_sentences, gps.crc_fails, gps.epoch_count)
+        )
+        print("fix: %s %s, %s" % (gps.latitude_string(), gps.longitude_string(), gps.speed_string()))
+        stats = gps.stats()
+        if stats:
+            print("%-8s %8s %8s %8s %8s %8s %10s %10s" % ("type", "received", "parsed", "rejected", "crc", "filtered", "us/parse", "interval"))
+            for name in sorted(stats):
+                st = stats[name]
+                print(
+                    "%-8s %8d %8d %8d %8d %8d %10.1f %8.0fms"
+                    % (name, st["received"], st["parsed"], st["rejected"], st["crc_fails"], st["filtered"],
+                       st["mean_parse_us"], st["mean_interval"])
+                )
+    print("display: %d frames, %d I2C bytes, %d transactions" % (frames, i2c.bytes_written, i2c.transactions))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the speedometer pipeline on the host")
+    parser.add_argument("capture", nargs="?", help="raw receiver byte stream or capture.py recording to replay")
+    parser.add_argument("--synth", type=float, metavar="SECONDS", help="replay a synthetic drive instead")
+    parser.add_argument("--pvt", action="store_true", help="include UBX-NAV-PVT in the synthetic drive")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed, 0 for as fast as possible")
+    parser.add_argument("--page", type=int, default=0, help="display page to show (0-2)")
+    parser.add_argument("--linger", type=float, default=1.5, help="seconds to keep running after the replay")
+    parser.add_argument("--workdir", help="directory standing in for the board's flash (default: temporary)")
+    parser.add_argument("--screen", action="store_true", help="print the final display contents")
+    parser.add_argument("--stats", action="store_true", help="count and time every sentence type")
+    args = parser.parse_args()
+
+    capture_file = None
+    if args.capture:
+        with open(args.capture, "rb") as f:
+            data = f.read()
+        if data.startswith(b"UCAP"):
+            capture_file = os.path.abspath(args.capture)
+    elif args.synth:
+        data = synth.generate(args.synth, pvt=args.pvt)
+    else:
+        parser.error("give a capture file or --synth SECONDS")
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="speedo-")
+    os.chdir(workdir)
+    seed_devices(workdir)
+
+    app, created = load_app(args.stats)
+    app.mode = args.page
+    app.change_page = True
+
+    if capture_file:  # recorded on the board by capture.Recorder, keeps its own timing
+        source = CaptureSource(capture_file, speed=args.speed)
+    else:
+        source = ReplaySource(data, speed=args.speed)
+    machine.UART.source = source
+
+    start = time.monotonic()
+    frames = asyncio.run(simulate(app, source, args.linger))
+    report(app, created, source, frames, time.monotonic() - start)
+
+    if args.screen:
+        print(screen(app.ssd))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# Synthetic u-blox receiver output for the host simulation and benchmarks: a
+# short drive out of Melbourne as NMEA (RMC, VTG, GGA, GSA, GSV, GLL, GST per
+# epoch, in receiver order) with optional UBX-NAV-PVT frames and line noise.
+#
+#   python sim/synth.py drive.ubx --seconds 120 --rate 1 --pvt --noise 1e-4
+
+import math
+import random
+import struct
+import sys
+
+START_LAT = -37.8136
+START_LON = 144.9631
+START_UTC = (2026, 10, 18, 3, 0, 0)  # y, m, d, h, m, s
+
+# prn, elevation, azimuth, snr
+SATELLITES = (
+    (2, 62, 37, 44), (5, 17, 101, 31), (7, 41, 263, 39), (9, 73, 170, 46),
+    (13, 8, 330, 22), (16, 29, 205, 35), (20, 55, 88, 42), (26, 12, 15, 0),
+    (27, 36, 300, 38), (30, 4, 140, 0),
+)
+
+
+def nmea(body):
+    crc = 0
+    for ch in body.encode():
+        crc ^= ch
+    return ("$%s*%02X\r\n" % (body, crc)).encode()
+
+
+def ubx(cls, msg_id, payload):
+    frame = bytearray(b"\xb5\x62") + bytes((cls, msg_id)) + struct.pack("<H", len(payload)) + payload
+    ck_a = ck_b = 0
+    for b in frame[2:]:
+        ck_a = (ck_a + b) & 0xFF
+        ck_b = (ck_b + ck_a) & 0xFF
+    return bytes(frame + bytes((ck_a, ck_b)))
+
+
+def _ddm(value, degree_digits, hemis):
+    hemi = hemis[0] if value >= 0 else hemis[1]
+    value = abs(value)
+    degrees = int(value)
+    minutes = (value - degrees) * 60
+    return "%0*d%08.5f" % (degree_digits, degrees, minutes), hemi
+
+
+def epoch(t, lat, lon, alt, kph, course, pvt=False):
+    """Receiver output for one epoch at t seconds after START_UTC"""
+    y, mo, d, h, mi, s = START_UTC
+    total = ((h * 60 + mi) * 60 + s) + t
+    hh, rem = divmod(int(total), 3600)
+    mm, ss = divmod(rem, 60)
+    frac = round((total - int(total)) * 100)
+    utc = "%02d%02d%02d.%02d" % (hh % 24, mm, ss, frac)
+    date = "%02d%02d%02d" % (d, mo, y % 100)
+    lat_s, ns = _ddm(lat, 2, "NS")
+    lon_s, ew = _ddm(lon, 3, "EW")
+    knots = kph / 1.852
+    used = [sv for sv in SATELLITES if sv[3]]
+
+    out = [
+        nmea("GNRMC,%s,A,%s,%s,%s,%s,%.3f,%.2f,%s,,,A,V" % (utc, lat_s, ns, lon_s, ew, knots, course, date)),
+        nmea("GNVTG,%.2f,T,,M,%.3f,N,%.3f,K,A" % (course, knots, kph)),
+        nmea("GNGGA,%s,%s,%s,%s,%s,1,%02d,0.92,%.1f,M,4.6,M,," % (utc, lat_s, ns, lon_s, ew, len(used), alt)),
+        nmea("GNGSA,A,3,%s,1.64,0.92,1.36,1" % ",".join(["%02d" % sv[0] for sv in used] + [""] * (12 - len(used)))),
+    ]
+    groups = [SATELLITES[i : i + 4] for i in range(0, len(SATELLITES), 4)]
+    for n, group in enumerate(groups):
+        sats = ",".join(
+            "%02d,%02d,%03d,%s" % (prn, el, az, "%02d" % snr if snr else "") for prn, el, az, snr in group
+        )
+        out.append(nmea("GPGSV,%d,%d,%02d,%s,1" % (len(groups), n + 1, len(SATELLITES), sats)))
+    out.append(nmea("GNGLL,%s,%s,%s,%s,%s,A,A" % (lat_s, ns, lon_s, ew, utc)))
+    out.append(nmea("GNGST,%s,11,1.8,1.2,87,1.6,1.4,2.9" % utc))
+
+    if pvt:
+        payload = struct.pack(
+            "<IHBBBBBBIiBBBBiiiiIIiiiiiIIHH4xihH",
+            int(total * 1000) % 604800000, y, mo, d, hh % 24, mm, ss, 0x37, 30, frac * 10000000,
+            3, 0x01, 0xEA, len(used),
+            round(lon * 1e7), round(lat * 1e7), round((alt + 4.6) * 1000), round(alt * 1000), 1500, 2900,
+            round(kph / 3.6 * math.cos(math.radians(course)) * 1000),
+            round(kph / 3.6 * math.sin(math.radians(course)) * 1000), 0,
+            round(kph / 3.6 * 1000), round(course * 1e5), 250, 80000, 164, 0, 0, 0, 0,
+        )
+        out.append(ubx(0x01, 0x07, payload))
+
+    return b"".join(out)
+
+
+def generate(seconds=60, rate=1, pvt=False, noise=0.0, seed=1):
+    """Bytes for a drive of the given length: accelerate to 60 km/h, cruise and turn gently"""
+    rnd = random.Random(seed)
+    lat, lon, alt = START_LAT, START_LON, 31.0
+    course = 45.0
+    data = bytearray()
+    dt = 1 / rate
+    for n in range(int(seconds * rate)):
+        t = n * dt
+        kph = min(60.0, t * 3.0)
+        course = (course + 0.5 * dt) % 360
+        dist = kph / 3.6 * dt
+        lat += dist * math.cos(math.radians(course)) / 111320
+        lon += dist * math.sin(math.radians(course)) / (111320 * math.cos(math.radians(lat)))
+        data += epoch(t, lat, lon, alt, kph, course, pvt)
+
+    if noise:
+        for i in range(len(data)):
+            if rnd.random() < noise:
+                data[i] = rnd.randrange(256)
+
+    return bytes(data)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write a synthetic receiver stream")
+    parser.add_argument("output")
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--rate", type=float, default=1, help="navigation rate in Hz")
+    parser.add_argument("--pvt", action="store_true", help="add a UBX-NAV-PVT frame per epoch")
+    parser.add_argument("--noise", type=float, default=0.0, help="probability of corrupting each byte")
+    args = parser.parse_args()
+
+    with open(args.output, "wb") as f:
+        f.write(generate(args.seconds, args.rate, args.pvt, args.noise))
+    sys.exit(0)
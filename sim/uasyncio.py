@@ -0,0 +1,62 @@
+# Host stand-in for MicroPython's uasyncio, on top of CPython's asyncio.
+
+import asyncio as _asyncio
+from asyncio import *  # noqa: F401,F403
+
+
+async def sleep_ms(ms):
+    await _asyncio.sleep(ms / 1000)
+
+
+async def wait_for_ms(aw, ms):
+    return await _asyncio.wait_for(aw, ms / 1000)
+
+
+class ThreadSafeFlag:
+    def __init__(self):
+        self._event = _asyncio.Event()
+
+    def set(self):
+        self._event.set()
+
+    def clear(self):
+        self._event.clear()
+
+    async def wait(self):
+        await self._event.wait()
+        self._event.clear()
+
+
+class StreamReader:
+    # Polls a non-blocking stream (read/readinto return None or b"" when idle)
+    POLL_MS = 1
+
+    def __init__(self, stream):
+        self.s = stream
+
+    async def readinto(self, buf):
+        while True:
+            n = self.s.readinto(buf)
+            if n:
+                return n
+            await sleep_ms(self.POLL_MS)
+
+    async def read(self, n=-1):
+        while True:
+            data = self.s.read(n)
+            if data:
+                return data
+            await sleep_ms(self.POLL_MS)
+
+    async def readline(self):
+        line = b""
+        while not line.endswith(b"\n"):
+            data = self.s.read(1)
+            if data:
+                line += data
+            else:
+                await sleep_ms(self.POLL_MS)
+        return line
+
+
+StreamWriter = StreamReader
@@ -0,0 +1,10 @@
+# Host stand-in for MicroPython's uctypes module. Raw memory access has no
+# host equivalent; only the names are needed for imports to succeed.
+
+
+def addressof(obj):
+    raise NotImplementedError("uctypes.addressof is not available on the host")
+
+
+def bytearray_at(addr, size):
+    raise NotImplementedError("uctypes.bytearray_at is not available on the host")
@@ -0,0 +1,59 @@
+# Host stand-in for MicroPython's utime module. Time tuples are 8 long and
+# mktime()/localtime() work in UTC, as they do on the board.
+
+import calendar
+import time as _time
+
+_start = _time.monotonic_ns()
+
+
+def ticks_ms():
+    return (_time.monotonic_ns() - _start) // 1000000
+
+
+def ticks_us():
+    return (_time.monotonic_ns() - _start) // 1000
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_diff(ticks1, ticks2):
+    return ticks1 - ticks2
+
+
+def ticks_add(ticks, delta):
+    return ticks + delta
+
+
+def sleep(seconds):
+    _time.sleep(seconds)
+
+
+def sleep_ms(ms):
+    _time.sleep(ms / 1000)
+
+
+def sleep_us(us):
+    _time.sleep(us / 1000000)
+
+
+def time():
+    return int(_time.time())
+
+
+def time_ns():
+    return _time.time_ns()
+
+
+def mktime(t):
+    return calendar.timegm(tuple(t[:6]) + (0, 0, 0))
+
+
+def gmtime(secs=None):
+    t = _time.gmtime(time() if secs is None else secs)
+    return (t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec, t.tm_wday, t.tm_yday)
+
+
+localtime = gmtime
@@ -0,0 +1,64 @@
+# Host test for the satellites in view bookkeeping in micropyGPS, run from the
+# repository root with `python -m pytest tests`.
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "sim"), ROOT]
+
+from micropyGPS import MicropyGPS, SatelliteTable  # noqa: E402
+from synth import nmea  # noqa: E402
+
+
+def epoch(second, glonass=True):
+    """One epoch: RMC, 3 GPS satellites in view and, optionally, 2 GLONASS ones"""
+    out = nmea("GPRMC,1200%02d.00,A,3748.8000,S,14457.8000,E,10.0,45.0,181026,,,A" % second)
+    out += nmea("GPGSV,1,1,03,05,40,120,35,12,60,200,40,25,20,300,30")
+    if glonass:
+        out += nmea("GLGSV,1,1,02,65,30,100,33,70,50,250,38")
+    return out
+
+
+def feed(gps, data):
+    for pos in range(len(data)):
+        gps.update(chr(data[pos]))
+
+
+def test_dropped_talker_ages_out():
+    gps = MicropyGPS()
+    sats = gps.satellites
+    glonass = SatelliteTable.slot(SatelliteTable.GLONASS, 1)
+
+    for second in range(4):
+        feed(gps, epoch(second))
+    assert gps.satellites_in_view == 5
+    assert sats.in_view[SatelliteTable.GLONASS] == 2
+
+    # GLONASS stops reporting: its count and slots age out together after max_age epochs
+    for second in range(4, 4 + sats.max_age + 2):
+        feed(gps, epoch(second, glonass=False))
+
+    assert sats.in_view[SatelliteTable.GLONASS] == 0
+    assert not sats.visible(glonass)
+    assert gps.satellites_in_view == 3
+    assert gps.snapshot.satellites_in_view == 3
+    assert gps.snapshot.satellites.in_view[SatelliteTable.GPS] == 3
+
+
+def test_out_of_range_fields_are_not_reported():
+    gps = MicropyGPS()
+    sats = gps.satellites
+
+    # CRC valid, but elevation, azimuth and SNR do not fit the table's arrays
+    assert gps.update_sentence(nmea("GPGSV,1,1,02,05,200,120,35,12,-95,400,150")) == "GPGSV"
+    first = SatelliteTable.slot(SatelliteTable.GPS, 5)
+    second = SatelliteTable.slot(SatelliteTable.GPS, 12)
+    assert sats.elevation[first] == sats.NO_DATA
+    assert sats.azimuth[first] == 120
+    assert sats.snr[first] == 35
+    assert sats.elevation[second] == sats.NO_DATA
+    assert sats.azimuth[second] == sats.NO_DATA
+    assert sats.snr[second] == sats.NO_DATA
+
+    assert gps.update_sentence(nmea("GPGSV,1,1,-3,05,40,120,35")) is None
@@ -0,0 +1,167 @@
+# Time zones from a small rules table. Each zone is a standard offset plus an
+# optional daylight saving rule, in the style of a POSIX TZ string. The two
+# transitions of a year are worked out once, in UTC, so converting a time is a
+# comparison and an addition. Only integer date arithmetic is used (no mktime),
+# so the results are the same on MicroPython and on the host whatever epoch the
+# port uses. Times are seconds since 2000-01-01 00:00 UTC.
+
+# Daylight saving rule: (month, week, weekday, minutes). week 1-4 is the nth
+# weekday of the month, 5 the last; weekday 0 is Monday; minutes is the local
+# wall clock time of the change (standard time when it starts, daylight time
+# when it ends).
+_FIRST_SUN_APR_3 = (4, 1, 6, 180)
+_FIRST_SUN_OCT_2 = (10, 1, 6, 120)
+_LAST_SUN_MAR_1 = (3, 5, 6, 60)
+_LAST_SUN_OCT_2 = (10, 5, 6, 120)
+_LAST_SUN_OCT_3 = (10, 5, 6, 180)
+_LAST_SUN_MAR_2 = (3, 5, 6, 120)
+_LAST_SUN_MAR_3 = (3, 5, 6, 180)
+_LAST_SUN_SEP_2 = (9, 5, 6, 120)
+_SECOND_SUN_MAR_2 = (3, 2, 6, 120)
+_FIRST_SUN_NOV_2 = (11, 1, 6, 120)
+
+# name: (standard offset minutes, daylight saving minutes, start rule, end rule)
+ZONES = {
+    "UTC": (0, 0, None, None),
+    "Australia/Melbourne": (600, 60, _FIRST_SUN_OCT_2, _FIRST_SUN_APR_3),
+    "Australia/Sydney": (600, 60, _FIRST_SUN_OCT_2, _FIRST_SUN_APR_3),
+    "Australia/Hobart": (600, 60, _FIRST_SUN_OCT_2, _FIRST_SUN_APR_3),
+    "Australia/Adelaide": (570, 60, _FIRST_SUN_OCT_2, _FIRST_SUN_APR_3),
+    "Australia/Brisbane": (600, 0, None, None),
+    "Australia/Darwin": (570, 0, None, None),
+    "Australia/Perth": (480, 0, None, None),
+    "Pacific/Auckland": (720, 60, _LAST_SUN_SEP_2, _FIRST_SUN_APR_3),
+    "Europe/London": (0, 60, _LAST_SUN_MAR_1, _LAST_SUN_OCT_2),
+    "Europe/Berlin": (60, 60, _LAST_SUN_MAR_2, _LAST_SUN_OCT_3),
+    "America/New_York": (-300, 60, _SECOND_SUN_MAR_2, _FIRST_SUN_NOV_2),
+    "America/Chicago": (-360, 60, _SECOND_SUN_MAR_2, _FIRST_SUN_NOV_2),
+    "America/Denver": (-420, 60, _SECOND_SUN_MAR_2, _FIRST_SUN_NOV_2),
+    "America/Los_Angeles": (-480, 60, _SECOND_SUN_MAR_2, _FIRST_SUN_NOV_2),
+}
+
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def _leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _days_in_month(year, month):
+    if month == 2:
+        return 29 if _leap(year) else 28
+    return 30 if month in (4, 6, 9, 11) else 31
+
+
+def days_since_2000(year, month, day):
+    """Days from 2000-01-01 to the given date"""
+    y = year - 1
+    days = (year - 2000) * 365 + (y // 4 - 499) - (y // 100 - 19) + (y // 400 - 4)
+    days += _DAYS_BEFORE_MONTH[month - 1] + day - 1
+    if month > 2 and _leap(year):
+        days += 1
+    return days
+
+
+def seconds_since_2000(year, month, day, hours=0, minutes=0, seconds=0):
+    return days_since_2000(year, month, day) * 86400 + hours * 3600 + minutes * 60 + seconds
+
+
+def time_tuple(secs):
+    """(year, month, mday, hour, minute, second, weekday, yearday) for seconds since 2000, like utime.localtime()"""
+    days, secs = divmod(secs, 86400)
+    weekday = (days + 5) % 7  # 2000-01-01 was a Saturday
+
+    year = 2000 + days // 365
+    while days_since_2000(year, 1, 1) > days:
+        year -= 1
+    yearday = days - days_since_2000(year, 1, 1) + 1
+
+    month = 1
+    mday = yearday
+    while mday > _days_in_month(year, month):
+        mday -= _days_in_month(year, month)
+        month += 1
+
+    return (year, month, mday, secs // 3600, secs // 60 % 60, secs % 60, weekday, yearday)
+
+
+def _rule_day(year, rule):
+    # Day of the month the rule falls on in year
+    month, week, weekday = rule[0], rule[1], rule[2]
+    first = (days_since_2000(year, month, 1) + 5) % 7  # weekday of the 1st
+    day = 1 + (weekday - first) % 7 + (week - 1) * 7
+    while day > _days_in_month(year, month):
+        day -= 7
+    return day
+
+
+class TimeZone(object):
+    """A zone from ZONES by name, or a fixed offset from UTC in hours. to_local() converts UTC seconds since 2000,
+    working out the daylight saving transitions once for each year it is used in"""
+
+    def __init__(self, zone="UTC"):
+        if isinstance(zone, str):
+            self.name = zone
+            zone = ZONES[zone]
+        else:  # hours east of UTC
+            self.name = "UTC%+g" % zone
+            zone = (int(zone * 60), 0, None, None)
+        self.std_offset = zone[0] * 60
+        self.dst_offset = zone[1] * 60
+        self._start_rule = zone[2]
+        self._end_rule = zone[3]
+
+        # The year currently loaded: [_year_start, _year_end) in UTC, and the offsets before _change1, between
+        # _change1 and _change2, and after _change2
+        self._year_start = 0
+        self._year_end = 0
+        self._change1 = 0
+        self._change2 = 0
+        self._offsets = (self.std_offset, self.std_offset, self.std_offset)
+
+    def transitions(self, year):
+        """UTC seconds since 2000 at which daylight saving starts and ends in year, None without daylight saving"""
+        if self._start_rule is None:
+            return None
+        rule = self._start_rule
+        start = seconds_since_2000(year, rule[0], _rule_day(year, rule)) + rule[3] * 60 - self.std_offset
+        rule = self._end_rule
+        end = seconds_since_2000(year, rule[0], _rule_day(year, rule)) + rule[3] * 60 - self.std_offset
+        return start, end - self.dst_offset
+
+    def _load(self, utc):
+        year = time_tuple(utc)[0]
+        self._year_start = seconds_since_2000(year, 1, 1)
+        self._year_end = seconds_since_2000(year + 1, 1, 1)
+        std = self.std_offset
+        dst = std + self.dst_offset
+        changes = self.transitions(year)
+        if changes is None:
+            self._change1 = self._change2 = self._year_end
+            self._offsets = (std, std, std)
+        elif changes[0] < changes[1]:  # Northern hemisphere, daylight saving mid year
+            self._change1, self._change2 = changes
+            self._offsets = (std, dst, std)
+        else:  # Southern hemisphere, daylight saving over the new year
+            self._change2, self._change1 = changes
+            self._offsets = (dst, std, dst)
+
+    def offset(self, utc):
+        """Seconds to add to UTC seconds since 2000 for local time"""
+        if not self._year_start <= utc < self._year_end:
+            self._load(utc)
+        if utc < self._change1:
+            return self._offsets[0]
+        if utc < self._change2:
+            return self._offsets[1]
+        return self._offsets[2]
+
+    def to_local(self, utc):
+        """Local seconds since 2000 for UTC seconds since 2000"""
+        return utc + self.offset(utc)
+
+    def is_dst(self, utc):
+        return self.offset(utc) != self.std_offset
+
+
+UTC = TimeZone()
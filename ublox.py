@@ -1,16 +1,14 @@
 # Send configuration messages to the gps module.
 # These messages update the config in the flash layer so the module needs a restart before
-# any changes are applied
+# any changes are applied. Run it as a script to send them; importing it just gives the messages.
 
 from machine import UART
 from utime import sleep
 
-# Initialize UART
-uart = UART(2, baudrate=115200, tx=6, rx=7, rxbuf=10000)  # Use a non-default UART
-
 set_baud = bytes.fromhex('b5 62 06 8a 0c 00 00 04 00 00 01 00 52 40 00 c2 01 00 f6 c6') # sets baud to 115200 in flash
 set_gst = bytes.fromhex('b5 62 06 8a 09 00 00 04 00 00 d4 00 91 20 01 23 61') # get pseudorange error stats from ublox
 set_dyn = bytes.fromhex('b5 62 06 8a 09 00 00 04 00 00 21 00 11 20 04 f3 65') # set dynamic model to automobile (4)
+set_pvt = bytes.fromhex('b5 62 06 8a 09 00 00 04 00 00 07 00 91 20 01 56 60') # output UBX-NAV-PVT on UART1 every epoch
 
 # Set AssistNow autonomous to true
 CFG_ANA_USE_ANA = b"\xb5\x62\x06\x8a\x09\x00\x00\x04\x00\x00\x01\x00\x23\x10\x01\xd2\xd8"
@@ -23,6 +21,8 @@ CFG_RAM_ACKAIDING = b"\xb5\x62\x06\x8a\x09\x00\x00\x01\x00\x00\x25\x00\x11\x10\x
 # Poll UBX-NAV-STATUS from the receiver
 CMD_POLL_NAV_STATUS = b"\xb5\x62\x01\x03\x00\x00\x04\x0d"
 
-uart.write(CFG_ANA_USE_ANA)
-
+if __name__ == "__main__":
+    # Initialize UART
+    uart = UART(2, baudrate=115200, tx=6, rx=7, rxbuf=10000)  # Use a non-default UART
 
+    uart.write(CFG_ANA_USE_ANA)